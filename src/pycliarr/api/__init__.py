@@ -1,3 +1,4 @@
-from .exceptions import CliArrError, CliDecodeError, CliServerError, RadarrCliError, SonarrCliError
+from .exceptions import CliArrError, CliConnectionError, CliDecodeError, CliServerError, RadarrCliError, SonarrCliError
+from .models import RadarrMovieModel, SonarrSerieModel
 from .radarr import RadarrCli, RadarrMovieItem
 from .sonarr import SonarrCli, SonarrSerieItem
@@ -1,19 +1,67 @@
+import codecs
+import hashlib
 import json
 import logging
+import marshal
+import pickle
 import platform
+import re
+import sys
+from copy import copy, deepcopy
 from pathlib import Path
 from pprint import pformat
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import IO, Any, ClassVar, Dict, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union, cast
 
 import requests  # type: ignore
 
-from pycliarr.api.exceptions import CliArrError, CliDecodeError, CliServerError
+from pycliarr.api.exceptions import CliArrError, CliConnectionError, CliDecodeError, CliServerError
 
 log = logging.getLogger(__name__)
+# Marker for fields not set on an item
+_MISSING = object()
+
+
+# Marshal format used to serialize values to hash. Version 2 does not use references to objects already written,
+# which depend on the objects being shared and would make hashes of equal values differ.
+MARSHAL_VERSION = 2
+
+
+def value_digest(value: Any, digest_size: int = 16) -> bytes:
+    """Return a blake2b digest of a value, serialized with marshal, or pickle for types marshal doesn't support."""
+    try:
+        data = marshal.dumps(value, MARSHAL_VERSION)
+    except ValueError:
+        data = pickle.dumps(value, protocol=4)
+    return hashlib.blake2b(data, digest_size=digest_size).digest()
+
+
+class _Fingerprint:
+    """Digest of a mutable field read from an item, to detect in place changes without copying its value."""
+
+    __slots__ = ("digest",)
+
+    def __init__(self, value: Any) -> None:
+        self.digest = value_digest(value)
+
+    def matches(self, value: Any) -> bool:
+        return value_digest(value) == self.digest
+
+    def __repr__(self) -> str:
+        return f"<fingerprint {self.digest.hex()}>"
+
+
 json_dict = Dict[str, Any]
 json_list = List[json_dict]
 json_data = Union[json_dict, json_list]
 BaseItemClass = TypeVar("BaseItemClass", bound="BaseCliApiItem")
+# Json document, as text, bytes, or a file object
+json_source = Union[str, bytes, IO[Any]]
+
+# Size of the chunks read from files when parsing json incrementally
+JSON_CHUNK_SIZE = 65536
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Encoder shared by the streaming writers, same output as json.dumps()
+_JSON_ENCODER = json.JSONEncoder()
 
 
 class BaseCliApi:
@@ -79,7 +127,7 @@ class BaseCliApi:
             res = self._session.request(method, request_url, params=url_params, json=json_data)
             # log.debug("Result %s, Body %s", res.status_code, res.content)
         except Exception as e:
-            raise CliArrError(f"Error sending request {request_url}: {e}")
+            raise CliConnectionError(f"Error sending request {request_url}: {e}")
         if res.status_code >= 400:
             raise CliServerError(
                 f"Error from server {request_url}, status: {res.status_code}, msg: {pformat(res.content.decode())}",
@@ -111,9 +159,14 @@ class BaseCliApi:
         """Shortcut for request withe method=put."""
         return self.request("PUT", path, json_data=json_data, url_params=url_params)
 
-    def request_delete(self, path: str, url_params: Optional[Dict[str, Any]] = None) -> json_data:
+    def request_delete(
+        self,
+        path: str,
+        url_params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[json_data] = None,
+    ) -> json_data:
         """Shortcut for request withe method=delete."""
-        return self.request("DELETE", path, url_params=url_params)
+        return self.request("DELETE", path, url_params=url_params, json_data=json_data)
 
     def close(self) -> None:
         """Close session with the endpoint."""
@@ -126,49 +179,406 @@ class BaseCliApi:
         return Path(basename)
 
 
+def load_json(source: json_source) -> Any:
+    """Parse a json document from text, bytes or a file object."""
+    try:
+        if isinstance(source, (str, bytes, bytearray)):
+            return json.loads(source)
+        return json.load(source)
+    except ValueError as e:
+        raise CliDecodeError(f"Error parsing json: {e}")
+
+
+def _read_chunks(source: json_source, chunk_size: int) -> Iterator[str]:
+    """Read text chunks from text, bytes or a file object."""
+    if isinstance(source, (bytes, bytearray)):
+        yield source.decode("utf-8")
+        return
+    if isinstance(source, str):
+        yield source
+        return
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+
+
+def iter_json_array(source: json_source, chunk_size: int = JSON_CHUNK_SIZE) -> Iterator[Any]:
+    """Parse a json array incrementally, yielding its elements as they are read.
+
+    Only one element at a time and the current chunk are kept in memory, so large arrays can be read from files
+    without loading them entirely. Once the array is read, the rest of the input must only contain whitespace.
+
+    Args:
+        source (json_source): Json array, as text, bytes, or a file object opened in text or binary mode
+        chunk_size (int): Size of the chunks read from file objects
+    Yields:
+        Each element of the array
+    """
+    decoder = json.JSONDecoder()
+    chunks = _read_chunks(source, chunk_size)
+    buf = ""
+    pos = 0
+    state = "start"  # start, first (value or end), value, separator (comma or end), end (whitespace only)
+    eof = False
+    while True:
+        pos = _WHITESPACE.match(buf, pos).end()  # type: ignore
+        if pos < len(buf):
+            char = buf[pos]
+            if state == "start":
+                if char != "[":
+                    raise CliDecodeError(f"Error parsing json: expected an array, got '{char}'")
+                state = "first"
+                pos += 1
+                continue
+            if state == "end":
+                raise CliDecodeError(f"Error parsing json: extra data after the array, got '{char}'")
+            if char == "]" and state in ("first", "separator"):
+                state = "end"
+                pos += 1
+                continue
+            if state == "separator":
+                if char != ",":
+                    raise CliDecodeError(f"Error parsing json: expected ',' or ']', got '{char}'")
+                state = "value"
+                pos += 1
+                continue
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except ValueError as e:
+                if eof:
+                    raise CliDecodeError(f"Error parsing json: {e}")
+            else:
+                # A value ending with the buffer may be truncated, e.g. a number
+                if end < len(buf) or eof:
+                    yield value
+                    pos = end
+                    state = "separator"
+                    continue
+        elif eof:
+            if state == "end":
+                return
+            raise CliDecodeError("Error parsing json: unexpected end of data")
+
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+        else:
+            buf = buf[pos:] + chunk
+            pos = 0
+
+
+def _intern_value(value: Any, path: Tuple[str, ...]) -> Any:
+    """Intern the strings of a value, or of its nested key path. Lists and dicts are updated in place."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        for idx, element in enumerate(value):
+            value[idx] = _intern_value(element, path)
+    elif path and isinstance(value, dict) and path[0] in value:
+        value[path[0]] = _intern_value(value[path[0]], path[1:])
+    return value
+
+
+def _reduce_projection(item: "BaseCliApiItem") -> Tuple[Any, ...]:
+    """Pickle projection items, whose class is built at runtime, using the class they are a projection of."""
+    return _load_projection, (item._projection_of, tuple(item._fields), item.__getstate__())
+
+
+def _load_projection(base: Type["BaseCliApiItem"], fields: Tuple[str, ...], state: Tuple[Any, ...]) -> Any:
+    item_class = base.projection(fields)
+    item = item_class.__new__(item_class)
+    item.__setstate__(state)
+    return item
+
+
+def write_json_array(items: Iterable["BaseCliApiItem"], fp: IO[str]) -> int:
+    """Write items as a json array, one item at a time.
+
+    The output is the same as joining the json of each item, without building the whole document in memory.
+
+    Args:
+        items (Iterable[BaseCliApiItem]): Items to write, can be a generator
+        fp (IO[str]): Text file object to write to, e.g. sys.stdout
+    Returns:
+        Number of items written
+    """
+    encode = _JSON_ENCODER.encode
+    count = 0
+    fp.write("[")
+    for item in items:
+        fp.write(f",{encode(item.to_dict())}" if count else encode(item.to_dict()))
+        count += 1
+    fp.write("]")
+    return count
+
+
+def write_ndjson(items: Iterable["BaseCliApiItem"], fp: IO[str]) -> int:
+    """Write items as newline delimited json, one item per line.
+
+    Args:
+        items (Iterable[BaseCliApiItem]): Items to write, can be a generator
+        fp (IO[str]): Text file object to write to, e.g. sys.stdout
+    Returns:
+        Number of items written
+    """
+    encode = _JSON_ENCODER.encode
+    count = 0
+    for item in items:
+        fp.write(f"{encode(item.to_dict())}\n")
+        count += 1
+    return count
+
+
 class BaseCliApiItem:
     """Generic handling of an item based on a dict representation.
 
     Items can be build specifying a list of parameters, a dict, or a json string.
     All fields are directly accessible as attributes.
 
+    To keep items small, values are stored in a list indexed using a field layout shared by all items of a class
+    and built once from ``_model()``. Subclasses must declare ``__slots__ = ()`` to keep this benefit.
+
+    Lazy items (built with ``lazy=True``) keep a reference to the data they were built from instead of copying it.
+    Fields are read directly from that data, and defaults are only resolved when a missing field is accessed, when
+    a field is modified, or when the item is converted with ``to_dict()``.
+
+    Items track the fields modified since they were built from data, see ``changed_fields()``. The original value of
+    a field is saved the first time it is set. Mutable values read from the item can be modified in place, so a
+    fingerprint of their value is recorded when first read, without copying them.
+
     This is especially usedul by clients to directly convert or create items received or to send
     by BaseCliApi subclasses
     """
 
+    __slots__ = ("_values", "_extra", "_raw", "_original")
+
+    # Layout shared by all items of a class: index of each field, default values, and indexes of mutable defaults
+    _fields: ClassVar[Dict[str, int]]
+    _defaults: ClassVar[Tuple[Any, ...]]
+    _mutable_defaults: ClassVar[Tuple[int, ...]]
+
+    # If True, fields mismatching between the model and the data used to build items are logged as warnings.
+    # Otherwise they are only computed and logged when debug logging is enabled.
+    validate_model: ClassVar[bool] = False
+
+    # Fields whose strings are interned when intern_strings is enabled, to share a single copy of values repeated
+    # across items (e.g. status, genres). Strings in lists are interned too, and nested fields are specified with
+    # a dotted name, e.g. ``images.coverType``.
+    intern_fields: ClassVar[Tuple[str, ...]] = ()
+    intern_strings: ClassVar[bool] = False
+    _intern_plan: ClassVar[Tuple[Tuple[int, Tuple[str, ...]], ...]]
+
+    # Class a projection was built from, see projection()
+    _projection_of: ClassVar[Optional[Type["BaseCliApiItem"]]] = None
+    _projections: ClassVar[Dict[Tuple[str, ...], Type["BaseCliApiItem"]]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._init_layout()
+
+    @classmethod
+    def _init_layout(cls) -> None:
+        """Build the class field layout from the model."""
+        model = cls.__new__(cls)._model()
+        cls._fields = {key: idx for idx, key in enumerate(model)}
+        cls._defaults = tuple(model.values())
+        cls._mutable_defaults = tuple(
+            idx for idx, value in enumerate(cls._defaults) if isinstance(value, (list, dict, set))
+        )
+        plan = []
+        for name in cls.intern_fields:
+            field, *path = name.split(".")
+            if field not in cls._fields:
+                raise AttributeError(f"{cls.__name__}: intern field {name} not in model")
+            plan.append((cls._fields[field], tuple(path)))
+        cls._intern_plan = tuple(plan)
+
+    @classmethod
+    def projection(cls: Type[BaseItemClass], fields: Iterable[str]) -> Type[BaseItemClass]:
+        """Return a subclass of the item class keeping only the given fields.
+
+        Items of a projection only store the selected fields, other fields of the data they are built from are
+        discarded. They should not be sent back to the server, as the other fields would be missing.
+        Projections are cached, and a projection of a projection is built from the original class.
+
+        Args:
+            fields (Iterable[str]): Names of the fields to keep
+        Returns:
+            The projection class
+        """
+        base = cls._projection_of or cls
+        keep = set(fields)
+        unknown = keep - base._fields.keys()
+        if unknown:
+            raise CliArrError(f"{base.__name__}: unknown fields {sorted(unknown)}")
+        key = tuple(name for name in base._fields if name in keep)
+        if "_projections" not in base.__dict__:
+            base._projections = {}
+        if key not in base._projections:
+            model = {name: base._defaults[base._fields[name]] for name in key}
+            base._projections[key] = type(
+                f"{base.__name__}Projection",
+                (base,),
+                {
+                    "__slots__": (),
+                    "__module__": base.__module__,
+                    "__reduce__": _reduce_projection,
+                    "_model": lambda self: dict(model),
+                    "_projection_of": base,
+                    "intern_fields": tuple(name for name in base.intern_fields if name.split(".")[0] in keep),
+                },
+            )
+        return cast(Type[BaseItemClass], base._projections[key])
+
     def __init__(self, **kwargs: Any) -> None:
         """Build an item and populate it with the keys specified."""
-        self._data = self._model()
+        self._init_storage(list(self._defaults))
         self._update_existing(kwargs)
 
+    def _init_storage(self, values: Optional[List[Any]], raw: Optional[Dict[Any, Any]] = None) -> None:
+        """Set the item values, or the raw data to read them from for lazy items."""
+        if values is not None:
+            self._own_defaults(values)
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_extra", None)
+        object.__setattr__(self, "_raw", raw)
+        object.__setattr__(self, "_original", None)
+
+    def _own_defaults(self, values: List[Any]) -> None:
+        """Give the item its own copy of the mutable defaults still in use."""
+        defaults = self._defaults
+        for idx in self._mutable_defaults:
+            if values[idx] is defaults[idx]:
+                values[idx] = copy(defaults[idx])
+
+    def _hydrate(self) -> List[Any]:
+        """Resolve the values of a lazy item from its raw data, and return the item values."""
+        raw = self._raw
+        if raw is not None:
+            # Going through a tuple gives an exactly sized list
+            values = list(tuple(map(raw.get, self._fields, self._defaults)))
+            if self.intern_strings:
+                self._intern(values)
+            self._own_defaults(values)
+            object.__setattr__(self, "_values", values)
+            object.__setattr__(self, "_raw", None)
+        return self._values
+
     @classmethod
-    def from_dict(cls: Type[BaseItemClass], dict_data: Dict[Any, Any]) -> BaseItemClass:
-        """Build an item and populate it based on the given dictionnary."""
-        new_obj: BaseItemClass = cls()
-        new_obj._update_existing(dict_data)
+    def from_dict(cls: Type[BaseItemClass], dict_data: Dict[Any, Any], lazy: bool = False) -> BaseItemClass:
+        """Build an item and populate it based on the given dictionnary.
+
+        Args:
+            dict_data (Dict[Any, Any]): Item data
+            lazy (bool): If True, wrap dict_data without copying it. It must not be modified afterwards.
+        """
+        if cls.validate_model or log.isEnabledFor(logging.DEBUG):
+            cls._report_mismatch(dict_data)
+        new_obj: BaseItemClass = cls.__new__(cls)
+        if lazy:
+            new_obj._init_storage(None, dict_data)
+        else:
+            values = list(tuple(map(dict_data.get, cls._fields, cls._defaults)))
+            if cls.intern_strings:
+                cls._intern(values)
+            new_obj._init_storage(values)
         return new_obj
 
+    @classmethod
+    def from_dicts(
+        cls: Type[BaseItemClass], dict_list: Iterable[Dict[Any, Any]], lazy: bool = False
+    ) -> List[BaseItemClass]:
+        """Build a list of items, one from each of the given dictionnaries.
+
+        Args:
+            dict_list (Iterable[Dict[Any, Any]]): Data of each item
+            lazy (bool): If True, wrap each dict without copying it. They must not be modified afterwards.
+        """
+        report = cls.validate_model or log.isEnabledFor(logging.DEBUG)
+        intern = cls._intern if cls.intern_strings else None
+        fields = cls._fields
+        defaults = cls._defaults
+        items = []
+        for dict_data in dict_list:
+            if report:
+                cls._report_mismatch(dict_data)
+            new_obj: BaseItemClass = cls.__new__(cls)
+            if lazy:
+                new_obj._init_storage(None, dict_data)
+            else:
+                values = list(tuple(map(dict_data.get, fields, defaults)))
+                if intern:
+                    intern(values)
+                new_obj._init_storage(values)
+            items.append(new_obj)
+        return items
+
+    @classmethod
+    def _intern(cls, values: List[Any]) -> None:
+        """Intern the strings of the intern_fields in the values of an item."""
+        for idx, path in cls._intern_plan:
+            values[idx] = _intern_value(values[idx], path)
+
+    @classmethod
+    def _report_mismatch(cls, dict_data: Dict[Any, Any]) -> None:
+        """Log the fields present in the data but not in the model, and the model fields missing from the data."""
+        level = logging.WARNING if cls.validate_model else logging.DEBUG
+        unknown_fields = dict_data.keys() - cls._fields.keys()
+        missing_fields = cls._fields.keys() - dict_data.keys()
+        if unknown_fields:
+            log.log(level, "%s: fields not in model: %s", cls.__name__, sorted(unknown_fields, key=str))
+        if missing_fields:
+            log.log(level, "%s: model fields not in data: %s", cls.__name__, sorted(missing_fields))
+
     @classmethod
     def from_json(cls: Type[BaseItemClass], json_data: str) -> BaseItemClass:
         """Build an item and populate it based on json data."""
         return cls.from_dict(json.loads(json_data))
 
+    @classmethod
+    def from_json_list(
+        cls: Type[BaseItemClass], json_data: json_source, lazy: bool = False, stream: bool = False
+    ) -> Union[List[BaseItemClass], Iterator[BaseItemClass]]:
+        """Build items from a json array, one per element.
+
+        Args:
+            json_data (json_source): Json array, as text, bytes, or a file object opened in text or binary mode
+            lazy (bool): If True, items wrap the parsed data without copying it
+            stream (bool): If True, parse the array incrementally and return a generator yielding items as they
+                are parsed. Otherwise the array is parsed at once and a list is returned.
+        Returns:
+            A list or a generator of items
+        """
+        if stream:
+            return cls._iter_items(iter_json_array(json_data), lazy)
+        data = load_json(json_data)
+        if not isinstance(data, list):
+            raise CliDecodeError(f"Error parsing json: expected an array, got {type(data).__name__}")
+        return cls.from_dicts(data, lazy=lazy)
+
+    @classmethod
+    def _iter_items(
+        cls: Type[BaseItemClass], dict_list: Iterable[Dict[Any, Any]], lazy: bool
+    ) -> Iterator[BaseItemClass]:
+        """Build items one at a time from an iterable of dicts."""
+        for dict_data in dict_list:
+            yield cls.from_dict(dict_data, lazy=lazy)
+
     def _update_existing(self, dict_data: Dict[Any, Any]) -> None:
-        """Update a dict only if the keys already exist."""
+        """Update fields only if they already exist."""
+        if self.validate_model or log.isEnabledFor(logging.DEBUG):
+            self._report_mismatch(dict_data)
         for key in dict_data:
-            if key in self._data:
-                self._data[key] = dict_data[key]
-            else:
-                log.debug(f"Field {key} not in model")
-
-        for key in self._data:
-            if key not in dict_data:
-                log.debug(f"Model Field {key} not in data")
+            if key in self._fields or (self._extra and key in self._extra):
+                setattr(self, key, dict_data[key])
 
     def _model(self) -> Dict[Any, Any]:
         """Define the model of items represented by this class.
 
-        Should be overwritten by all children
+        Should be overwritten by all children. It is only evaluated once, when the class is created.
         """
         return {
             # Accepted keys and default values must be defined here by subclasses
@@ -176,25 +586,119 @@ class BaseCliApiItem:
         }
 
     def to_dict(self) -> Dict[Any, Any]:
-        return self._data
+        """Return a dict representation of the item. The dict is built on each call."""
+        data = dict(zip(self._fields, self._hydrate()))
+        if self._extra:
+            data.update(self._extra)
+        return data
 
     def to_json(self) -> str:
-        return json.dumps(self._data)
+        return json.dumps(self.to_dict())
 
     def add_attribute(self, name: str, value: Any) -> None:
-        self._data[name] = value
+        self._save_original(name)
+        if name in self._fields:
+            self._hydrate()[self._fields[name]] = value
+        else:
+            if self._extra is None:
+                object.__setattr__(self, "_extra", {})
+            self._extra[name] = value  # type: ignore
+
+    def _current(self, name: str) -> Any:
+        """Return the value of a field or extra attribute, or _MISSING if not set."""
+        idx = self._fields.get(name)
+        if idx is not None:
+            return self._hydrate()[idx]
+        return self._extra.get(name, _MISSING) if self._extra else _MISSING
+
+    def _save_original(self, name: str) -> None:
+        """Save the value of a field before it is set, if not already saved."""
+        original = self._original
+        if original is None:
+            original = {}
+            object.__setattr__(self, "_original", original)
+        if name not in original:
+            original[name] = deepcopy(self._current(name))
+
+    def _mark_accessed(self, name: str, value: Any) -> None:
+        """Record the fingerprint of a mutable field read, that may be modified in place, if not already saved."""
+        original = self._original
+        if original is None:
+            object.__setattr__(self, "_original", {name: _Fingerprint(value)})
+        elif name not in original:
+            original[name] = _Fingerprint(value)
+
+    def changed_fields(self) -> List[str]:
+        """Return the names of the fields and attributes whose value changed since the item was built.
+
+        Mutable values (lists, dicts) read as item attributes are compared to the fingerprint of their value when
+        first read, to detect in place modifications.
+        """
+        if not self._original:
+            return []
+        changed = []
+        for name, original in self._original.items():
+            current = self._current(name)
+            if isinstance(original, _Fingerprint):
+                if not original.matches(current):
+                    changed.append(name)
+            elif current != original:
+                changed.append(name)
+        return changed
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if any field changed since the item was built."""
+        return bool(self.changed_fields())
+
+    def mark_clean(self) -> None:
+        """Consider the current values as unchanged, e.g. once they have been sent to the server."""
+        object.__setattr__(self, "_original", None)
 
     def __repr__(self) -> str:
         return str(pformat(self.to_dict(), indent=2))
 
     def __getattr__(self, name: str) -> Any:
-        if name in self._data:
-            return self._data[name]
-        else:
-            raise AttributeError(f"{self.__class__.__name__} object has no attribute '{name}'")
+        # Only called when regular lookup fails, slots not set yet must not recurse
+        if name not in BaseCliApiItem.__slots__:
+            idx = self._fields.get(name)
+            if idx is not None:
+                raw = self._raw
+                if raw is None:
+                    value = self._values[idx]
+                elif name in raw:
+                    value = raw[name]
+                else:
+                    value = self._hydrate()[idx]
+                if isinstance(value, (list, dict, set)):
+                    self._mark_accessed(name, value)
+                return value
+            if self._extra and name in self._extra:
+                value = self._extra[name]
+                if isinstance(value, (list, dict, set)):
+                    self._mark_accessed(name, value)
+                return value
+        raise AttributeError(f"{self.__class__.__name__} object has no attribute '{name}'")
 
     def __setattr__(self, name: str, value: Any) -> Any:
-        if "_data" in self.__dict__ and name in self._data:
-            self.__dict__["_data"][name] = value
+        idx = self._fields.get(name)
+        if idx is not None:
+            self._save_original(name)
+            self._hydrate()[idx] = value
+        elif name in BaseCliApiItem.__slots__ or hasattr(type(self), name):
+            super().__setattr__(name, value)
         else:
-            super().__setattr__(name, value)  # pragma: no cover
+            # Attributes not in the model are stored as extra attributes, see add_attribute()
+            self.add_attribute(name, value)
+
+    def __getstate__(self) -> Tuple[List[Any], Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        return self._hydrate(), self._extra, self._original
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        object.__setattr__(self, "_values", state[0])
+        object.__setattr__(self, "_extra", state[1])
+        object.__setattr__(self, "_raw", None)
+        object.__setattr__(self, "_original", state[2] if len(state) > 2 else None)
+
+
+BaseCliApiItem._init_layout()
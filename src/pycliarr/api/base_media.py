@@ -1,13 +1,71 @@
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
 
 from pycliarr.api.base_api import BaseCliApi, json_data, json_dict, json_list
-from pycliarr.api.exceptions import CliArrError
+from pycliarr.api.bulk import (
+    DEFAULT_BULK_WORKERS,
+    STATUS_DONE,
+    STATUS_FAILED,
+    STATUS_SKIPPED,
+    BulkReport,
+    BulkResult,
+    run_bulk,
+)
+from pycliarr.api.exceptions import CliArrError, CliConnectionError, CliServerError
+from pycliarr.api.history import HistoryCheckpoint
+from pycliarr.api.index import LibraryIndex
+from pycliarr.api.registry import DEFAULT_REGISTRY_TTL, CachedRegistry, normalize_name, normalize_path
+from pycliarr.api.snapshot import (
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    SNAPSHOT_ITEMS,
+    SNAPSHOT_QUALITY_PROFILES,
+    SNAPSHOT_ROOT_FOLDERS,
+    SNAPSHOT_TAGS,
+    LibrarySnapshot,
+)
 
 log = logging.getLogger(__name__)
 
+# Number of records fetched per request by the iter_* methods
+DEFAULT_PAGE_SIZE = 100
+# Largest page size requested when pages are grown by parallel traversals
+MAX_PAGE_SIZE = 1000
+# Pages requested ahead of the one being read, per worker, by parallel traversals
+PREFETCH_PAGES_PER_WORKER = 2
+# Maximum number of item ids sent in one editor request
+EDITOR_CHUNK_SIZE = 500
+# How the tags of an editor request are applied to the items tags
+TAG_MODES = ("add", "remove", "replace")
+
+
+def _page_plan(page_size: int, total: int, workers: int) -> List[Tuple[int, int]]:
+    """Return the pages (number, size) to fetch to read the records following the first page.
+
+    Pages are grown so that the records are spread over about one page per worker, up to MAX_PAGE_SIZE. The size
+    doubles from page_size so that each page stays aligned on a multiple of its size, as required by the server
+    paging.
+    """
+    remaining = total - page_size
+    if remaining <= 0:
+        return []
+    target = min(MAX_PAGE_SIZE // page_size, -(-remaining // (page_size * workers)))
+    grown_size = page_size
+    while grown_size * 2 <= page_size * target:
+        grown_size *= 2
+
+    plan = []
+    offset = size = page_size
+    while offset < total:
+        plan.append((offset // size + 1, size))
+        offset += size
+        size = min(offset, grown_size)
+    return plan
+
 
 class BaseCliMediaApi(BaseCliApi):
     """Base class for media based API.
@@ -36,9 +94,63 @@ class BaseCliMediaApi(BaseCliApi):
     api_url_exclusions = f"{api_url_base}/importlistexclusion"
     api_url_rename = f"{api_url_base}/rename"
 
-    def __init__(self, *args: Any, default_root_folder_id: int = 0, **kwargs: Any) -> None:
+    api_url_editor = f"{api_url_base}/item/editor"
+
+    # Field listing item ids, in tag details and editor requests
+    item_ids_field = "itemIds"
+
+    def __init__(
+        self,
+        *args: Any,
+        default_root_folder_id: int = 0,
+        snapshot_path: Optional[Union[str, Path]] = None,
+        offline: bool = False,
+        snapshot_max_age: float = DEFAULT_SNAPSHOT_MAX_AGE,
+        index_path: Optional[Union[str, Path]] = None,
+        registry_ttl: float = DEFAULT_REGISTRY_TTL,
+        **kwargs: Any,
+    ) -> None:
+        """Build a media api client.
+
+        Args:
+            default_root_folder_id (int): Root folder to use when adding items if none is specified
+            snapshot_path (Optional[Union[str, Path]]): File where the library snapshot is stored, see save_snapshot()
+            offline (bool): If True, reads are served from the snapshot instead of the server
+            snapshot_max_age (float): Age in seconds after which the snapshot is reported as stale
+            index_path (Optional[Union[str, Path]]): File where the library index is stored, see save_index().
+                If available, offline item reads use the index rather than the snapshot.
+            registry_ttl (float): Time in seconds root folders, profiles and tags are cached for, see
+                root_folder_registry, quality_profile_registry and tag_registry
+        """
         super().__init__(*args, **kwargs)
         self._default_root_folder_id = default_root_folder_id
+        self._snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self._snapshot: Optional[LibrarySnapshot] = None
+        self._index_path = Path(index_path) if index_path else None
+        self._index: Optional[LibraryIndex] = None
+        self.offline = offline
+        self.snapshot_max_age = snapshot_max_age
+        self.root_folder_registry = CachedRegistry(
+            lambda: self.get_root_folder(),
+            {"id": None, "path": normalize_path},
+            ttl=registry_ttl,
+            name="root folder",
+            refresh_on_miss=True,
+        )
+        self.quality_profile_registry = CachedRegistry(
+            lambda: self.get_quality_profiles(),
+            {"id": None, "name": normalize_name},
+            ttl=registry_ttl,
+            name="quality profile",
+            refresh_on_miss=True,
+        )
+        self.tag_registry = CachedRegistry(
+            lambda: cast(json_list, self.get_tag_detail()),
+            {"id": None, "label": normalize_name},
+            ttl=registry_ttl,
+            name="tag",
+            refresh_on_miss=True,
+        )
 
     @property
     def default_root_folder_id(self) -> int:
@@ -48,6 +160,116 @@ class BaseCliMediaApi(BaseCliApi):
     def default_root_folder_id(self, value: int) -> None:
         self._default_root_folder_id = value
 
+    @property
+    def snapshot(self) -> Optional[LibrarySnapshot]:
+        """Library snapshot used for offline reads, loaded from snapshot_path on first access."""
+        if not self._snapshot and self._snapshot_path and self._snapshot_path.exists():
+            self._snapshot = LibrarySnapshot.load(self._snapshot_path)
+        return self._snapshot
+
+    @property
+    def snapshot_is_stale(self) -> bool:
+        """True if there is no snapshot, or if it is older than snapshot_max_age."""
+        snapshot = self.snapshot
+        return not snapshot or snapshot.is_stale(self.snapshot_max_age)
+
+    def save_snapshot(self, path: Optional[Union[str, Path]] = None) -> LibrarySnapshot:
+        """Fetch the library from the server and store it locally to serve offline reads.
+
+        Items, tags, root folders and quality profiles are always fetched from the server, even in offline mode.
+
+        Args:
+            path (Optional[Union[str, Path]]): File where to save the snapshot, snapshot_path by default
+        Returns:
+            The new snapshot
+        """
+        snapshot_path = Path(path) if path else self._snapshot_path
+        if not snapshot_path:
+            raise CliArrError("No snapshot path specified")
+
+        snapshot = LibrarySnapshot(source=self.host_url)
+        snapshot.set(SNAPSHOT_ITEMS, self.request_get(self.api_url_item))
+        snapshot.set(SNAPSHOT_TAGS, self.request_get(f"{self.api_url_tag}/"))
+        snapshot.set(SNAPSHOT_ROOT_FOLDERS, self.request_get(self.api_url_rootfolder))
+        snapshot.set(SNAPSHOT_QUALITY_PROFILES, self.request_get(self.api_url_profile))
+        snapshot.save(snapshot_path)
+
+        self._snapshot_path = snapshot_path
+        self._snapshot = snapshot
+        return snapshot
+
+    @property
+    def index_path(self) -> Optional[Path]:
+        """File where the library index is stored, see save_index()."""
+        return self._index_path
+
+    @property
+    def index(self) -> Optional[LibraryIndex]:
+        """Library index used for offline item reads, opened from index_path on first access."""
+        if self._index is None and self._index_path and self._index_path.exists():
+            self._index = LibraryIndex(self._index_path)
+        return self._index
+
+    def save_index(self, path: Optional[Union[str, Path]] = None) -> int:
+        """Store an index of the library items locally, to serve offline item reads without loading all items.
+
+        Items are fetched from the server, or read from the snapshot in offline mode.
+
+        Args:
+            path (Optional[Union[str, Path]]): File where to save the index, index_path by default
+        Returns:
+            Number of items indexed
+        """
+        index_path = Path(path) if path else self._index_path
+        if not index_path:
+            raise CliArrError("No index path specified")
+
+        created = self.snapshot.created if self.offline and self.snapshot else None
+        items = self._read(SNAPSHOT_ITEMS, lambda: self.request_get(self.api_url_item), use_index=False)
+        count = LibraryIndex.build(index_path, cast(json_list, items), created=created)
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        self._index_path = index_path
+        return count
+
+    def _read_index(self, item_id: Optional[int]) -> json_data:
+        """Read items from the library index."""
+        index = cast(LibraryIndex, self.index)
+        if index.is_stale(self.snapshot_max_age):
+            log.warning("Index is stale, data is %d seconds old", index.age)
+        if not item_id:
+            return list(index)
+        res = index.get(item_id)
+        if res is None:
+            raise CliArrError(f"No entry with id {item_id} in index {index.path}")
+        return res
+
+    def _read(
+        self,
+        section: str,
+        fetch: Callable[[], json_data],
+        item_id: Optional[int] = None,
+        use_index: bool = True,
+    ) -> json_data:
+        """Read data from the server, or from the index or snapshot if offline or if the server can't be reached."""
+        if not self.offline:
+            try:
+                return fetch()
+            except CliConnectionError as e:
+                if not (use_index and section == SNAPSHOT_ITEMS and self.index is not None) and not self.snapshot:
+                    raise
+                log.warning("Server unreachable, using local data: %s", e)
+
+        if use_index and section == SNAPSHOT_ITEMS and self.index is not None:
+            return self._read_index(item_id)
+        snapshot = self.snapshot
+        if not snapshot:
+            raise CliArrError("Offline read requested but no snapshot is available")
+        if snapshot.is_stale(self.snapshot_max_age):
+            log.warning("Snapshot is stale, data is %d seconds old", snapshot.age)
+        return snapshot.get(section, item_id)
+
     def get_calendar(self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> json_data:
         """Retrieve info about when items were/will be downloaded.
 
@@ -100,7 +322,7 @@ class BaseCliMediaApi(BaseCliApi):
         Returns:
             json response
         """
-        res = cast(json_list, self.request_get(self.api_url_rootfolder))
+        res = cast(json_list, self._read(SNAPSHOT_ROOT_FOLDERS, lambda: self.request_get(self.api_url_rootfolder)))
         return res
 
     def get_item(self, item_id: Optional[int] = None) -> json_data:
@@ -112,7 +334,7 @@ class BaseCliMediaApi(BaseCliApi):
             json response
         """
         url_path = f"{self.api_url_item}/{item_id}" if item_id else self.api_url_item
-        return self.request_get(url_path)
+        return self._read(SNAPSHOT_ITEMS, lambda: self.request_get(url_path), item_id)
 
     def lookup_item(self, term: str) -> json_data:
         """Search for items
@@ -135,6 +357,48 @@ class BaseCliMediaApi(BaseCliApi):
         """
         return self.request_post(self.api_url_item, json_data=json_data)
 
+    def add_items(
+        self,
+        keys: Iterable[Any],
+        add: Callable[[Any], json_data],
+        library_keys: Callable[[json_dict], Iterable[Any]],
+        workers: int = DEFAULT_BULK_WORKERS,
+    ) -> BulkReport:
+        """Add many items to the collection, see add_movies() and add_series().
+
+        Keys are deduplicated, and the keys already in the library, read with a single request, are skipped. Root
+        folders are fetched once before adding the items, and the items are added by workers concurrent requests.
+
+        Args:
+            keys (Iterable[Any]): Keys of the items to add, e.g. tvdb ids
+            add (Callable[[Any], json_data]): Function looking up the item of a key and adding it
+            library_keys (Callable[[json_dict], Iterable[Any]]): Function returning the keys of a library item
+            workers (int): Number of items added concurrently
+        Returns:
+            Result of each key, in the order given
+        """
+        keys = list(dict.fromkeys(keys))
+        library = {}
+        for item in cast(json_list, self.request_get(self.api_url_item)):
+            for key in library_keys(item):
+                if key:
+                    library[key] = item.get("id")
+        self.root_folder_registry.entries()
+
+        def add_one(key: Any) -> BulkResult:
+            res = add(key)
+            return BulkResult(key, STATUS_DONE, item_id=res.get("id") if isinstance(res, dict) else None, response=res)
+
+        added = iter(run_bulk(add_one, [key for key in keys if key not in library], workers))
+        return BulkReport(
+            (
+                BulkResult(key, STATUS_SKIPPED, item_id=library[key], message="Already in library")
+                if key in library
+                else next(added)
+            )
+            for key in keys
+        )
+
     def delete_item(self, item_id: int, delete_files: bool = True, options: Dict[str, Any] = {}) -> json_data:
         """Delete the item with the given ID
 
@@ -150,6 +414,160 @@ class BaseCliMediaApi(BaseCliApi):
         url_path = f"{self.api_url_item}/{item_id}"
         return self.request_delete(url_path, data)
 
+    def _send_editor(
+        self,
+        send: Callable[[json_dict], json_data],
+        fallback: Callable[[int], json_data],
+        item_ids: Iterable[int],
+        data: json_dict,
+        chunk_size: int,
+        workers: int,
+    ) -> BulkReport:
+        """Send an editor request per chunk of item ids, see delete_items() and edit_items().
+
+        A chunk rejected by the server is reported as failed, and the next chunks are still sent. If the server
+        doesn't provide the editor endpoint, fallback is called for each remaining item, by workers concurrent calls.
+        """
+        item_ids = list(dict.fromkeys(item_ids))
+        report = BulkReport()
+        for start in range(0, len(item_ids), chunk_size):
+            chunk = item_ids[start : start + chunk_size]
+            try:
+                res = send(dict(data, **{self.item_ids_field: chunk}))
+            except CliServerError as e:
+                if e.status_code in (404, 405):
+                    log.debug("Editor endpoint not available, processing items one by one: %s", e)
+                    report.results.extend(
+                        run_bulk(
+                            lambda item_id: BulkResult(item_id, STATUS_DONE, item_id, response=fallback(item_id)),
+                            item_ids[start:],
+                            workers,
+                        )
+                    )
+                    break
+                report.results.extend(BulkResult(item_id, STATUS_FAILED, item_id, str(e)) for item_id in chunk)
+                continue
+            report.results.extend(BulkResult(item_id, STATUS_DONE, item_id, response=res) for item_id in chunk)
+        return report
+
+    def delete_items(
+        self,
+        item_ids: Iterable[int],
+        delete_files: bool = True,
+        options: Dict[str, Any] = {},
+        chunk_size: int = EDITOR_CHUNK_SIZE,
+        workers: int = DEFAULT_BULK_WORKERS,
+    ) -> BulkReport:
+        """Delete many items with the editor endpoint, sending one request per chunk of ids.
+
+        If the server doesn't provide the editor endpoint, items are deleted one by one with delete_item(),
+        by workers concurrent requests.
+
+        Args:
+            item_ids (Iterable[int]): Items to delete
+            delete_files (bool): Optional. Also delete files. Default is True
+            options (Dict[str, Any]): Optionally specify additional options
+            chunk_size (int): Maximum number of ids per request
+            workers (int): Number of concurrent requests when deleting items one by one
+        Returns:
+            Result of each item, in the order given
+        """
+        data = {"deleteFiles": delete_files}
+        data.update(options)
+        return self._send_editor(
+            lambda chunk_data: self.request_delete(self.api_url_editor, json_data=chunk_data),
+            lambda item_id: self.delete_item(item_id, delete_files, options),
+            item_ids,
+            data,
+            chunk_size,
+            workers,
+        )
+
+    def edit_items(
+        self,
+        item_ids: Iterable[int],
+        monitored: Optional[bool] = None,
+        quality: Optional[Union[int, str]] = None,
+        root_folder: Optional[Union[int, str]] = None,
+        tags: Optional[Iterable[Union[int, str]]] = None,
+        apply_tags: str = "add",
+        move_files: bool = False,
+        options: Dict[str, Any] = {},
+        chunk_size: int = EDITOR_CHUNK_SIZE,
+        workers: int = DEFAULT_BULK_WORKERS,
+    ) -> BulkReport:
+        """Edit many items with the editor endpoint, sending only the fields changed, one request per chunk of ids.
+
+        Fields left to None are not modified. If the server doesn't provide the editor endpoint, items are fetched
+        and edited one by one with edit_item(), by workers concurrent requests.
+
+        Args:
+            item_ids (Iterable[int]): Items to edit
+            monitored (Optional[bool]): Whether to monitor the items
+            quality (Optional[Union[int, str]]): Quality profile id or name
+            root_folder (Optional[Union[int, str]]): Root folder id or path to move the items to
+            tags (Optional[Iterable[Union[int, str]]]): Tag ids or labels. Missing labels are created, unless
+                removing tags.
+            apply_tags (str): How tags are applied, one of TAG_MODES: add them to the item tags (default), remove them
+                from the item tags, or replace the item tags
+            move_files (bool): Whether to move files to the new root folder. Default is False
+            options (Dict[str, Any]): Optionally specify additional fields to change
+            chunk_size (int): Maximum number of ids per request
+            workers (int): Number of concurrent requests when editing items one by one
+        Returns:
+            Result of each item, in the order given
+        """
+        if apply_tags not in TAG_MODES:
+            raise CliArrError(f"Invalid tags mode '{apply_tags}', expected one of {', '.join(TAG_MODES)}")
+        changes: Dict[str, Any] = {}
+        if monitored is not None:
+            changes["monitored"] = monitored
+        if quality is not None:
+            changes["qualityProfileId"] = self.resolve_quality_profile(quality)
+        if root_folder is not None:
+            if isinstance(root_folder, int) or root_folder.isdigit():
+                root_folder = self.root_folder_registry.require("id", int(root_folder))["path"]
+            changes["rootFolderPath"] = root_folder
+            changes["moveFiles"] = move_files
+        if tags is not None:
+            changes["tags"] = self.resolve_tags(tags, create=apply_tags != "remove")
+            changes["applyTags"] = apply_tags
+        changes.update(options)
+        if not changes:
+            raise CliArrError("Error, no change specified")
+
+        return self._send_editor(
+            lambda chunk_data: self.request_put(self.api_url_editor, json_data=chunk_data),
+            lambda item_id: self._edit_item_fields(item_id, changes),
+            item_ids,
+            changes,
+            chunk_size,
+            workers,
+        )
+
+    def _edit_item_fields(self, item_id: int, changes: Dict[str, Any]) -> json_data:
+        """Apply editor changes to one item with edit_item(), for servers without the editor endpoint."""
+        item = cast(json_dict, self.request_get(f"{self.api_url_item}/{item_id}"))
+        url_params = None
+        for field, value in changes.items():
+            if field == "tags":
+                tags = item.get("tags") or []
+                apply_tags = changes.get("applyTags", "add")
+                if apply_tags == "add":
+                    item["tags"] = tags + [tag for tag in value if tag not in tags]
+                elif apply_tags == "remove":
+                    item["tags"] = [tag for tag in tags if tag not in value]
+                else:
+                    item["tags"] = list(value)
+            elif field == "rootFolderPath":
+                item["rootFolderPath"] = value
+                item["path"] = str(Path(value) / Path(item.get("path") or "").name)
+            elif field == "moveFiles":
+                url_params = {"moveFiles": value}
+            elif field != "applyTags":
+                item[field] = value
+        return self.edit_item(item, url_params=url_params)
+
     def edit_item(self, json_data: json_data, url_params: Optional[Dict[str, Any]] = None) -> json_data:
         """Edit an item from the collection
 
@@ -166,7 +584,99 @@ class BaseCliMediaApi(BaseCliApi):
 
     def get_quality_profiles(self) -> json_list:
         """Return the quality profiles"""
-        return cast(json_list, self.request_get(self.api_url_profile))
+        return cast(json_list, self._read(SNAPSHOT_QUALITY_PROFILES, lambda: self.request_get(self.api_url_profile)))
+
+    def resolve_quality_profile(self, profile: Union[int, str]) -> int:
+        """Return the id of a quality profile from its id or name (case insensitive).
+
+        Ids are returned as is, names are looked up in quality_profile_registry.
+        """
+        if isinstance(profile, int):
+            return profile
+        if profile.isdigit():
+            return int(profile)
+        return int(self.quality_profile_registry.find(profile)["id"])
+
+    def resolve_quality_profiles(self, profiles: Iterable[Union[int, str]]) -> List[int]:
+        """Return the ids of quality profiles from their ids or names, see resolve_quality_profile()."""
+        return [self.resolve_quality_profile(profile) for profile in profiles]
+
+    def _iter_pages(
+        self,
+        get_page: Callable[[int, int], json_data],
+        page_size: int,
+        max_records: Optional[int],
+        workers: int = 1,
+    ) -> Iterator[json_dict]:
+        """Yield the records of a paged endpoint in order.
+
+        With one worker, pages are fetched one at a time when the previous one is consumed. With more workers, the
+        first page gives the total number of records, then the following pages are fetched concurrently, growing the
+        page size to reduce the number of requests. At most PREFETCH_PAGES_PER_WORKER pages per worker are fetched
+        ahead of the records being read.
+
+        Args:
+            get_page (Callable[[int, int], json_data]): Function fetching a page from its number and size
+            page_size (int): Number of records per page, or of the first page with several workers
+            max_records (Optional[int]): Stop after this many records, all by default
+            workers (int): Number of pages fetched concurrently
+        """
+        if page_size < 1:
+            raise CliArrError(f"Invalid page size: {page_size}")
+        res = get_page(1, page_size)
+        if not isinstance(res, dict):
+            # Not a paged response, all records are returned at once
+            yield from res[:max_records] if max_records is not None else res
+            return
+        total = res.get("totalRecords", 0)
+        if max_records is not None:
+            total = min(total, max_records)
+        if workers > 1:
+            yield from self._prefetch_pages(get_page, res, page_size, total, workers)
+            return
+
+        page = 1
+        count = 0
+        while True:
+            records = res.get("records") or []
+            for record in records:
+                if count >= total:
+                    return
+                count += 1
+                yield record
+            if not records or count >= total:
+                return
+            page += 1
+            res = cast(json_dict, get_page(page, page_size))
+
+    def _prefetch_pages(
+        self, get_page: Callable[[int, int], json_data], first_page: json_dict, page_size: int, total: int, workers: int
+    ) -> Iterator[json_dict]:
+        """Yield the records of the first page, then of the following pages fetched concurrently, see _iter_pages()."""
+        records = (first_page.get("records") or [])[:total]
+        yield from records
+        count = len(records)
+        if count >= total:
+            return
+
+        plan = iter(_page_plan(page_size, total, workers))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: Deque[Future] = deque()
+            try:
+                for page in islice(plan, workers * PREFETCH_PAGES_PER_WORKER):
+                    pending.append(executor.submit(get_page, *page))
+                while pending:
+                    res = cast(json_dict, pending.popleft().result())
+                    for page in islice(plan, 1):
+                        pending.append(executor.submit(get_page, *page))
+                    for record in res.get("records") or []:
+                        if count >= total:
+                            return
+                        count += 1
+                        yield record
+            finally:
+                for future in pending:
+                    future.cancel()
 
     def _get_queue(
         self,
@@ -204,6 +714,29 @@ class BaseCliMediaApi(BaseCliApi):
     ) -> json_data:
         return self._get_queue(page, sort_key, page_size, sort_dir)
 
+    def iter_queue(
+        self,
+        sort_key: str = "progress",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_dir: str = "ascending",
+        include_unknown: bool = True,
+        max_records: Optional[int] = None,
+        workers: int = 1,
+    ) -> Iterator[json_dict]:
+        """Iterate over the queue records, fetching pages as needed. See get_queue().
+
+        Args:
+            page_size (int): Number of records fetched per request
+            max_records (Optional[int]): Stop after this many records, all by default
+            workers (int): Number of pages fetched concurrently, pages are fetched one at a time by default
+        """
+        return self._iter_pages(
+            lambda page, size: self.get_queue(page, sort_key, size, sort_dir, include_unknown),
+            page_size,
+            max_records,
+            workers,
+        )
+
     def delete_queue(self, item_id: int, blacklist: Optional[bool] = None) -> json_data:
         """Delete an item from the queue and download client. Optionally blacklist item after deletion.
 
@@ -246,6 +779,73 @@ class BaseCliMediaApi(BaseCliApi):
         data.update(options)
         return self.request_get(self.api_url_history, url_params=data)
 
+    def iter_history(
+        self,
+        sort_key: str = "date",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_dir: str = "asc",
+        options: Dict[str, Any] = {},
+        max_records: Optional[int] = None,
+        workers: int = 1,
+    ) -> Iterator[json_dict]:
+        """Iterate over the history records, fetching pages as needed. See get_history().
+
+        Args:
+            page_size (int): Number of records fetched per request
+            max_records (Optional[int]): Stop after this many records, all by default
+            workers (int): Number of pages fetched concurrently, pages are fetched one at a time by default
+        """
+        return self._iter_pages(
+            lambda page, size: self.get_history(page, sort_key, size, sort_dir, options),
+            page_size,
+            max_records,
+            workers,
+        )
+
+    def sync_history(
+        self,
+        checkpoint_path: Union[str, Path],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        options: Dict[str, Any] = {},
+    ) -> Iterator[json_dict]:
+        """Iterate over the history records recorded since the last sync, newest first.
+
+        History is read by decreasing id, as record dates are not always in the same order as their ids, and paging
+        stops at the first record already returned by a previous sync, so a sync costs one page plus the new records.
+        The checkpoint is stored in checkpoint_path once all the new records have been consumed: if the iteration is
+        stopped early, the next sync returns the same records again.
+
+        Args:
+            checkpoint_path (Union[str, Path]): File storing the newest record returned. The whole history is
+                returned if it does not exist.
+            page_size (int): Number of records fetched per request
+            options (Dict[str, Any]={}): Optional additional options, see get_history()
+        """
+        path = Path(checkpoint_path)
+        checkpoint = HistoryCheckpoint.load(path) if path.exists() else HistoryCheckpoint(source=self.host_url)
+        if checkpoint.source and checkpoint.source != self.host_url:
+            raise CliArrError(f"History checkpoint {path} was created for {checkpoint.source}, not {self.host_url}")
+
+        newest: Optional[json_dict] = None
+        previous_id = None
+        options = {"sortDirection": "descending", **options}
+        for record in self.iter_history("id", page_size, "descending", options):
+            if not checkpoint.is_new(record):
+                break
+            record_id = record.get("id")
+            if previous_id is not None and record_id is not None and record_id > previous_id:
+                raise CliArrError("History is not sorted by decreasing id, unable to sync it incrementally")
+            previous_id = record_id
+            if newest is None or int(record_id or 0) > int(newest.get("id") or 0):
+                newest = record
+            yield record
+
+        if newest:
+            checkpoint.advance(newest)
+            checkpoint.save(path)
+        elif not path.exists():
+            checkpoint.save(path)
+
     def get_logs(self, page: int = 1, sort_key: str = "time", page_size: int = 10, sort_dir: str = "asc") -> json_data:
         """Get logs
 
@@ -265,6 +865,25 @@ class BaseCliMediaApi(BaseCliApi):
         }
         return self.request_get(self.api_url_log, url_params=data)
 
+    def iter_logs(
+        self,
+        sort_key: str = "time",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_dir: str = "asc",
+        max_records: Optional[int] = None,
+        workers: int = 1,
+    ) -> Iterator[json_dict]:
+        """Iterate over the log records, fetching pages as needed. See get_logs().
+
+        Args:
+            page_size (int): Number of records fetched per request
+            max_records (Optional[int]): Stop after this many records, all by default
+            workers (int): Number of pages fetched concurrently, pages are fetched one at a time by default
+        """
+        return self._iter_pages(
+            lambda page, size: self.get_logs(page, sort_key, size, sort_dir), page_size, max_records, workers
+        )
+
     def get_backup(self) -> json_data:
         """Return the backups as json"""
         return self.request_get(self.api_url_systembackup)
@@ -291,6 +910,25 @@ class BaseCliMediaApi(BaseCliApi):
         data.update({"sortKey": sort_key})
         return self.request_get(self.api_url_wanted_missing, url_params=data)
 
+    def iter_wanted(
+        self,
+        sort_key: str = "airDateUtc",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_dir: str = "asc",
+        max_records: Optional[int] = None,
+        workers: int = 1,
+    ) -> Iterator[json_dict]:
+        """Iterate over the wanted records, fetching pages as needed. See get_wanted().
+
+        Args:
+            page_size (int): Number of records fetched per request
+            max_records (Optional[int]): Stop after this many records, all by default
+            workers (int): Number of pages fetched concurrently, pages are fetched one at a time by default
+        """
+        return self._iter_pages(
+            lambda page, size: self.get_wanted(page, sort_key, size, sort_dir), page_size, max_records, workers
+        )
+
     def build_item_path(self, title: str, root_folder_id: int = 0) -> Path:
         """Build an item folder path using the root folder specified.
         Args:
@@ -299,15 +937,16 @@ class BaseCliMediaApi(BaseCliApi):
             If the id is not found or not specified, the default root folder id will be used.
             If 0, the first root folder in the list is used.
 
+        Root folders are cached, see root_folder_registry.
+
         Returns: Full path of the serie in the format <root path>/<serie name>
         """
-        root_paths = self.get_root_folder()
         selected_root_folder_id = root_folder_id or self.default_root_folder_id
-        print(f"{selected_root_folder_id} // {root_folder_id} // {self.default_root_folder_id}")
-        root_path = root_paths[0] if not selected_root_folder_id else None
-        for path in root_paths:
-            if path["id"] == int(selected_root_folder_id):
-                root_path = path
+        if selected_root_folder_id:
+            root_path = self.root_folder_registry.get("id", int(selected_root_folder_id))
+        else:
+            root_paths = self.root_folder_registry.entries()
+            root_path = root_paths[0] if root_paths else None
 
         if not root_path:
             raise CliArrError(f"Invalid root folder Id: {selected_root_folder_id}")
@@ -332,6 +971,25 @@ class BaseCliMediaApi(BaseCliApi):
         }
         return self.request_get(self.api_url_blocklist, url_params=data)
 
+    def iter_blocklist(
+        self,
+        sort_key: str = "date",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        sort_dir: str = "descending",
+        max_records: Optional[int] = None,
+        workers: int = 1,
+    ) -> Iterator[json_dict]:
+        """Iterate over the blocklisted releases, fetching pages as needed. See get_blocklist().
+
+        Args:
+            page_size (int): Number of records fetched per request
+            max_records (Optional[int]): Stop after this many records, all by default
+            workers (int): Number of pages fetched concurrently, pages are fetched one at a time by default
+        """
+        return self._iter_pages(
+            lambda page, size: self.get_blocklist(page, sort_key, size, sort_dir), page_size, max_records, workers
+        )
+
     def delete_blocklist(self, item_id: Optional[int] = None) -> json_data:
         """Remove the specified item from the blocklist, or all items if none specified
 
@@ -385,7 +1043,8 @@ class BaseCliMediaApi(BaseCliApi):
         Returns:
             json response
         """
-        return self.request_get(f"{self.api_url_tag}/{item_id if item_id else ''}")
+        url_path = f"{self.api_url_tag}/{item_id if item_id else ''}"
+        return self._read(SNAPSHOT_TAGS, lambda: self.request_get(url_path), item_id)
 
     def get_tag_detail(self, item_id: Optional[int] = None) -> json_data:
         """Get specified tag detail or all if none specified
@@ -405,6 +1064,7 @@ class BaseCliMediaApi(BaseCliApi):
         Returns:
             json response
         """
+        self.tag_registry.invalidate()
         return self.request_delete(f"{self.api_url_tag}/{item_id}")
 
     def edit_tag(self, item_id: int, value: str) -> json_data:
@@ -416,6 +1076,7 @@ class BaseCliMediaApi(BaseCliApi):
         Returns:
             json response
         """
+        self.tag_registry.invalidate()
         return self.request_put(f"{self.api_url_tag}/{item_id}", json_data={"id": item_id, "label": value})
 
     def create_tag(self, value: str) -> json_data:
@@ -427,7 +1088,51 @@ class BaseCliMediaApi(BaseCliApi):
         Returns:
             json response
         """
-        return self.request_post(self.api_url_tag, json_data={"id": 0, "label": value})
+        res = self.request_post(self.api_url_tag, json_data={"id": 0, "label": value})
+        if isinstance(res, dict):
+            self.tag_registry.add(res)
+        return res
+
+    def resolve_tags(self, tags: Iterable[Union[int, str]], create: bool = True) -> List[int]:
+        """Return the ids of tags given by id or label (case insensitive).
+
+        Labels are looked up in tag_registry, fetching the tags at most twice for all the labels.
+
+        Args:
+            tags (Iterable[Union[int, str]]): Tag ids or labels
+            create (bool): If True (default), create the tags whose label is not found, else raise CliArrError
+        Returns:
+            Ids of the tags, in the same order
+        """
+        tags = list(tags)
+        labels = [normalize_name(tag) for tag in tags if isinstance(tag, str)]
+        entries = dict(zip(labels, self.tag_registry.get_many("label", labels))) if labels else {}
+        ids = []
+        for tag in tags:
+            if isinstance(tag, int):
+                ids.append(tag)
+                continue
+            label = normalize_name(tag)
+            entry = entries[label]
+            if entry is None:
+                if not create:
+                    raise CliArrError(f"No tag with label '{tag}'")
+                entry = entries[label] = cast(json_dict, self.create_tag(tag))
+            ids.append(int(entry["id"]))
+        return ids
+
+    def get_tag_labels(self, tag_ids: Iterable[int]) -> List[str]:
+        """Return the labels of tags from their ids, using tag_registry."""
+        return [self.tag_registry.require("id", tag_id)["label"] for tag_id in tag_ids]
+
+    def get_tagged_ids(self, tag: Union[int, str]) -> List[int]:
+        """Return the ids of the items having a tag, given by id or label, from the tag details cached in tag_registry.
+
+        The tag details are fetched again after registry_ttl seconds, or after tag_registry.invalidate(), so
+        items tagged since then may be missing.
+        """
+        entry = self.tag_registry.require("id" if isinstance(tag, int) else "label", tag)
+        return list(entry.get(self.item_ids_field) or [])
 
     def get_exclusion(self, item_id: Optional[int] = None) -> json_data:
         """Get import list exclusions
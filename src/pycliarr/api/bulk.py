@@ -0,0 +1,118 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from pycliarr.api.base_api import json_data
+from pycliarr.api.exceptions import CliArrError
+
+log = logging.getLogger(__name__)
+
+# Number of requests sent concurrently by bulk operations
+DEFAULT_BULK_WORKERS = 4
+
+STATUS_DONE = "done"
+STATUS_SKIPPED = "skipped"
+STATUS_FAILED = "failed"
+
+
+class BulkResult:
+    """Outcome of a bulk operation for one item."""
+
+    __slots__ = ("key", "status", "item_id", "message", "response")
+
+    def __init__(
+        self,
+        key: Any,
+        status: str,
+        item_id: Optional[int] = None,
+        message: str = "",
+        response: Optional[json_data] = None,
+    ) -> None:
+        """Build a result.
+
+        Args:
+            key (Any): Item the operation was requested for, e.g. a tmdb id
+            status (str): STATUS_DONE, STATUS_SKIPPED or STATUS_FAILED
+            item_id (Optional[int]): Id of the item in the library, if known
+            message (str): Reason the item was skipped or failed
+            response (Optional[json_data]): Server response, if any
+        """
+        self.key = key
+        self.status = status
+        self.item_id = item_id
+        self.message = message
+        self.response = response
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"key": self.key, "status": self.status, "itemId": self.item_id, "message": self.message}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.key!r} {self.status}>"
+
+
+class BulkReport:
+    """Results of a bulk operation, one per item, in the order the items were given."""
+
+    def __init__(self, results: Optional[Iterable[BulkResult]] = None) -> None:
+        self.results: List[BulkResult] = list(results or [])
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[BulkResult]:
+        return iter(self.results)
+
+    def by_status(self, status: str) -> List[BulkResult]:
+        return [result for result in self.results if result.status == status]
+
+    @property
+    def done(self) -> List[BulkResult]:
+        return self.by_status(STATUS_DONE)
+
+    @property
+    def skipped(self) -> List[BulkResult]:
+        return self.by_status(STATUS_SKIPPED)
+
+    @property
+    def failed(self) -> List[BulkResult]:
+        return self.by_status(STATUS_FAILED)
+
+    @property
+    def ok(self) -> bool:
+        """True if no item failed."""
+        return not self.failed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "done": len(self.done),
+            "skipped": len(self.skipped),
+            "failed": len(self.failed),
+            "results": [result.to_dict() for result in self.results],
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} done={len(self.done)} skipped={len(self.skipped)} failed={len(self.failed)}>"
+        )
+
+
+def run_bulk(
+    func: Callable[[Any], BulkResult], keys: Iterable[Any], workers: int = DEFAULT_BULK_WORKERS
+) -> List[BulkResult]:
+    """Run an operation for each key, at most workers at a time, and return the results in the keys order.
+
+    CliArrError raised by the operation is reported as a failed result for its key, other keys are still processed.
+    """
+
+    def run_one(key: Any) -> BulkResult:
+        try:
+            return func(key)
+        except CliArrError as e:
+            log.debug("Bulk operation failed for %s: %s", key, e)
+            return BulkResult(key, STATUS_FAILED, message=str(e))
+
+    keys = list(keys)
+    if workers <= 1 or len(keys) <= 1:
+        return [run_one(key) for key in keys]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_one, keys))
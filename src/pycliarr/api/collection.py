@@ -0,0 +1,263 @@
+import logging
+import operator
+from array import array
+from typing import IO, Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Type
+
+from pycliarr.api.base_api import BaseItemClass, json_dict, write_json_array, write_ndjson
+from pycliarr.api.exceptions import CliArrError
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+log = logging.getLogger(__name__)
+
+# Operators usable in ItemCollection.mask() and ItemCollection.where()
+OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+# Operators for which missing (None) values never match
+ORDERED_OPERATORS = ("<", "<=", ">", ">=")
+
+# NumPy array, array or list depending on NumPy availability and the values type
+Column = Any
+
+
+class ItemCollection(Generic[BaseItemClass]):
+    """Collection of items storing selected fields column-wise for fast filtering, sorting and aggregation.
+
+    Columns are NumPy arrays when NumPy is available, arrays or lists otherwise. Nested fields can be used as
+    columns with a dotted name, e.g. ``statistics.sizeOnDisk``. Columns not selected when building the collection
+    are built on first use.
+
+    The collection keeps the raw data of each item, iterating over it yields lazy items of the collection class.
+    Collections are read only views: setting a field of an item yielded does not update the collection, but the
+    items share their list and dict values with the collection rows, modifying them in place modifies the rows.
+    Use copy.deepcopy() on the items to modify them independently.
+
+    Example:
+        movies = radarr.get_movie(as_collection=True)
+        missing = movies.where("hasFile", "==", False).where("sizeOnDisk", ">", 10**9)
+        sizes = {profile: group.sum("sizeOnDisk") for profile, group in missing.group_by("qualityProfileId").items()}
+    """
+
+    def __init__(
+        self,
+        item_class: Type[BaseItemClass],
+        rows: List[json_dict],
+        columns: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Build a collection.
+
+        Args:
+            item_class (Type[BaseItemClass]): Class of the items in the collection
+            rows (List[json_dict]): Raw data of each item, as returned by the server. For a projection item class,
+                only the projected fields of each item are kept.
+            columns (Optional[Iterable[str]]): Fields to store column-wise immediately. Default is all the model
+                fields having a scalar default value (numbers, booleans, strings).
+        """
+        if item_class._projection_of is not None:
+            # Only keep the projected fields of each item
+            fields = item_class._fields
+            rows = [{name: row[name] for name in fields if name in row} for row in rows]
+        self._item_class = item_class
+        self._rows = rows
+        self._columns: Dict[str, Column] = {}
+        if columns is None:
+            columns = [
+                name
+                for name, default in zip(item_class._fields, item_class._defaults)
+                if isinstance(default, (bool, int, float, str))
+            ]
+        for name in columns:
+            self.column(name)
+
+    @property
+    def item_class(self) -> Type[BaseItemClass]:
+        return self._item_class
+
+    @property
+    def columns(self) -> List[str]:
+        """Names of the columns built so far."""
+        return list(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[BaseItemClass]:
+        from_dict = self._item_class.from_dict
+        for row in self._rows:
+            yield from_dict(row, lazy=True)
+
+    def __getitem__(self, idx: int) -> BaseItemClass:
+        return self._item_class.from_dict(self._rows[idx], lazy=True)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} of {len(self)} {self._item_class.__name__}>"
+
+    def to_list(self) -> List[BaseItemClass]:
+        """Return the items as a list."""
+        return list(self)
+
+    def write_json_array(self, fp: IO[str]) -> int:
+        """Write the items as a json array, one item at a time. Returns the number of items written."""
+        return write_json_array(self, fp)
+
+    def write_ndjson(self, fp: IO[str]) -> int:
+        """Write the items as newline delimited json, one item per line. Returns the number of items written."""
+        return write_ndjson(self, fp)
+
+    def _default(self, name: str) -> Any:
+        """Default value of a column, from the item model for top level fields."""
+        idx = self._item_class._fields.get(name)
+        return self._item_class._defaults[idx] if idx is not None else None
+
+    def _values(self, name: str) -> List[Any]:
+        """Read the values of a field from the raw data of each item."""
+        default = self._default(name)
+        if "." not in name:
+            return [row.get(name, default) for row in self._rows]
+
+        values = []
+        path = name.split(".")
+        for row in self._rows:
+            value: Any = row
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            values.append(default if value is None else value)
+        return values
+
+    def column(self, name: str) -> Column:
+        """Return the values of a field for all items, building the column if needed.
+
+        Args:
+            name (str): Field name, nested fields can be specified with a dotted name
+        Returns:
+            A NumPy array if available, or an array or list
+        """
+        col = self._columns.get(name)
+        if col is None:
+            col = self._columns[name] = self._build_column(self._values(name))
+        return col
+
+    def _build_column(self, values: List[Any]) -> Column:
+        """Store values in the most compact container available for their type."""
+        kinds = {type(value) for value in values}
+        if np is not None:
+            if kinds and kinds <= {bool, int, float}:
+                try:
+                    return np.array(values)
+                except OverflowError:
+                    pass
+            col = np.empty(len(values), dtype=object)
+            col[:] = values
+            return col
+        if kinds == {int}:
+            try:
+                return array("q", values)
+            except OverflowError:
+                pass
+        elif kinds and kinds <= {int, float}:
+            return array("d", values)
+        return values
+
+    def _take(self, indices: Iterable[int]) -> "ItemCollection[BaseItemClass]":
+        """Build a new collection with the items at the given indices."""
+        if np is not None:
+            idx_array = indices if isinstance(indices, np.ndarray) else np.array(list(indices), dtype=np.intp)
+            columns = {name: col[idx_array] for name, col in self._columns.items()}
+            indices = idx_array.tolist()
+        else:
+            indices = list(indices)
+            columns = {name: self._build_column([col[i] for i in indices]) for name, col in self._columns.items()}
+        rows = self._rows
+        subset: ItemCollection[BaseItemClass] = ItemCollection.__new__(ItemCollection)
+        subset._item_class = self._item_class
+        subset._rows = [rows[i] for i in indices]
+        subset._columns = columns
+        return subset
+
+    def mask(self, name: str, op: str, value: Any) -> Column:
+        """Compare a column to a value. Missing values never match <, <=, > and >=.
+
+        Args:
+            name (str): Column name
+            op (str): Comparison operator, one of ==, !=, <, <=, >, >=, in, not in
+            value (Any): Value to compare to. A collection of values for 'in' and 'not in'.
+        Returns:
+            A sequence of booleans, one per item
+        """
+        col = self.column(name)
+        if op in ("in", "not in"):
+            if np is not None:
+                values = np.empty(len(value), dtype=object)
+                values[:] = list(value)
+                res = np.isin(col, values)
+                return ~res if op == "not in" else res
+            values = set(value)
+            return [(v in values) == (op == "in") for v in col]
+        if op not in OPERATORS:
+            raise CliArrError(f"Invalid operator '{op}'")
+        compare = OPERATORS[op]
+        if np is not None and col.dtype != object:
+            return compare(col, value)
+        if op in ORDERED_OPERATORS:
+            matches = [v is not None and compare(v, value) for v in col]
+        else:
+            matches = [compare(v, value) for v in col]
+        return np.array(matches, dtype=bool) if np is not None else matches
+
+    def filter(self, mask: Column) -> "ItemCollection[BaseItemClass]":
+        """Return a new collection with the items for which mask is True.
+
+        Args:
+            mask (Column): A sequence of booleans, one per item, e.g. as returned by mask()
+        """
+        if len(mask) != len(self):
+            raise CliArrError(f"Mask size {len(mask)} differs from collection size {len(self)}")
+        if np is not None:
+            return self._take(np.flatnonzero(np.asarray(mask, dtype=bool)))
+        return self._take(idx for idx, keep in enumerate(mask) if keep)
+
+    def where(self, name: str, op: str, value: Any) -> "ItemCollection[BaseItemClass]":
+        """Return a new collection with the items matching the condition, see mask()."""
+        return self.filter(self.mask(name, op, value))
+
+    def sort(self, name: str, reverse: bool = False) -> "ItemCollection[BaseItemClass]":
+        """Return a new collection sorted on a column. The sort is stable, missing values are sorted last."""
+        col = self.column(name)
+        if np is not None and col.dtype != object:
+            if not reverse:
+                return self._take(np.argsort(col, kind="stable"))
+            # Reversing an ascending order would also reverse equal values, sort the reversed column instead
+            return self._take((len(col) - 1 - np.argsort(col[::-1], kind="stable"))[::-1])
+        present = [idx for idx in range(len(col)) if col[idx] is not None]
+        missing = [idx for idx in range(len(col)) if col[idx] is None]
+        return self._take(sorted(present, key=col.__getitem__, reverse=reverse) + missing)
+
+    def group_by(self, name: str) -> Dict[Any, "ItemCollection[BaseItemClass]"]:
+        """Split the collection in groups of items having the same value for a column.
+
+        Values must be hashable.
+        Returns:
+            A collection for each value, indexed by value
+        """
+        col = self.column(name)
+        groups: Dict[Any, List[int]] = {}
+        values = col.tolist() if np is not None else col
+        for idx, value in enumerate(values):
+            groups.setdefault(value, []).append(idx)
+        return {value: self._take(indices) for value, indices in groups.items()}
+
+    def sum(self, name: str) -> Any:
+        """Sum the values of a numeric column, missing values are ignored."""
+        col = self.column(name)
+        if np is not None and col.dtype != object:
+            return col.sum().item()
+        return sum(v for v in col if v is not None)
@@ -0,0 +1,159 @@
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from pycliarr.api.base_api import BaseCliApiItem, value_digest
+
+# Size in bytes of the item content hashes
+HASH_SIZE = 16
+
+
+def _content(item: BaseCliApiItem, ignore: Iterable[str] = ()) -> List[Any]:
+    """Values of an item compared by the diff: model fields in layout order, then extra attributes."""
+    values = item._hydrate()
+    if ignore:
+        skipped = {item._fields[name] for name in ignore if name in item._fields}
+        values = [value for idx, value in enumerate(values) if idx not in skipped]
+    if item._extra:
+        values = values + sorted((k, v) for k, v in item._extra.items() if k not in ignore)
+    return values
+
+
+def _item_key(item: BaseCliApiItem, key: str) -> Any:
+    """Value of the key field of an item, read from the item values when it is a model field."""
+    idx = item._fields.get(key)
+    return item._hydrate()[idx] if idx is not None else getattr(item, key)
+
+
+def item_hash(item: BaseCliApiItem, ignore: Iterable[str] = ()) -> str:
+    """Return a hash of the content of an item.
+
+    Hashes are stable across runs, they can be persisted to detect changes later without keeping the items.
+    Dict values are hashed in their key order, as returned by the server.
+
+    Args:
+        item (BaseCliApiItem): Item to hash
+        ignore (Iterable[str]): Fields not taken into account
+    Returns:
+        The hash as an hexadecimal string
+    """
+    return value_digest(_content(item, ignore), HASH_SIZE).hex()
+
+
+def hash_items(items: Iterable[BaseCliApiItem], key: str = "id", ignore: Iterable[str] = ()) -> Dict[Any, str]:
+    """Return the content hash of each item, indexed by item key. See item_hash()."""
+    ignore = tuple(ignore)
+    return {_item_key(item, key): item_hash(item, ignore) for item in items}
+
+
+class ItemChange:
+    """Change of an item present in both sides of a diff."""
+
+    def __init__(
+        self, key: Any, old: Optional[BaseCliApiItem], new: BaseCliApiItem, fields: Dict[str, Tuple[Any, Any]]
+    ) -> None:
+        """Build a change.
+
+        Args:
+            key (Any): Key of the item
+            old (Optional[BaseCliApiItem]): Previous item, None if only its hash was known
+            new (BaseCliApiItem): Current item
+            fields (Dict[str, Tuple[Any, Any]]): Old and new value of each changed field, empty if the old item is
+                not known
+        """
+        self.key = key
+        self.old = old
+        self.new = new
+        self.fields = fields
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.key}: {sorted(self.fields)}>"
+
+
+class ItemsDiff:
+    """Result of a diff between two sets of items."""
+
+    def __init__(self) -> None:
+        self.added: List[BaseCliApiItem] = []
+        self.removed: List[Any] = []
+        self.modified: List[ItemChange] = []
+        self.unchanged = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} added={len(self.added)} removed={len(self.removed)}"
+            f" modified={len(self.modified)} unchanged={self.unchanged}>"
+        )
+
+
+def _field_changes(old: BaseCliApiItem, new: BaseCliApiItem, ignore: Iterable[str]) -> Dict[str, Tuple[Any, Any]]:
+    old_data = old.to_dict()
+    new_data = new.to_dict()
+    return {
+        name: (old_data.get(name), new_data.get(name))
+        for name in list(old_data) + [name for name in new_data if name not in old_data]
+        if name not in ignore and old_data.get(name) != new_data.get(name)
+    }
+
+
+def diff_items(
+    old: Union[Iterable[BaseCliApiItem], Mapping[Any, str]],
+    new: Iterable[BaseCliApiItem],
+    key: str = "id",
+    ignore: Iterable[str] = (),
+) -> ItemsDiff:
+    """Compare two sets of items, matched by key.
+
+    The old side can be the items of a previous fetch, or only their hashes as returned by hash_items().
+    With items, unchanged items are detected by comparing their values directly, which is faster than hashing,
+    and modified items report their changed fields. With hashes, only the new items are hashed, and the changed
+    fields are not known.
+
+    Args:
+        old (Union[Iterable[BaseCliApiItem], Mapping[Any, str]]): Previous items, or their hashes indexed by key
+        new (Iterable[BaseCliApiItem]): Current items
+        key (str): Field identifying an item. Default is id.
+        ignore (Iterable[str]): Fields not taken into account, e.g. statistics that change often
+    Returns:
+        The items added, the removed items (or keys if old is a hash mapping), the changes of the modified items
+        and the number of unchanged items.
+    """
+    ignore = tuple(ignore)
+    diff = ItemsDiff()
+    if isinstance(old, Mapping):
+        seen = set()
+        for item in new:
+            item_key = _item_key(item, key)
+            seen.add(item_key)
+            old_hash = old.get(item_key)
+            if old_hash is None:
+                diff.added.append(item)
+            elif old_hash == item_hash(item, ignore):
+                diff.unchanged += 1
+            else:
+                diff.modified.append(ItemChange(item_key, None, item, {}))
+        diff.removed.extend(item_key for item_key in old if item_key not in seen)
+        return diff
+
+    old_items = {_item_key(item, key): item for item in old}
+    for item in new:
+        item_key = _item_key(item, key)
+        old_item = old_items.pop(item_key, None)
+        if old_item is None:
+            diff.added.append(item)
+        elif type(old_item) is type(item) and (
+            old_item._hydrate() == item._hydrate()
+            and not (old_item._extra or item._extra)
+            and not ignore
+            or _content(old_item, ignore) == _content(item, ignore)
+        ):
+            diff.unchanged += 1
+        else:
+            changes = _field_changes(old_item, item, ignore)
+            if changes:
+                diff.modified.append(ItemChange(item_key, old_item, item, changes))
+            else:
+                diff.unchanged += 1
+    diff.removed.extend(old_items.values())
+    return diff
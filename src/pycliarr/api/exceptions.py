@@ -6,6 +6,10 @@ class CliDecodeError(CliArrError):
     pass
 
 
+class CliConnectionError(CliArrError):
+    pass
+
+
 class CliServerError(CliArrError):
     def __init__(self, message: str, status_code: int, response: str):
         self.status_code = status_code
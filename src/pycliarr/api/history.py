@@ -0,0 +1,85 @@
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from pycliarr.api.base_api import json_dict
+from pycliarr.api.exceptions import CliArrError
+
+log = logging.getLogger(__name__)
+
+
+class HistoryCheckpoint:
+    """High-water mark of a history sync: the newest history record already returned.
+
+    History record ids increase as events are recorded, so the records newer than the checkpoint are the ones
+    with a greater id.
+    """
+
+    version = 1
+
+    def __init__(
+        self, last_id: int = 0, last_date: str = "", source: str = "", updated: Optional[float] = None
+    ) -> None:
+        """Build a checkpoint.
+
+        Args:
+            last_id (int): Id of the newest record returned, 0 if none
+            last_date (str): Date of the newest record returned
+            source (str): Host url the history is read from
+            updated (Optional[float]): Timestamp of the last checkpoint update. Default is now.
+        """
+        self.last_id = last_id
+        self.last_date = last_date
+        self.source = source
+        self.updated = updated if updated is not None else time.time()
+
+    def is_new(self, record: json_dict) -> bool:
+        """Return True if a history record is newer than the checkpoint."""
+        return int(record.get("id") or 0) > self.last_id
+
+    def advance(self, record: json_dict) -> None:
+        """Move the checkpoint to a history record, if it is newer."""
+        if self.is_new(record):
+            self.last_id = int(record["id"])
+            self.last_date = record.get("date", "")
+            self.updated = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "lastId": self.last_id,
+            "lastDate": self.last_date,
+            "source": self.source,
+            "updated": self.updated,
+        }
+
+    @classmethod
+    def from_dict(cls, dict_data: Dict[str, Any]) -> "HistoryCheckpoint":
+        if dict_data.get("version") != cls.version:
+            raise CliArrError(f"Unsupported history checkpoint version: {dict_data.get('version')}")
+        return cls(
+            dict_data["lastId"],
+            last_date=dict_data.get("lastDate", ""),
+            source=dict_data.get("source", ""),
+            updated=dict_data.get("updated"),
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the checkpoint to a file. The file is replaced atomically."""
+        tmp_path = Path(f"{path}.tmp")
+        with open(tmp_path, "w") as checkpoint_file:
+            json.dump(self.to_dict(), checkpoint_file)
+        os.replace(tmp_path, path)
+        log.debug("History checkpoint %d saved to %s", self.last_id, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "HistoryCheckpoint":
+        """Read a checkpoint from a file."""
+        try:
+            with open(path, "r") as checkpoint_file:
+                return cls.from_dict(json.load(checkpoint_file))
+        except (OSError, ValueError, KeyError) as e:
+            raise CliArrError(f"Unable to load history checkpoint {path}: {e}")
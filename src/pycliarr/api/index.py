@@ -0,0 +1,209 @@
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pycliarr.api.base_api import BaseCliApiItem, json_dict
+from pycliarr.api.exceptions import CliArrError, CliDecodeError
+
+log = logging.getLogger(__name__)
+
+# File layout:
+#   header
+#   id records, sorted by id: item id, offset and size of the item json data
+#   title records, sorted by title key: offset and size of the title key, index of the item id record
+#   title keys: casefolded titles encoded in utf-8
+#   items json data
+INDEX_MAGIC = b"PYCLIIDX"
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<8sBxxxIdQQQ")
+ID_RECORD = struct.Struct("<qQI")
+TITLE_RECORD = struct.Struct("<QHI")
+
+
+def _title_key(title: str) -> bytes:
+    """Key used to sort and search titles, case insensitive."""
+    return title.casefold().encode("utf-8")[: 2**16 - 1]
+
+
+class LibraryIndex:
+    """Read only on-disk index of the library items, searchable by id or title prefix.
+
+    The index file is memory-mapped, and lookups binary search fixed size records, so only the few pages holding
+    the records visited and the data of the items found are read from disk.
+
+    Example:
+        LibraryIndex.build("/tmp/movies.idx", radarr.get_item())
+        with LibraryIndex("/tmp/movies.idx") as index:
+            movie = index.get(123)
+            matches = index.search_title("the matrix")
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Open an index file.
+
+        Args:
+            path (Union[str, Path]): Index file path, as written by build()
+        """
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as index_file:
+                self._mm = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise CliArrError(f"Unable to open index {path}: {e}")
+        if len(self._mm) < INDEX_HEADER.size:
+            self.close()
+            raise CliDecodeError(f"Invalid index {path}: file too short")
+        magic, version, count, created, titles_offset, keys_offset, data_offset = INDEX_HEADER.unpack_from(self._mm)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self.close()
+            raise CliDecodeError(f"Invalid index {path}: unsupported format")
+        self._count = count
+        self.created = created
+        self._titles_offset = titles_offset
+
+    @classmethod
+    def build(
+        cls,
+        path: Union[str, Path],
+        items: Iterable[Union[json_dict, BaseCliApiItem]],
+        created: Optional[float] = None,
+    ) -> int:
+        """Write an index of the given items. The file is replaced atomically.
+
+        Args:
+            path (Union[str, Path]): Index file path
+            items (Iterable[Union[json_dict, BaseCliApiItem]]): Items to index, as items or json data
+            created (Optional[float]): Timestamp of the data. Default is now.
+        Returns:
+            Number of items indexed
+        """
+        entries: List[Tuple[int, bytes, bytes]] = []
+        for item in items:
+            item_data = item.to_dict() if isinstance(item, BaseCliApiItem) else item
+            entries.append(
+                (
+                    int(item_data.get("id") or 0),
+                    _title_key(item_data.get("title") or ""),
+                    json.dumps(item_data).encode(),
+                )
+            )
+        entries.sort(key=lambda entry: entry[0])
+        count = len(entries)
+        titles_offset = INDEX_HEADER.size + count * ID_RECORD.size
+        keys_offset = titles_offset + count * TITLE_RECORD.size
+        data_offset = keys_offset + sum(len(key) for _, key, _ in entries)
+
+        tmp_path = Path(f"{path}.tmp")
+        with open(tmp_path, "wb") as index_file:
+            index_file.write(
+                INDEX_HEADER.pack(
+                    INDEX_MAGIC,
+                    INDEX_VERSION,
+                    count,
+                    created if created is not None else time.time(),
+                    titles_offset,
+                    keys_offset,
+                    data_offset,
+                )
+            )
+            offset = data_offset
+            for item_id, _, data in entries:
+                index_file.write(ID_RECORD.pack(item_id, offset, len(data)))
+                offset += len(data)
+
+            key_offsets = []
+            offset = keys_offset
+            for _, key, _ in entries:
+                key_offsets.append(offset)
+                offset += len(key)
+            for idx in sorted(range(count), key=lambda idx: entries[idx][1]):
+                index_file.write(TITLE_RECORD.pack(key_offsets[idx], len(entries[idx][1]), idx))
+
+            for _, key, _ in entries:
+                index_file.write(key)
+            for _, _, data in entries:
+                index_file.write(data)
+        os.replace(tmp_path, path)
+        log.debug("%d items indexed in %s", count, path)
+        return count
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def __enter__(self) -> "LibraryIndex":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def age(self) -> float:
+        """Age of the indexed data in seconds."""
+        return time.time() - self.created
+
+    def is_stale(self, max_age: float) -> bool:
+        """Return True if the indexed data is older than max_age seconds."""
+        return self.age > max_age
+
+    def _id_record(self, idx: int) -> Tuple[int, int, int]:
+        return ID_RECORD.unpack_from(self._mm, INDEX_HEADER.size + idx * ID_RECORD.size)  # type: ignore
+
+    def _title_record(self, idx: int) -> Tuple[bytes, int]:
+        """Return the title key and the id record index of a title record."""
+        key_offset, key_size, id_idx = TITLE_RECORD.unpack_from(self._mm, self._titles_offset + idx * TITLE_RECORD.size)
+        return self._mm[key_offset : key_offset + key_size], id_idx
+
+    def _data(self, idx: int) -> json_dict:
+        _, offset, size = self._id_record(idx)
+        return json.loads(self._mm[offset : offset + size])  # type: ignore
+
+    def get(self, item_id: int) -> Optional[json_dict]:
+        """Return the data of an item, or None if not found."""
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            mid_id = self._id_record(mid)[0]
+            if mid_id < item_id:
+                low = mid + 1
+            elif mid_id > item_id:
+                high = mid
+            else:
+                return self._data(mid)
+        return None
+
+    def search_title(self, prefix: str, limit: Optional[int] = None) -> List[json_dict]:
+        """Return the items whose title starts with prefix, case insensitive, sorted by title.
+
+        Args:
+            prefix (str): Beginning of the title
+            limit (Optional[int]): Maximum number of items returned, all by default
+        """
+        key = _title_key(prefix)
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._title_record(mid)[0] < key:
+                low = mid + 1
+            else:
+                high = mid
+
+        res: List[json_dict] = []
+        for idx in range(low, self._count):
+            title_key, id_idx = self._title_record(idx)
+            if not title_key.startswith(key) or (limit is not None and len(res) >= limit):
+                break
+            res.append(self._data(id_idx))
+        return res
+
+    def __iter__(self) -> Iterator[json_dict]:
+        """Iterate over the data of all items, sorted by id."""
+        for idx in range(self._count):
+            yield self._data(idx)
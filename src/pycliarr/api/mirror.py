@@ -0,0 +1,351 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Type, Union, cast
+
+from pycliarr.api.base_api import BaseCliApiItem, json_dict, json_list
+from pycliarr.api.base_media import BaseCliMediaApi
+from pycliarr.api.diff import HASH_SIZE
+from pycliarr.api.exceptions import CliArrError
+from pycliarr.api.radarr import RadarrCli, RadarrMovieItem
+from pycliarr.api.sonarr import SonarrCli, SonarrSerieItem
+
+log = logging.getLogger(__name__)
+
+MIRROR_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    title TEXT,
+    sort_title TEXT,
+    monitored INTEGER,
+    size_on_disk INTEGER,
+    quality_profile_id INTEGER,
+    added TEXT,
+    signature TEXT NOT NULL,
+    episodes_signature TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_sort_title ON items (sort_title);
+CREATE TABLE IF NOT EXISTS item_tags (
+    item_id INTEGER NOT NULL,
+    tag_id INTEGER NOT NULL,
+    PRIMARY KEY (item_id, tag_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS item_tags_tag ON item_tags (tag_id);
+CREATE TABLE IF NOT EXISTS episodes (
+    id INTEGER PRIMARY KEY,
+    series_id INTEGER NOT NULL,
+    season_number INTEGER,
+    episode_number INTEGER,
+    monitored INTEGER,
+    has_file INTEGER,
+    air_date_utc TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS episodes_series ON episodes (series_id, season_number, episode_number);
+CREATE TABLE IF NOT EXISTS tags (id INTEGER PRIMARY KEY, label TEXT, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS quality_profiles (id INTEGER PRIMARY KEY, name TEXT, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS root_folders (id INTEGER PRIMARY KEY, path TEXT, data TEXT NOT NULL);
+"""
+
+
+def _signature(data: Any) -> str:
+    """Hash of json data, stable across runs."""
+    encoded = json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=HASH_SIZE).hexdigest()
+
+
+def _episodes_signature(item: json_dict) -> str:
+    """Hash of the serie data that changes when its episodes change: statistics of the serie and its seasons."""
+    return _signature([item.get("statistics"), [season.get("statistics") for season in item.get("seasons") or []]])
+
+
+class MirrorRefresh:
+    """Result of a mirror refresh."""
+
+    def __init__(self) -> None:
+        self.added = 0
+        self.updated = 0
+        self.removed = 0
+        self.unchanged = 0
+        self.episodes_refreshed = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__} added={self.added} updated={self.updated} removed={self.removed}"
+            f" unchanged={self.unchanged} episodes_refreshed={self.episodes_refreshed}>"
+        )
+
+
+class LibraryMirror:
+    """Local SQLite copy of a server library, refreshed incrementally and queried without contacting the server.
+
+    The mirror stores the items (movies or series), the episodes of the series, the tags, quality profiles and
+    root folders. Items are stored as json along with the columns used by the query helpers, and only the items
+    whose content changed are written on refresh. Episodes are only fetched again for the series whose statistics
+    changed.
+
+    Example:
+        with LibraryMirror(sonarr, "/tmp/sonarr.db") as mirror:
+            mirror.refresh()
+            for serie in mirror.items(tag=3, monitored=True):
+                episodes = mirror.episodes(serie["id"], has_file=False)
+    """
+
+    def __init__(self, cli: BaseCliMediaApi, path: Union[str, Path]) -> None:
+        """Open a mirror, creating the database if needed.
+
+        Args:
+            cli (BaseCliMediaApi): Client used to refresh the mirror
+            path (Union[str, Path]): Database file
+        """
+        self._cli = cli
+        self.path = Path(path)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.row_factory = sqlite3.Row
+        with self._db:
+            self._db.executescript(_SCHEMA)
+        version = self._meta("version")
+        if version and int(version) != MIRROR_VERSION:
+            self.close()
+            raise CliArrError(f"Unsupported mirror version {version} in {path}")
+        source = self._meta("source")
+        if source and source != cli.host_url:
+            self.close()
+            raise CliArrError(f"Mirror {path} was created for {source}, not {cli.host_url}")
+
+    @property
+    def item_class(self) -> Type[BaseCliApiItem]:
+        """Class of the items returned by get_item()."""
+        if isinstance(self._cli, SonarrCli):
+            return SonarrSerieItem
+        if isinstance(self._cli, RadarrCli):
+            return RadarrMovieItem
+        return BaseCliApiItem
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "LibraryMirror":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @property
+    def refreshed(self) -> Optional[float]:
+        """Timestamp of the last refresh, None if never refreshed."""
+        value = self._meta("refreshed")
+        return float(value) if value else None
+
+    @property
+    def age(self) -> float:
+        """Age of the mirrored data in seconds, infinite if never refreshed."""
+        refreshed = self.refreshed
+        return time.time() - refreshed if refreshed is not None else float("inf")
+
+    def is_stale(self, max_age: float) -> bool:
+        """Return True if the mirrored data is older than max_age seconds."""
+        return self.age > max_age
+
+    ##############################################
+    ################## refresh ###################
+    ##############################################
+    def refresh(self) -> MirrorRefresh:
+        """Fetch the library from the server and update the mirror with the changes.
+
+        Returns:
+            The number of items added, updated, removed and unchanged, and of series whose episodes were fetched
+        """
+        cli = self._cli
+        report = MirrorRefresh()
+        items = cast(json_list, cli.request_get(cli.api_url_item))
+        known = {
+            row[0]: (row[1], row[2]) for row in self._db.execute("SELECT id, signature, episodes_signature FROM items")
+        }
+        with_episodes = isinstance(cli, SonarrCli)
+
+        with self._db:
+            for item in items:
+                item_id = item["id"]
+                signature = _signature(item)
+                episodes_signature = _episodes_signature(item) if with_episodes else None
+                previous = known.pop(item_id, None)
+                if previous and previous[0] == signature:
+                    report.unchanged += 1
+                    continue
+                if previous:
+                    report.updated += 1
+                else:
+                    report.added += 1
+                self._store_item(item, signature, episodes_signature)
+                if with_episodes and (not previous or previous[1] != episodes_signature):
+                    self._store_episodes(item_id, cast(json_list, cast(SonarrCli, cli).get_episode(item_id)))
+                    report.episodes_refreshed += 1
+
+            removed = [(item_id,) for item_id in known]
+            self._db.executemany("DELETE FROM items WHERE id = ?", removed)
+            self._db.executemany("DELETE FROM item_tags WHERE item_id = ?", removed)
+            self._db.executemany("DELETE FROM episodes WHERE series_id = ?", removed)
+            report.removed = len(removed)
+
+            self._replace(
+                "tags", ("id", "label"), cast(json_list, cli.request_get(f"{cli.api_url_tag}/")), ("id", "label")
+            )
+            self._replace(
+                "quality_profiles",
+                ("id", "name"),
+                cast(json_list, cli.request_get(cli.api_url_profile)),
+                ("id", "name"),
+            )
+            self._replace(
+                "root_folders", ("id", "path"), cast(json_list, cli.request_get(cli.api_url_rootfolder)), ("id", "path")
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [("version", str(MIRROR_VERSION)), ("source", cli.host_url), ("refreshed", str(time.time()))],
+            )
+        log.debug("Mirror %s refreshed: %s", self.path, report)
+        return report
+
+    def _store_item(self, item: json_dict, signature: str, episodes_signature: Optional[str]) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO items"
+            " (id, title, sort_title, monitored, size_on_disk, quality_profile_id, added, signature,"
+            " episodes_signature, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                item["id"],
+                item.get("title"),
+                item.get("sortTitle"),
+                item.get("monitored"),
+                item.get("sizeOnDisk", (item.get("statistics") or {}).get("sizeOnDisk")),
+                item.get("qualityProfileId"),
+                item.get("added"),
+                signature,
+                episodes_signature,
+                json.dumps(item),
+            ),
+        )
+        self._db.execute("DELETE FROM item_tags WHERE item_id = ?", (item["id"],))
+        self._db.executemany(
+            "INSERT OR IGNORE INTO item_tags (item_id, tag_id) VALUES (?, ?)",
+            [(item["id"], tag_id) for tag_id in item.get("tags") or []],
+        )
+
+    def _store_episodes(self, series_id: int, episodes: json_list) -> None:
+        self._db.execute("DELETE FROM episodes WHERE series_id = ?", (series_id,))
+        self._db.executemany(
+            "INSERT OR REPLACE INTO episodes"
+            " (id, series_id, season_number, episode_number, monitored, has_file, air_date_utc, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    episode["id"],
+                    series_id,
+                    episode.get("seasonNumber"),
+                    episode.get("episodeNumber"),
+                    episode.get("monitored"),
+                    episode.get("hasFile"),
+                    episode.get("airDateUtc"),
+                    json.dumps(episode),
+                )
+                for episode in episodes
+            ],
+        )
+
+    def _replace(self, table: str, columns: Tuple[str, str], rows: json_list, keys: Tuple[str, str]) -> None:
+        """Replace the content of a small table."""
+        self._db.execute(f"DELETE FROM {table}")
+        self._db.executemany(
+            f"INSERT INTO {table} ({columns[0]}, {columns[1]}, data) VALUES (?, ?, ?)",
+            [(row.get(keys[0]), row.get(keys[1]), json.dumps(row)) for row in rows],
+        )
+
+    ##############################################
+    ################### queries ##################
+    ##############################################
+    def _load(self, sql: str, params: Sequence[Any] = ()) -> List[json_dict]:
+        return [json.loads(row[0]) for row in self._db.execute(sql, params)]
+
+    def get(self, item_id: int) -> Optional[json_dict]:
+        """Return the data of an item, or None if not found."""
+        row = self._db.execute("SELECT data FROM items WHERE id = ?", (item_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_item(self, item_id: int) -> Optional[BaseCliApiItem]:
+        """Return an item, as returned by get_movie() or get_serie(), or None if not found."""
+        data = self.get(item_id)
+        return self.item_class.from_dict(data) if data is not None else None
+
+    def items(
+        self,
+        tag: Optional[int] = None,
+        monitored: Optional[bool] = None,
+        quality_profile_id: Optional[int] = None,
+    ) -> List[json_dict]:
+        """Return the data of the items matching all the conditions specified, sorted by title.
+
+        Args:
+            tag (Optional[int]): Id of a tag the items must have
+            monitored (Optional[bool]): Monitored status of the items
+            quality_profile_id (Optional[int]): Quality profile of the items
+        """
+        conditions, params = self._conditions(
+            [
+                ("id IN (SELECT item_id FROM item_tags WHERE tag_id = ?)", tag),
+                ("monitored = ?", monitored),
+                ("quality_profile_id = ?", quality_profile_id),
+            ]
+        )
+        return self._load(f"SELECT data FROM items {conditions} ORDER BY sort_title, id", params)
+
+    def episodes(
+        self, series_id: int, season: Optional[int] = None, has_file: Optional[bool] = None
+    ) -> List[json_dict]:
+        """Return the episodes of a serie, sorted by season and episode number.
+
+        Args:
+            series_id (int): Id of the serie
+            season (Optional[int]): Season number, all seasons by default
+            has_file (Optional[bool]): Only the episodes downloaded, or not downloaded
+        """
+        conditions, params = self._conditions(
+            [("series_id = ?", series_id), ("season_number = ?", season), ("has_file = ?", has_file)]
+        )
+        return self._load(f"SELECT data FROM episodes {conditions} ORDER BY season_number, episode_number", params)
+
+    def tags(self) -> List[json_dict]:
+        return self._load("SELECT data FROM tags ORDER BY id")
+
+    def quality_profiles(self) -> List[json_dict]:
+        return self._load("SELECT data FROM quality_profiles ORDER BY id")
+
+    def root_folders(self) -> List[json_dict]:
+        return self._load("SELECT data FROM root_folders ORDER BY id")
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        """Run a read query on the mirror database, e.g. for reports not covered by the helpers.
+
+        Args:
+            sql (str): SQL query, the tables are items, item_tags, episodes, tags, quality_profiles and root_folders
+            params (Sequence[Any]): Query parameters
+        """
+        return self._db.execute(sql, params).fetchall()
+
+    @staticmethod
+    def _conditions(conditions: Iterable[Tuple[str, Any]]) -> Tuple[str, List[Any]]:
+        """Build a WHERE clause from the conditions whose value is not None."""
+        used = [(condition, value) for condition, value in conditions if value is not None]
+        if not used:
+            return "", []
+        return "WHERE " + " AND ".join(condition for condition, _ in used), [value for _, value in used]
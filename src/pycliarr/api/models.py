@@ -0,0 +1,372 @@
+import json
+from copy import copy
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_type_hints,
+)
+
+from pycliarr.api.base_api import BaseCliApiItem
+from pycliarr.api.exceptions import CliArrError
+from pycliarr.api.radarr import RadarrMovieItem
+from pycliarr.api.sonarr import SonarrSerieItem
+
+ModelClass = TypeVar("ModelClass", bound="TypedModel")
+
+# Marker for arguments not provided
+_MISSING = object()
+
+
+class TypedModel:
+    """Base class of typed models.
+
+    Typed models are slotted classes with one attribute per field, declared with type annotations. They are built by
+    the ``typed_model`` decorator, which generates their ``__init__``, ``from_dict`` and ``to_dict`` methods.
+    Fields annotated with another typed model, or a list or dict of them, are converted recursively.
+
+    Models built from a dict keep the keys they don't declare, and remember the fields missing from the dict, so that
+    ``to_dict`` returns the same data: undeclared keys are added back and fields still missing are not written.
+    """
+
+    # Keys of the dict the model was built from that are not model fields, and model fields missing from it
+    __slots__ = ("_extra", "_absent")
+    _extra: Optional[Dict[str, Any]]
+    _absent: Optional[FrozenSet[str]]
+
+    _field_names: ClassVar[Tuple[str, ...]] = ()
+    _item_class: ClassVar[Optional[Type[BaseCliApiItem]]] = None
+
+    if TYPE_CHECKING:  # pragma: no cover
+        # Methods generated by typed_model
+
+        def __init__(self, **kwargs: Any) -> None:
+            """Build a model from field values, missing fields get their default value."""
+
+        @classmethod
+        def from_dict(cls: Type[ModelClass], dict_data: Dict[str, Any]) -> ModelClass:
+            """Build a model from its dict representation."""
+
+        def to_dict(self) -> Dict[str, Any]:
+            """Return the dict representation of the model."""
+
+    def __new__(cls: Type[ModelClass], *args: Any, **kwargs: Any) -> ModelClass:
+        if cls is TypedModel or "_field_names" not in cls.__dict__:
+            raise TypeError(f"{cls.__name__} must be decorated with typed_model")
+        return super().__new__(cls)  # type: ignore
+
+    @classmethod
+    def from_dicts(cls: Type[ModelClass], dict_list: List[Dict[str, Any]]) -> List[ModelClass]:
+        from_dict = cls.from_dict
+        return [from_dict(dict_data) for dict_data in dict_list]
+
+    @classmethod
+    def from_json(cls: Type[ModelClass], json_data: str) -> ModelClass:
+        return cls.from_dict(json.loads(json_data))
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_item(cls: Type[ModelClass], item: BaseCliApiItem) -> ModelClass:
+        """Build a model from an item."""
+        return cls.from_dict(item.to_dict())
+
+    def to_item(self) -> BaseCliApiItem:
+        """Build the item corresponding to this model, e.g. to use it with the api clients."""
+        if not self._item_class:
+            raise CliArrError(f"{self.__class__.__name__} has no item class")
+        return self._item_class.from_dict(self.to_dict())
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return (self._extra or {}) == (other._extra or {}) and all(
+            getattr(self, name) == getattr(other, name) for name in self._field_names
+        )
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._field_names)
+        return f"{self.__class__.__name__}({fields})"
+
+
+def _is_model(field_type: Any) -> bool:
+    return isinstance(field_type, type) and issubclass(field_type, TypedModel)
+
+
+def _field_codec(name: str, field_type: Any) -> Tuple[Optional[str], Optional[str]]:
+    """Return expressions converting a field value from and to its dict representation.
+
+    The value is named v when decoding, and is substituted to {v} in the encoding template.
+
+    Returns None for values used as is.
+    """
+    origin = getattr(field_type, "__origin__", None)
+    args: Tuple[Any, ...] = getattr(field_type, "__args__", ())
+    if origin is Union and len(args) == 2 and type(None) in args:
+        field_type = args[0] if args[1] is type(None) else args[1]
+        origin = getattr(field_type, "__origin__", None)
+        args = getattr(field_type, "__args__", ())
+
+    if _is_model(field_type):
+        return f"_t_{name}.from_dict(v) if v else None", "{v}.to_dict()"
+    if origin is list and args and _is_model(args[0]):
+        return f"[_t_{name}.from_dict(x) for x in v]", "[x.to_dict() for x in {v}]"
+    if origin is dict and len(args) == 2 and _is_model(args[1]):
+        return f"{{k: _t_{name}.from_dict(x) for k, x in v.items()}}", "{{k: x.to_dict() for k, x in {v}.items()}}"
+    return None, None
+
+
+def _model_type(field_type: Any) -> Any:
+    """Return the typed model class referenced by a field type."""
+    if _is_model(field_type):
+        return field_type
+    for arg in getattr(field_type, "__args__", ()):
+        if _model_type(arg):
+            return _model_type(arg)
+    return None
+
+
+def typed_model(
+    item_class: Optional[Type[BaseCliApiItem]] = None,
+) -> Callable[[Type[ModelClass]], Type[ModelClass]]:
+    """Class decorator building a slotted typed model from a class with annotated fields.
+
+    Args:
+        item_class (Optional[Type[BaseCliApiItem]]): Item class the model represents. The model must declare the
+            same fields as the item model, and fields with no default value in the class use the item defaults.
+    Returns:
+        The decorator
+    """
+
+    def wrap(cls: Type[ModelClass]) -> Type[ModelClass]:
+        return _build_model(cls, item_class)
+
+    return wrap
+
+
+def _build_model(cls: Type[ModelClass], item_class: Optional[Type[BaseCliApiItem]]) -> Type[ModelClass]:
+    names = list(cls.__dict__.get("__annotations__", {}))
+    hints = get_type_hints(cls)
+    item_defaults = dict(zip(item_class._fields, item_class._defaults)) if item_class else {}
+    if item_class and set(names) != set(item_defaults):
+        raise TypeError(
+            f"{cls.__name__} fields differ from {item_class.__name__} model: {set(names) ^ set(item_defaults)}"
+        )
+
+    namespace: Dict[str, Any] = {
+        "_MISSING": _MISSING,
+        "_copy": copy,
+        "_new": object.__new__,
+        "_names": frozenset(names),
+        "_defaults": {},
+    }
+    init_args, init_lines, from_lines, to_items = [], [], [], []
+    for name in names:
+        if name in cls.__dict__:
+            default = cls.__dict__[name]
+        elif name in item_defaults:
+            default = item_defaults[name]
+        else:
+            raise TypeError(f"{cls.__name__}.{name} has no default value")
+        # Value in the dict representation when a nested model field is not set
+        empty = item_defaults.get(name)
+
+        namespace[f"_d_{name}"] = namespace["_defaults"][name] = default
+        namespace[f"_e_{name}"] = empty
+        namespace[f"_t_{name}"] = _model_type(hints[name])
+        decode, encode = _field_codec(name, hints[name])
+        mutable = isinstance(default, (list, dict, set))
+        default_expr = f"_copy(_d_{name})" if mutable else f"_d_{name}"
+
+        init_args.append(f"{name}=_MISSING")
+        init_lines.append(f"    self.{name} = {default_expr} if {name} is _MISSING else {name}")
+        if decode and encode:
+            from_lines.append(f"    v = get({name!r})")
+            from_lines.append(f"    self.{name} = {default_expr} if v is None else {decode}")
+            encoded = encode.format(v=f"self.{name}")
+            empty_expr = f"_copy(_e_{name})" if isinstance(empty, (list, dict, set)) else f"_e_{name}"
+            to_items.append(f"        {name!r}: {empty_expr} if self.{name} is None else {encoded},")
+        elif mutable:
+            from_lines.append(f"    v = get({name!r}, _MISSING)")
+            from_lines.append(f"    self.{name} = {default_expr} if v is _MISSING else v")
+            to_items.append(f"        {name!r}: self.{name},")
+        else:
+            from_lines.append(f"    self.{name} = get({name!r}, _d_{name})")
+            to_items.append(f"        {name!r}: self.{name},")
+
+    source = "\n".join(
+        [f"def __init__(self, *, {', '.join(init_args)}):", *init_lines]
+        + ["    self._extra = None", "    self._absent = None"]
+        + ["def from_dict(cls, dict_data):", "    self = _new(cls)", "    get = dict_data.get", *from_lines]
+        + ["    self._extra = None if _names.issuperset(dict_data) else {"]
+        + ["        k: v for k, v in dict_data.items() if k not in _names", "    }"]
+        + ["    self._absent = _names.difference(dict_data) or None", "    return self"]
+        + ["def to_dict(self):", "    data = {", *to_items, "    }", "    if self._absent:"]
+        + ["        for name in self._absent:", "            if getattr(self, name) == _defaults[name]:"]
+        + [
+            "                del data[name]",
+            "    if self._extra:",
+            "        data.update(self._extra)",
+            "    return data",
+        ]
+    )
+    exec(source, namespace)
+
+    body = {key: value for key, value in cls.__dict__.items() if key not in names and key != "__dict__"}
+    body.update(
+        __slots__=tuple(names),
+        __init__=namespace["__init__"],
+        from_dict=classmethod(namespace["from_dict"]),
+        to_dict=namespace["to_dict"],
+        _field_names=tuple(names),
+        _item_class=item_class,
+    )
+    body.pop("__weakref__", None)
+    new_cls = type(cls.__name__, cls.__bases__, body)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls  # type: ignore
+
+
+##############################################
+############## nested models #################
+##############################################
+@typed_model()
+class Image(TypedModel):
+    coverType: str = ""
+    url: str = ""
+    remoteUrl: str = ""
+
+
+@typed_model()
+class Rating(TypedModel):
+    votes: int = 0
+    value: float = 0.0
+
+
+@typed_model()
+class RadarrRating(TypedModel):
+    votes: int = 0
+    value: float = 0.0
+    type: str = ""
+
+
+@typed_model()
+class SeasonStatistics(TypedModel):
+    previousAiring: Optional[str] = None
+    nextAiring: Optional[str] = None
+    episodeFileCount: int = 0
+    episodeCount: int = 0
+    totalEpisodeCount: int = 0
+    sizeOnDisk: int = 0
+    releaseGroups: List[str] = []
+    percentOfEpisodes: float = 0.0
+
+
+@typed_model()
+class Season(TypedModel):
+    seasonNumber: int = 0
+    monitored: bool = False
+    statistics: Optional[SeasonStatistics] = None
+
+
+@typed_model()
+class SerieStatistics(TypedModel):
+    seasonCount: int = 0
+    episodeFileCount: int = 0
+    episodeCount: int = 0
+    totalEpisodeCount: int = 0
+    sizeOnDisk: int = 0
+    releaseGroups: List[str] = []
+    percentOfEpisodes: float = 0.0
+
+
+##############################################
+################ item models #################
+##############################################
+@typed_model(RadarrMovieItem)
+class RadarrMovieModel(TypedModel):
+    """Typed model of RadarrMovieItem. Default values come from the item model."""
+
+    title: str
+    originalTitle: str
+    sortTitle: str
+    sizeOnDisk: int
+    overview: str
+    inCinemas: Optional[str]
+    physicalRelease: Optional[str]
+    status: str
+    images: List[Image]
+    website: str
+    downloaded: bool
+    year: int
+    hasFile: bool
+    youTubeTrailerId: str
+    studio: str
+    path: str
+    rootFolderPath: str
+    monitored: bool
+    minimumAvailability: str
+    isAvailable: Union[bool, str]
+    folderName: str
+    runtime: int
+    cleanTitle: str
+    imdbId: str
+    tmdbId: int
+    titleSlug: str
+    certification: str
+    genres: List[str]
+    tags: List[int]
+    added: Optional[str]
+    ratings: Dict[str, RadarrRating]
+    collection: Dict[str, Any]
+    alternateTitles: List[Dict[str, Any]]
+    qualityProfileId: int
+    secondaryYearSourceId: int
+    id: int
+
+
+@typed_model(SonarrSerieItem)
+class SonarrSerieModel(TypedModel):
+    """Typed model of SonarrSerieItem. Default values come from the item model."""
+
+    title: str
+    alternateTitles: List[Dict[str, Any]]
+    sortTitle: str
+    statistics: Optional[SerieStatistics] = None
+    status: str
+    overview: str
+    network: str
+    airTime: str
+    images: List[Image]
+    seasons: List[Season]
+    year: int
+    path: str
+    seasonFolder: bool
+    monitored: bool
+    useSceneNumbering: bool
+    runtime: int
+    tvdbId: int
+    tvRageId: int
+    tvMazeId: int
+    firstAired: str
+    seriesType: str
+    cleanTitle: str
+    imdbId: str
+    titleSlug: str
+    certification: str
+    genres: List[str]
+    tags: List[int]
+    added: str
+    ratings: Optional[Rating] = None
+    qualityProfileId: int
+    id: int
@@ -1,14 +1,24 @@
+import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, Union, cast
 
 from pycliarr.api.base_api import BaseCliApiItem, json_data, json_list
-from pycliarr.api.base_media import BaseCliMediaApi
+from pycliarr.api.base_media import EDITOR_CHUNK_SIZE, BaseCliMediaApi
+from pycliarr.api.bulk import DEFAULT_BULK_WORKERS, BulkReport
+from pycliarr.api.collection import ItemCollection
 from pycliarr.api.exceptions import RadarrCliError
+from pycliarr.api.registry import CachedRegistry, normalize_name
+
+log = logging.getLogger(__name__)
 
 
 class RadarrMovieItem(BaseCliApiItem):
     """Class for handling movie info."""
 
+    __slots__ = ()
+
+    intern_fields = ("status", "certification", "genres", "minimumAvailability", "studio", "images.coverType")
+
     def _model(self) -> Dict[Any, Any]:
         """Define the model of items represented by this class."""
         return {
@@ -80,30 +90,73 @@ class RadarrCli(BaseCliMediaApi):
     api_url_itemlookup = f"{BaseCliMediaApi.api_url_base}/movie/lookup"
     api_url_exclusions = f"{BaseCliMediaApi.api_url_base}/exclusions"
     api_url_language_profile = f"{BaseCliMediaApi.api_url_base}/languageProfile"
+    api_url_editor = f"{BaseCliMediaApi.api_url_base}/movie/editor"
+    item_ids_field = "movieIds"
 
     # Keep using v1 for commands not available in v3
     api_url_wanted_missing = "/api/wanted/missing"
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Build a radarr api client, see BaseCliMediaApi."""
+        super().__init__(*args, **kwargs)
+        self.language_profile_registry = CachedRegistry(
+            lambda: self.get_language_profiles(),
+            {"id": None, "name": normalize_name},
+            ttl=self.quality_profile_registry.ttl,
+            name="language profile",
+            refresh_on_miss=True,
+        )
+
     def get_language_profiles(self) -> json_list:
-        """Return the quality profiles"""
+        """Return the language profiles"""
         return cast(json_list, self.request_get(self.api_url_language_profile))
 
-    def get_movie(self, movie_id: Optional[int] = None) -> Union[RadarrMovieItem, List[RadarrMovieItem]]:
+    def resolve_language_profile(self, profile: Union[int, str]) -> int:
+        """Return the id of a language profile from its id or name (case insensitive).
+
+        Ids are returned as is, names are looked up in language_profile_registry.
+        """
+        if isinstance(profile, int):
+            return profile
+        if profile.isdigit():
+            return int(profile)
+        return int(self.language_profile_registry.find(profile)["id"])
+
+    def get_movie(
+        self,
+        movie_id: Optional[int] = None,
+        lazy: bool = False,
+        as_collection: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Union[RadarrMovieItem, List[RadarrMovieItem], ItemCollection[RadarrMovieItem]]:
         """Get specified movie, or all if no id provided from server collection.
 
         Args:
             movie_id (Optional[int]) ID of movie to get, all items by default
+            lazy (bool): If True, items wrap the server data and only resolve fields when accessed
+            as_collection (bool): If True, all movies are returned as an ``ItemCollection``
+            fields (Optional[Iterable[str]]): Only keep these fields, other fields are discarded once the response is
+                decoded. Items are instances of a projection of ``RadarrMovieItem``, see ``projection()``.
+                lazy is ignored when fields are specified.
         Returns:
             ``RadarrMovieItem`` if a movie id is specified, or a list of ``RadarrMovieItem``
         """
+        item_class = RadarrMovieItem.projection(fields) if fields else RadarrMovieItem
+        lazy = lazy and not fields
         res = self.get_item(movie_id)
         if isinstance(res, list):
-            return [RadarrMovieItem.from_dict(movie) for movie in res]
+            if as_collection:
+                return ItemCollection(item_class, res)
+            return item_class.from_dicts(res, lazy=lazy)
         else:
-            return RadarrMovieItem.from_dict(res)
+            return item_class.from_dict(res, lazy=lazy)
 
     def lookup_movie(
-        self, term: Optional[str] = None, imdb_id: Optional[str] = None, tmdb_id: Optional[int] = None
+        self,
+        term: Optional[str] = None,
+        imdb_id: Optional[str] = None,
+        tmdb_id: Optional[int] = None,
+        fields: Optional[Iterable[str]] = None,
     ) -> Optional[Union[RadarrMovieItem, List[RadarrMovieItem]]]:
         """Search for a movie based on keyword, or imbd/tmdb id.
 
@@ -114,6 +167,7 @@ class RadarrCli(BaseCliMediaApi):
             term (Optional[str]): Keywords to seach for
             imdb_id (Optional[str]): IMDB movie id
             tmdb_id (Optional[int]): TMDB movie id
+            fields (Optional[Iterable[str]]): Only keep these fields, see ``get_movie()``
         Returns:
             json response
         """
@@ -124,19 +178,20 @@ class RadarrCli(BaseCliMediaApi):
         elif not term:
             raise RadarrCliError("Error, invalid parameters")
 
+        item_class = RadarrMovieItem.projection(fields) if fields else RadarrMovieItem
         res = self.lookup_item(str(term))
         if not res:
             return None
         elif isinstance(res, list):
             if len(res) > 1:
-                return [RadarrMovieItem.from_dict(movie) for movie in res]
+                return item_class.from_dicts(res)
             else:
                 res = res[0]
-        return RadarrMovieItem.from_dict(res)
+        return item_class.from_dict(res)
 
     def add_movie(
         self,
-        quality: int,
+        quality: Union[int, str],
         tmdb_id: Optional[int] = None,
         imdb_id: Optional[str] = None,
         movie_info: Optional[RadarrMovieItem] = None,
@@ -151,7 +206,7 @@ class RadarrCli(BaseCliMediaApi):
         it will be used to fetch the required movie description from TMDB.
 
         Args:
-            quality: Quality profile to use, as retrieved by get_quality_profiles()
+            quality: Quality profile to use, as retrieved by get_quality_profiles(), by id or name
             imdbp_id (Optional[int]): IMDB id of the movie to add
             tmdb_id (Optional[int]): TMDB id of the movie to add
             movie_info (Optional[RadarrMovieItem]): Description of the movie to add
@@ -169,15 +224,57 @@ class RadarrCli(BaseCliMediaApi):
             movie_info = cast(RadarrMovieItem, self.lookup_movie(tmdb_id=tmdb_id, imdb_id=imdb_id))
         if not movie_info:
             raise RadarrCliError("Error, invalid parameters or invalid tmdb/imdb id")
+        if movie_info._projection_of is not None:
+            raise RadarrCliError("Error, a projection of a movie only has some of its fields and cannot be added")
 
         # Prepare movie info for adding
         movie_info.path = path or str(self.build_movie_path(movie_info, root_folder_id=root_id))
-        movie_info.qualityProfileId = quality
+        movie_info.qualityProfileId = self.resolve_quality_profile(quality)
         movie_info.monitored = monitored
         movie_info.add_attribute("addOptions", {"searchForMovie": search})
 
         return self.add_item(json_data=movie_info.to_dict())
 
+    def add_movies(
+        self,
+        movie_ids: Iterable[Union[int, str]],
+        quality: Union[int, str],
+        monitored: bool = True,
+        search: bool = True,
+        root_id: int = 0,
+        workers: int = DEFAULT_BULK_WORKERS,
+    ) -> BulkReport:
+        """Add many movies to collection, see add_movie().
+
+        Movies already in the library are skipped, the others are looked up and added concurrently.
+
+        Args:
+            movie_ids (Iterable[Union[int, str]]): TMDB ids (int) or IMDB ids (str, e.g. "tt0133093") of the movies
+            quality: Quality profile to use, by id or name
+            monitored (bool): Whether to monitor the movies. Default is True
+            search (bool): Whether to search for the movies once added. Default is True
+            root_id (Optional[int]): Specify the root folder to use. Default is root[0].
+            workers (int): Number of movies looked up and added concurrently
+        Returns:
+            Result of each movie, in the order given
+        """
+        quality_id = self.resolve_quality_profile(quality)
+
+        def add(movie_id: Union[int, str]) -> json_data:
+            if isinstance(movie_id, int):
+                movie_info = self.lookup_movie(tmdb_id=movie_id)
+            else:
+                movie_info = self.lookup_movie(imdb_id=movie_id)
+            if isinstance(movie_info, list):
+                movie_info = movie_info[0]
+            if not movie_info:
+                raise RadarrCliError(f"Movie {movie_id} not found")
+            return self.add_movie(
+                quality_id, movie_info=movie_info, monitored=monitored, search=search, root_id=root_id
+            )
+
+        return self.add_items(movie_ids, add, lambda movie: (movie.get("tmdbId"), movie.get("imdbId")), workers=workers)
+
     def build_movie_path(self, movie_info: RadarrMovieItem, root_folder_id: int = 0) -> Path:
         """Build a movie folder path using the root folder specified.
         Args:
@@ -204,10 +301,33 @@ class RadarrCli(BaseCliMediaApi):
         options = {"addImportExclusion": add_exclusion} if add_exclusion else {}
         return self.delete_item(movie_id, delete_files, options)
 
+    def delete_movies(
+        self,
+        movie_ids: Iterable[int],
+        delete_files: bool = True,
+        add_exclusion: bool = False,
+        chunk_size: int = EDITOR_CHUNK_SIZE,
+        workers: int = DEFAULT_BULK_WORKERS,
+    ) -> BulkReport:
+        """Delete many movies with the movie editor, see delete_items()
+
+        Args:
+            movie_ids (Iterable[int]):  Movies to delete
+            delete_files (bool): Optional. Also delete files. Default is True
+            add_exclusion: Optionally exclude the movies from further imdb/tmdb auto add
+            chunk_size (int): Maximum number of movies per request
+            workers (int): Number of concurrent requests if movies are deleted one by one
+        Returns:
+            Result of each movie, in the order given
+        """
+        options = {"addImportExclusion": add_exclusion} if add_exclusion else {}
+        return self.delete_items(movie_ids, delete_files, options, chunk_size=chunk_size, workers=workers)
+
     def edit_movie(
         self,
         movie_info: RadarrMovieItem,
         move_files: bool = False,
+        skip_unchanged: bool = False,
     ) -> json_data:
         """Edit a movie from the collection.
 
@@ -216,11 +336,63 @@ class RadarrCli(BaseCliMediaApi):
         Args:
             movie_info (Optional[RadarrMovieItem]): Description of the movie to edit
             move_files (bool): Whether to move files after edition. Default is False
+            skip_unchanged (bool): If True, nothing is sent if no field of movie_info was modified since it was
+                built, see BaseCliApiItem.changed_fields(). Default is False
         Returns:
-            json response
+            json response, or the unchanged movie as a dict if nothing was sent
         """
+        if movie_info._projection_of is not None:
+            raise RadarrCliError("Error, a projection of a movie only has some of its fields and cannot be edited")
+        if skip_unchanged and not movie_info.is_dirty:
+            log.info("Movie %s not modified, skipping edit", movie_info.id)
+            return movie_info.to_dict()
+
+        res = self.edit_item(json_data=movie_info.to_dict())  # , url_params={"moveFiles": False})
+        movie_info.mark_clean()
+        return res
+
+    def edit_movies(
+        self,
+        movie_ids: Iterable[int],
+        monitored: Optional[bool] = None,
+        quality: Optional[Union[int, str]] = None,
+        root_folder: Optional[Union[int, str]] = None,
+        tags: Optional[Iterable[Union[int, str]]] = None,
+        apply_tags: str = "add",
+        move_files: bool = False,
+        minimum_availability: Optional[str] = None,
+        chunk_size: int = EDITOR_CHUNK_SIZE,
+        workers: int = DEFAULT_BULK_WORKERS,
+    ) -> BulkReport:
+        """Edit many movies with the movie editor, sending only the fields changed, see edit_items()
 
-        return self.edit_item(json_data=movie_info.to_dict())  # , url_params={"moveFiles": False})
+        Args:
+            movie_ids (Iterable[int]): Movies to edit
+            monitored (Optional[bool]): Whether to monitor the movies
+            quality (Optional[Union[int, str]]): Quality profile id or name
+            root_folder (Optional[Union[int, str]]): Root folder id or path to move the movies to
+            tags (Optional[Iterable[Union[int, str]]]): Tag ids or labels
+            apply_tags (str): How tags are applied: "add" (default), "remove" or "replace"
+            move_files (bool): Whether to move files to the new root folder. Default is False
+            minimum_availability (Optional[str]): Minimum availability, e.g. "released"
+            chunk_size (int): Maximum number of movies per request
+            workers (int): Number of concurrent requests if movies are edited one by one
+        Returns:
+            Result of each movie, in the order given
+        """
+        options = {"minimumAvailability": minimum_availability} if minimum_availability is not None else {}
+        return self.edit_items(
+            movie_ids,
+            monitored=monitored,
+            quality=quality,
+            root_folder=root_folder,
+            tags=tags,
+            apply_tags=apply_tags,
+            move_files=move_files,
+            options=options,
+            chunk_size=chunk_size,
+            workers=workers,
+        )
 
     def refresh_movie(self, movie_id: Optional[int] = None) -> json_data:
         """Refresh movie information  and rescan disk.
@@ -0,0 +1,179 @@
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pycliarr.api.base_api import json_dict
+from pycliarr.api.exceptions import CliArrError
+
+# Time in seconds after which cached entries are fetched again
+DEFAULT_REGISTRY_TTL = 300.0
+
+# Normalization applied to a key value before indexing and lookup, None to use the value as is
+KeyNormalizer = Optional[Callable[[Any], Any]]
+
+
+def normalize_path(path: Any) -> str:
+    """Normalize a folder path for lookups: trailing separators are ignored."""
+    return str(path).rstrip("/\\") or str(path)
+
+
+def normalize_name(name: Any) -> str:
+    """Normalize a name for lookups: case is ignored."""
+    return str(name).casefold()
+
+
+class CachedRegistry:
+    """Cache of a list of server entries (root folders, profiles, ...), indexed by some of their fields.
+
+    Entries are fetched on first use, and fetched again once older than the ttl or after invalidate().
+    Lookups are dict accesses on the indexed fields.
+
+    Example:
+        folders = CachedRegistry(cli.get_root_folder, {"id": None, "path": normalize_path})
+        folder = folders.get("path", "/media/movies/")
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], List[json_dict]],
+        keys: Dict[str, KeyNormalizer],
+        ttl: float = DEFAULT_REGISTRY_TTL,
+        name: str = "entry",
+        refresh_on_miss: bool = False,
+    ) -> None:
+        """Build a registry.
+
+        Args:
+            fetch (Callable[[], List[json_dict]]): Function returning all the entries
+            keys (Dict[str, KeyNormalizer]): Fields to index, with the normalization of their values
+            ttl (float): Time in seconds after which entries are fetched again. 0 to fetch them on each access,
+                a negative value to keep them until invalidate() is called.
+            name (str): Name of the entries, used in error messages
+            refresh_on_miss (bool): If True, entries are fetched again when a lookup finds nothing, e.g. to find
+                entries created since the last fetch
+        """
+        self._fetch = fetch
+        self._keys = keys
+        self.ttl = ttl
+        self.name = name
+        self.refresh_on_miss = refresh_on_miss
+        self._entries: Optional[List[json_dict]] = None
+        self._indexes: Dict[str, Dict[Any, json_dict]] = {}
+        self._fetched = 0.0
+
+    @property
+    def age(self) -> float:
+        """Age of the cached entries in seconds, infinite if not fetched yet."""
+        return time.time() - self._fetched if self._entries is not None else float("inf")
+
+    @property
+    def is_expired(self) -> bool:
+        return self._entries is None or (self.ttl >= 0 and self.age >= self.ttl)
+
+    def invalidate(self) -> None:
+        """Drop the cached entries, they will be fetched again on next access."""
+        self._entries = None
+        self._indexes = {}
+
+    def refresh(self) -> None:
+        """Fetch the entries and rebuild the indexes."""
+        entries = list(self._fetch())
+        indexes: Dict[str, Dict[Any, json_dict]] = {key: {} for key in self._keys}
+        for entry in entries:
+            for key, normalize in self._keys.items():
+                value = entry.get(key)
+                if value is not None:
+                    indexes[key].setdefault(normalize(value) if normalize else value, entry)
+        self._entries = entries
+        self._indexes = indexes
+        self._fetched = time.time()
+
+    def _ensure(self) -> None:
+        if self.is_expired:
+            self.refresh()
+
+    def entries(self) -> List[json_dict]:
+        """Return all the entries, fetching them if needed."""
+        self._ensure()
+        return list(self._entries or [])
+
+    def add(self, entry: json_dict) -> None:
+        """Add an entry created on the server to the cached entries, to find it without fetching them again."""
+        if self._entries is None:
+            return
+        self._entries.append(entry)
+        for key, normalize in self._keys.items():
+            value = entry.get(key)
+            if value is not None:
+                self._indexes[key][normalize(value) if normalize else value] = entry
+
+    def _lookup(self, key: str, value: Any) -> Optional[json_dict]:
+        normalize = self._keys[key]
+        try:
+            return self._indexes[key].get(normalize(value) if normalize else value)
+        except TypeError:
+            # Unhashable value, it can't match any entry
+            return None
+
+    def _search(self, lookups: List[Tuple[str, Any]]) -> Optional[json_dict]:
+        """Return the first entry found by the lookups (key, value), refreshing the entries on a miss if enabled."""
+        refreshed = self.is_expired
+        self._ensure()
+        for _ in range(2):
+            for key, value in lookups:
+                entry = self._lookup(key, value)
+                if entry is not None:
+                    return entry
+            if refreshed or not self.refresh_on_miss:
+                break
+            self.refresh()
+            refreshed = True
+        return None
+
+    def get(self, key: str, value: Any) -> Optional[json_dict]:
+        """Return the entry whose key field has the given value, or None if not found.
+
+        Args:
+            key (str): Indexed field, e.g. id
+            value (Any): Value to look for, normalized as the indexed values
+        """
+        if key not in self._keys:
+            raise CliArrError(f"Field '{key}' is not indexed")
+        return self._search([(key, value)])
+
+    def get_many(self, key: str, values: Iterable[Any]) -> List[Optional[json_dict]]:
+        """Same as get() for several values. Entries are fetched again at most once for all the misses."""
+        if key not in self._keys:
+            raise CliArrError(f"Field '{key}' is not indexed")
+        values = list(values)
+        refreshed = self.is_expired
+        self._ensure()
+        found = [self._lookup(key, value) for value in values]
+        if None in found and self.refresh_on_miss and not refreshed:
+            self.refresh()
+            found = [self._lookup(key, value) for value in values]
+        return found
+
+    def require(self, key: str, value: Any) -> json_dict:
+        """Same as get(), but raises CliArrError if the entry is not found."""
+        entry = self.get(key, value)
+        if entry is None:
+            raise CliArrError(f"No {self.name} with {key} '{value}'")
+        return entry
+
+    def find(self, value: Any) -> json_dict:
+        """Return the entry matching a value on any indexed field, fields being tried in order.
+
+        Strings of digits also match integer values, e.g. an id given on the command line.
+        Raises CliArrError if no entry matches.
+        """
+        lookups = [(key, value) for key in self._keys]
+        if isinstance(value, str) and value.isdigit():
+            lookups = [(key, int(value)) for key in self._keys] + lookups
+        entry = self._search(lookups)
+        if entry is None:
+            raise CliArrError(f"No {self.name} matching '{value}'")
+        return entry
+
+    def resolve(self, values: Iterable[Any], key: str = "id") -> List[Any]:
+        """Return the key field of the entry matching each value, see find()."""
+        return [self.find(value)[key] for value in values]
@@ -0,0 +1,305 @@
+import bisect
+import json
+import logging
+import math
+import os
+import re
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union, cast
+
+from pycliarr.api.base_api import json_dict, json_list
+from pycliarr.api.base_media import BaseCliMediaApi
+from pycliarr.api.exceptions import CliArrError
+
+log = logging.getLogger(__name__)
+
+# Weight of a token depending on the field it was found in
+FIELD_WEIGHTS = {"title": 3.0, "sortTitle": 2.0, "cleanTitle": 2.0, "alternateTitles": 1.0}
+# Weight of a query token match depending on the match type
+MATCH_EXACT = 1.0
+MATCH_PREFIX = 0.6
+MATCH_FUZZY = 0.4
+# Query tokens shorter than this are only matched exactly or by prefix
+FUZZY_MIN_LENGTH = 4
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    """Casefold a text and remove its accents."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> List[str]:
+    """Split a text in normalized words."""
+    return _TOKEN_RE.findall(normalize(text))
+
+
+def _deletes(token: str) -> Set[str]:
+    """The token and the variants of the token with one character removed."""
+    return {token} | {token[:idx] + token[idx + 1 :] for idx in range(len(token))}
+
+
+def _within_one_edit(first: str, second: str) -> bool:
+    """Return True if two tokens differ by at most one insertion, deletion, substitution or transposition."""
+    if abs(len(first) - len(second)) > 1:
+        return False
+    if len(first) > len(second):
+        first, second = second, first
+    start = 0
+    while start < len(first) and first[start] == second[start]:
+        start += 1
+    if len(first) < len(second):
+        return first[start:] == second[start + 1 :]
+    return first[start + 1 :] == second[start + 1 :] or (
+        first[start : start + 2] == second[start : start + 2][::-1] and first[start + 2 :] == second[start + 2 :]
+    )
+
+
+class SearchResult:
+    """An item matching a search."""
+
+    __slots__ = ("id", "title", "score")
+
+    def __init__(self, item_id: int, title: str, score: float) -> None:
+        self.id = item_id
+        self.title = title
+        self.score = score
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "title": self.title, "score": self.score}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.id} {self.title!r} {self.score:.2f}>"
+
+
+class TitleSearchIndex:
+    """In-memory inverted index over the titles of the library items, to find items without contacting the server.
+
+    Titles, sort titles, clean titles and alternate titles are indexed. Query words match index words exactly, by
+    prefix, or with one typo for words of FUZZY_MIN_LENGTH characters or more. Items are ranked by number of query
+    words matched, then by a score weighting each match by the field it was found in, the match type and the rarity
+    of the word.
+
+    Example:
+        index = TitleSearchIndex()
+        index.refresh(radarr)
+        index.save("/tmp/movies_search.json")
+        for result in index.search("matrx reload"):
+            print(result.id, result.title)
+    """
+
+    version = 1
+
+    def __init__(self, created: Optional[float] = None, source: str = "") -> None:
+        """Build an empty index.
+
+        Args:
+            created (Optional[float]): Timestamp of the indexed data. Default is now.
+            source (str): Host url the items were read from
+        """
+        self.created = created if created is not None else time.time()
+        self.source = source
+        # Indexed titles of each item, used to detect changes and to save the index
+        self._titles: Dict[int, Dict[str, Any]] = {}
+        # Weight of each token of each item
+        self._item_tokens: Dict[int, Dict[str, float]] = {}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._deletes: Dict[str, Set[str]] = {}
+        # Sorted tokens, for prefix search. Rebuilt on the next search when None.
+        self._vocabulary: Optional[List[str]] = []
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    @property
+    def age(self) -> float:
+        """Age of the indexed data in seconds."""
+        return time.time() - self.created
+
+    def is_stale(self, max_age: float) -> bool:
+        """Return True if the indexed data is older than max_age seconds."""
+        return self.age > max_age
+
+    ##############################################
+    ################## updates ###################
+    ##############################################
+    @staticmethod
+    def _item_titles(item: json_dict) -> Dict[str, Any]:
+        return {
+            "title": item.get("title") or "",
+            "sortTitle": item.get("sortTitle") or "",
+            "cleanTitle": item.get("cleanTitle") or "",
+            "alternateTitles": [alt.get("title") or "" for alt in item.get("alternateTitles") or []],
+        }
+
+    def _add(self, item_id: int, titles: Dict[str, Any]) -> None:
+        tokens: Dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            texts = titles[field] if isinstance(titles[field], list) else [titles[field]]
+            for text in texts:
+                for token in tokenize(text):
+                    tokens[token] = max(tokens.get(token, 0.0), weight)
+        self._titles[item_id] = titles
+        self._item_tokens[item_id] = tokens
+        for token, weight in tokens.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                for variant in _deletes(token):
+                    self._deletes.setdefault(variant, set()).add(token)
+                self._vocabulary = None
+            postings[item_id] = weight
+
+    def remove(self, item_id: int) -> bool:
+        """Remove an item from the index. Returns False if it was not indexed."""
+        if item_id not in self._titles:
+            return False
+        del self._titles[item_id]
+        for token in self._item_tokens.pop(item_id):
+            postings = self._postings[token]
+            del postings[item_id]
+            if not postings:
+                del self._postings[token]
+                for variant in _deletes(token):
+                    self._deletes[variant].discard(token)
+                    if not self._deletes[variant]:
+                        del self._deletes[variant]
+                self._vocabulary = None
+        return True
+
+    def update(self, items: Iterable[json_dict]) -> int:
+        """Index new items, and items whose titles changed.
+
+        Args:
+            items (Iterable[json_dict]): Items data, as returned by the server
+        Returns:
+            Number of items indexed
+        """
+        count = 0
+        for item in items:
+            item_id = item["id"]
+            titles = self._item_titles(item)
+            if self._titles.get(item_id) == titles:
+                continue
+            self.remove(item_id)
+            self._add(item_id, titles)
+            count += 1
+        return count
+
+    def sync(self, items: Iterable[json_dict]) -> Tuple[int, int]:
+        """Update the index to contain exactly the items provided. Only the items changed are indexed again.
+
+        Args:
+            items (Iterable[json_dict]): All the library items data, as returned by the server
+        Returns:
+            Number of items indexed and removed
+        """
+        items = list(items)
+        indexed = self.update(items)
+        removed = set(self._titles) - {item["id"] for item in items}
+        for item_id in removed:
+            self.remove(item_id)
+        self.created = time.time()
+        return indexed, len(removed)
+
+    def refresh(self, cli: BaseCliMediaApi) -> Tuple[int, int]:
+        """Sync the index with the items of a client library, see sync().
+
+        Items are read with get_item(), so from the local snapshot or library index if the client is offline.
+        """
+        if self.source and self.source != cli.host_url:
+            raise CliArrError(f"Search index was created for {self.source}, not {cli.host_url}")
+        self.source = cli.host_url
+        return self.sync(cast(json_list, cli.get_item()))
+
+    ##############################################
+    ################### search ###################
+    ##############################################
+    def _matches(self, token: str) -> Dict[str, float]:
+        """Index tokens matching a query token, with the weight of the match type."""
+        vocabulary = self._vocabulary
+        if vocabulary is None:
+            vocabulary = self._vocabulary = sorted(self._postings)
+        matches: Dict[str, float] = {}
+        if len(token) >= FUZZY_MIN_LENGTH:
+            for variant in _deletes(token):
+                for candidate in self._deletes.get(variant, ()):
+                    if _within_one_edit(token, candidate):
+                        matches[candidate] = MATCH_FUZZY
+        idx = bisect.bisect_left(vocabulary, token)
+        while idx < len(vocabulary) and vocabulary[idx].startswith(token):
+            matches[vocabulary[idx]] = MATCH_PREFIX
+            idx += 1
+        if token in self._postings:
+            matches[token] = MATCH_EXACT
+        return matches
+
+    def search(self, query: str, limit: Optional[int] = 10) -> List[SearchResult]:
+        """Find the items whose titles match a query.
+
+        Args:
+            query (str): Words to search
+            limit (Optional[int]): Maximum number of results, all by default
+        Returns:
+            The items matching at least one word, best matches first
+        """
+        total = len(self._titles)
+        scores: Dict[int, List[float]] = {}
+        for token in dict.fromkeys(tokenize(query)):
+            token_scores: Dict[int, float] = {}
+            for candidate, match_weight in self._matches(token).items():
+                postings = self._postings[candidate]
+                idf = 1.0 + math.log(total / len(postings))
+                for item_id, field_weight in postings.items():
+                    score = match_weight * field_weight * idf
+                    if score > token_scores.get(item_id, 0.0):
+                        token_scores[item_id] = score
+            for item_id, score in token_scores.items():
+                item_score = scores.setdefault(item_id, [0, 0.0])
+                item_score[0] += 1
+                item_score[1] += score
+
+        ranked = sorted(scores.items(), key=lambda entry: (-entry[1][0], -entry[1][1], entry[0]))
+        return [SearchResult(item_id, self._titles[item_id]["title"], score) for item_id, (_, score) in ranked[:limit]]
+
+    ##############################################
+    ################ persistence #################
+    ##############################################
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "created": self.created,
+            "source": self.source,
+            "items": [dict(titles, id=item_id) for item_id, titles in self._titles.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, dict_data: Dict[str, Any]) -> "TitleSearchIndex":
+        if dict_data.get("version") != cls.version:
+            raise CliArrError(f"Unsupported search index version: {dict_data.get('version')}")
+        index = cls(created=dict_data["created"], source=dict_data.get("source", ""))
+        for titles in dict_data["items"]:
+            item_id = titles.pop("id")
+            index._add(item_id, titles)
+        return index
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the index to a file. The file is replaced atomically."""
+        tmp_path = Path(f"{path}.tmp")
+        with open(tmp_path, "w") as index_file:
+            json.dump(self.to_dict(), index_file)
+        os.replace(tmp_path, path)
+        log.debug("Search index of %d items saved to %s", len(self), path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TitleSearchIndex":
+        """Read an index from a file."""
+        try:
+            with open(path, "r") as index_file:
+                return cls.from_dict(json.load(index_file))
+        except (OSError, ValueError, KeyError) as e:
+            raise CliArrError(f"Unable to load search index {path}: {e}")
@@ -0,0 +1,235 @@
+import importlib
+import json
+import logging
+import pickle
+import struct
+import time
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
+
+from pycliarr.api.base_api import BaseCliApiItem, json_data
+from pycliarr.api.exceptions import CliArrError, CliDecodeError
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+log = logging.getLogger(__name__)
+
+# Sections stored in a snapshot
+SNAPSHOT_ITEMS = "items"
+SNAPSHOT_TAGS = "tags"
+SNAPSHOT_ROOT_FOLDERS = "rootFolders"
+SNAPSHOT_QUALITY_PROFILES = "qualityProfiles"
+
+# Snapshots older than this (in seconds) are considered stale
+DEFAULT_SNAPSHOT_MAX_AGE = 24 * 3600
+
+# Binary item snapshots header: magic, format version and codec
+ITEMS_MAGIC = b"PYCLIARR"
+ITEMS_VERSION = 1
+ITEMS_HEADER = struct.Struct(f"<{len(ITEMS_MAGIC)}sBB")
+CODEC_PICKLE = 1
+CODEC_MSGPACK = 2
+PICKLE_PROTOCOL = min(5, pickle.HIGHEST_PROTOCOL)
+
+
+class LibrarySnapshot:
+    """Local copy of the server library, used to answer reads without contacting the server.
+
+    A snapshot holds the raw json data of several sections (items, tags, root folders, quality profiles)
+    along with the time it was taken, so that readers can know how old the data is.
+    """
+
+    version = 1
+
+    def __init__(
+        self, sections: Optional[Dict[str, json_data]] = None, created: Optional[float] = None, source: str = ""
+    ) -> None:
+        """Build a snapshot.
+
+        Args:
+            sections (Optional[Dict[str, json_data]]): Data of each section, indexed by section name
+            created (Optional[float]): Timestamp of the snapshot creation. Default is now.
+            source (str): Host url the data was fetched from
+        """
+        self._sections: Dict[str, json_data] = sections or {}
+        self.created = created if created is not None else time.time()
+        self.source = source
+
+    @property
+    def age(self) -> float:
+        """Age of the snapshot in seconds."""
+        return time.time() - self.created
+
+    def is_stale(self, max_age: float = DEFAULT_SNAPSHOT_MAX_AGE) -> bool:
+        """Return True if the snapshot is older than max_age seconds."""
+        return self.age > max_age
+
+    def set(self, section: str, data: json_data) -> None:
+        """Store the data of a section."""
+        self._sections[section] = data
+
+    def get(self, section: str, item_id: Optional[int] = None) -> json_data:
+        """Get a section data, or a single entry of the section if an id is specified.
+
+        Args:
+            section (str): Name of the section to read
+            item_id (Optional[int]): Id of the entry to get, all entries by default
+        Returns:
+            A copy of the json data as it was returned by the server, so that it can be modified by the caller
+        """
+        if section not in self._sections:
+            raise CliArrError(f"No '{section}' data in snapshot")
+        data = self._sections[section]
+        if not item_id:
+            return deepcopy(data)
+        entries = data if isinstance(data, list) else [data]
+        for entry in entries:
+            if entry.get("id") == item_id:
+                return deepcopy(entry)
+        raise CliArrError(f"No entry with id {item_id} in snapshot '{section}' data")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"version": self.version, "created": self.created, "source": self.source, "sections": self._sections}
+
+    @classmethod
+    def from_dict(cls, dict_data: Dict[str, Any]) -> "LibrarySnapshot":
+        if dict_data.get("version") != cls.version:
+            raise CliArrError(f"Unsupported snapshot version: {dict_data.get('version')}")
+        return cls(dict_data["sections"], created=dict_data["created"], source=dict_data.get("source", ""))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the snapshot to a file."""
+        with open(path, "w") as snapshot_file:
+            json.dump(self.to_dict(), snapshot_file)
+        log.debug("Snapshot saved to %s", path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "LibrarySnapshot":
+        """Read a snapshot from a file."""
+        try:
+            with open(path, "r") as snapshot_file:
+                return cls.from_dict(json.load(snapshot_file))
+        except (OSError, ValueError, KeyError) as e:
+            raise CliArrError(f"Unable to load snapshot {path}: {e}")
+
+
+def _encode(payload: Dict[str, Any], codec: int) -> bytes:
+    if codec == CODEC_MSGPACK:
+        return msgpack.packb(payload, use_bin_type=True)  # type: ignore
+    return pickle.dumps(payload, protocol=PICKLE_PROTOCOL)
+
+
+def _decode(data: bytes, codec: int) -> Dict[str, Any]:
+    if codec == CODEC_MSGPACK:
+        if msgpack is None:
+            raise CliDecodeError("msgpack is required to load this snapshot")
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)  # type: ignore
+    if codec == CODEC_PICKLE:
+        return pickle.loads(data)  # type: ignore
+    raise CliDecodeError(f"Unsupported snapshot codec: {codec}")
+
+
+def save_items(items: Iterable[BaseCliApiItem], path: Union[str, Path], use_msgpack: Optional[bool] = None) -> None:
+    """Write items to a binary snapshot file.
+
+    Items must all be of the same class. Their values are stored in the class field order, so that loading them
+    does not need any per field lookup. Only trusted snapshot files must be loaded, as pickle may be used.
+
+    Args:
+        items (Iterable[BaseCliApiItem]): Items to save
+        path (Union[str, Path]): Snapshot file path
+        use_msgpack (Optional[bool]): Encode with msgpack instead of pickle. Default is to use msgpack if available.
+    """
+    codec = CODEC_MSGPACK if (msgpack is not None if use_msgpack is None else use_msgpack) else CODEC_PICKLE
+    if codec == CODEC_MSGPACK and msgpack is None:
+        raise CliArrError("msgpack is not available")
+
+    item_list = list(items)
+    item_class = type(item_list[0]) if item_list else BaseCliApiItem
+    values: List[List[Any]] = []
+    extra = []
+    for idx, item in enumerate(item_list):
+        if type(item) is not item_class:
+            raise CliArrError(f"Snapshot items must all be {item_class.__name__}, got {type(item).__name__}")
+        values.append(item._hydrate())
+        if item._extra:
+            extra.append([idx, item._extra])
+    base_class = item_class._projection_of or item_class
+    payload = {
+        "class": f"{base_class.__module__}.{base_class.__qualname__}",
+        "projection": item_class._projection_of is not None,
+        "created": time.time(),
+        "fields": list(item_class._fields),
+        "values": values,
+        "extra": extra,
+    }
+    with open(path, "wb") as snapshot_file:
+        snapshot_file.write(ITEMS_HEADER.pack(ITEMS_MAGIC, ITEMS_VERSION, codec))
+        snapshot_file.write(_encode(payload, codec))
+    log.debug("%d items saved to %s", len(item_list), path)
+
+
+def _item_class(name: str) -> Type[BaseCliApiItem]:
+    module_name, _, class_name = name.rpartition(".")
+    try:
+        item_class = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError, ValueError) as e:
+        raise CliDecodeError(f"Unknown snapshot item class {name}: {e}")
+    if not (isinstance(item_class, type) and issubclass(item_class, BaseCliApiItem)):
+        raise CliDecodeError(f"Invalid snapshot item class {name}")
+    return item_class
+
+
+def load_items(path: Union[str, Path], item_class: Optional[Type[BaseCliApiItem]] = None) -> List[BaseCliApiItem]:
+    """Read items from a binary snapshot file written by save_items().
+
+    Args:
+        path (Union[str, Path]): Snapshot file path
+        item_class (Optional[Type[BaseCliApiItem]]): Class of the items to build. Default is the class of the saved
+            items. If its model changed since the snapshot was saved, values are matched by field name.
+            Saved projection items are loaded as items of the same projection of item_class.
+    Returns:
+        The list of items
+    """
+    try:
+        with open(path, "rb") as snapshot_file:
+            data = snapshot_file.read()
+    except OSError as e:
+        raise CliArrError(f"Unable to load snapshot {path}: {e}")
+    if len(data) < ITEMS_HEADER.size:
+        raise CliDecodeError(f"Invalid snapshot {path}: file too short")
+    magic, version, codec = ITEMS_HEADER.unpack_from(data)
+    if magic != ITEMS_MAGIC:
+        raise CliDecodeError(f"Invalid snapshot {path}: not an item snapshot")
+    if version != ITEMS_VERSION:
+        raise CliDecodeError(f"Unsupported snapshot version: {version}")
+    try:
+        payload = _decode(data[ITEMS_HEADER.size :], codec)
+    except (ValueError, pickle.UnpicklingError, EOFError) as e:
+        raise CliDecodeError(f"Invalid snapshot {path}: {e}")
+
+    item_class = item_class or _item_class(payload["class"])
+    fields = payload["fields"]
+    if payload.get("projection"):
+        item_class = item_class.projection(set(fields) & item_class._fields.keys())
+    items: List[BaseCliApiItem] = []
+    if fields == list(item_class._fields):
+        intern = item_class._intern if item_class.intern_strings else None
+        for values in payload["values"]:
+            if intern:
+                intern(values)
+            item = item_class.__new__(item_class)
+            item._init_storage(values)
+            items.append(item)
+    else:
+        log.debug("Snapshot fields differ from %s model, matching values by name", item_class.__name__)
+        items = item_class.from_dicts(dict(zip(fields, values)) for values in payload["values"])
+    for idx, extra in payload["extra"]:
+        for name, value in extra.items():
+            items[idx].add_attribute(name, value)
+        items[idx].mark_clean()
+    return items
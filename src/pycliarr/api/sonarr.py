@@ -1,14 +1,23 @@
+import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, Union, cast
 
 from pycliarr.api.base_api import BaseCliApiItem, json_data
-from pycliarr.api.base_media import BaseCliMediaApi
+from pycliarr.api.base_media import EDITOR_CHUNK_SIZE, BaseCliMediaApi
+from pycliarr.api.bulk import DEFAULT_BULK_WORKERS, BulkReport
+from pycliarr.api.collection import ItemCollection
 from pycliarr.api.exceptions import SonarrCliError
 
+log = logging.getLogger(__name__)
+
 
 class SonarrSerieItem(BaseCliApiItem):
     """Class for handling serie info."""
 
+    __slots__ = ()
+
+    intern_fields = ("status", "network", "airTime", "certification", "genres", "seriesType", "images.coverType")
+
     def _model(self) -> Dict[Any, Any]:
         """Define the model of items represented by this class."""
         return {
@@ -78,26 +87,43 @@ class SonarrCli(BaseCliMediaApi):
     api_url_itemlookup = f"{BaseCliMediaApi.api_url_base}/series/lookup"
     api_url_episode = f"{BaseCliMediaApi.api_url_base}/episode"
     api_url_episodefile = f"{BaseCliMediaApi.api_url_base}/episodefile"
+    api_url_editor = f"{BaseCliMediaApi.api_url_base}/series/editor"
+    item_ids_field = "seriesIds"
 
     # Keep using v1 for commands not available in v3
     api_url_wanted_missing = "/api/wanted/missing"
 
-    def get_serie(self, serie_id: Optional[int] = None) -> Union[SonarrSerieItem, List[SonarrSerieItem]]:
+    def get_serie(
+        self,
+        serie_id: Optional[int] = None,
+        lazy: bool = False,
+        as_collection: bool = False,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Union[SonarrSerieItem, List[SonarrSerieItem], ItemCollection[SonarrSerieItem]]:
         """Get specified serie, or all if no id provided from server collection.
 
         Args:
             serie_id (Optional[int]) ID of serie to get, all items by default
+            lazy (bool): If True, items wrap the server data and only resolve fields when accessed
+            as_collection (bool): If True, all series are returned as an ``ItemCollection``
+            fields (Optional[Iterable[str]]): Only keep these fields, other fields are discarded once the response is
+                decoded. Items are instances of a projection of ``SonarrSerieItem``, see ``projection()``.
+                lazy is ignored when fields are specified.
         Returns:
             ``SonarrSerieItem`` if a serie id is specified, or a list of ``SonarrSerieItem``
         """
+        item_class = SonarrSerieItem.projection(fields) if fields else SonarrSerieItem
+        lazy = lazy and not fields
         res = self.get_item(serie_id)
         if isinstance(res, list):
-            return [SonarrSerieItem.from_dict(serie) for serie in res]
+            if as_collection:
+                return ItemCollection(item_class, res)
+            return item_class.from_dicts(res, lazy=lazy)
         else:
-            return SonarrSerieItem.from_dict(res)
+            return item_class.from_dict(res, lazy=lazy)
 
     def lookup_serie(
-        self, term: Optional[str] = None, tvdb_id: Optional[int] = None
+        self, term: Optional[str] = None, tvdb_id: Optional[int] = None, fields: Optional[Iterable[str]] = None
     ) -> Optional[Union[SonarrSerieItem, List[SonarrSerieItem]]]:
         """Search for a serie based on keyword, or tvdb id.
 
@@ -107,6 +133,7 @@ class SonarrCli(BaseCliMediaApi):
         Args:
             term (Optional[str]): Keywords to seach for
             tvdb_id (Optional[str]): TVDB serie id
+            fields (Optional[Iterable[str]]): Only keep these fields, see ``get_serie()``
         Returns:
             json response
         """
@@ -115,19 +142,20 @@ class SonarrCli(BaseCliMediaApi):
         elif not term:
             raise SonarrCliError("Error invalid parameters")
 
+        item_class = SonarrSerieItem.projection(fields) if fields else SonarrSerieItem
         res = self.lookup_item(str(term))
         if not res:
             return None
         elif isinstance(res, list):
             if len(res) > 1:
-                return [SonarrSerieItem.from_dict(serie) for serie in res]
+                return item_class.from_dicts(res)
             else:
                 res = res[0]
-        return SonarrSerieItem.from_dict(res)
+        return item_class.from_dict(res)
 
     def add_serie(
         self,
-        quality: int,
+        quality: Union[int, str],
         tvdb_id: Optional[int] = None,
         serie_info: Optional[SonarrSerieItem] = None,
         monitored_seasons: List[int] = [],
@@ -143,7 +171,7 @@ class SonarrCli(BaseCliMediaApi):
         it will be used to fetch the required serie description from TMDB.
 
         Args:
-            quality: Quality profile to use, as retrieved by get_quality_profiles()
+            quality: Quality profile to use, as retrieved by get_quality_profiles(), by id or name
             tvdb_id (Optional[int]): TVDB id of the serie to add
             serie_info (Optional[RadarrserieItem]): Description of the serie to add
             monitored_seasons: Optional list of seasons numbers to monitor. Latest season only by default.
@@ -167,10 +195,12 @@ class SonarrCli(BaseCliMediaApi):
             serie_info = cast(SonarrSerieItem, self.lookup_serie(tvdb_id=tvdb_id))
         if not serie_info:
             raise SonarrCliError("Error, invalid parameters or invalid tvdb id")
+        if serie_info._projection_of is not None:
+            raise SonarrCliError("Error, a projection of a serie only has some of its fields and cannot be added")
 
         # Prepare serie info for adding
         serie_info.path = path or str(self.build_serie_path(serie_info, root_folder_id=root_id))
-        serie_info.qualityProfileId = quality
+        serie_info.qualityProfileId = self.resolve_quality_profile(quality)
         serie_info.monitored = monitored
         serie_info.seasonFolder = season_folder
 
@@ -188,6 +218,53 @@ class SonarrCli(BaseCliMediaApi):
 
         return self.add_item(json_data=serie_info.to_dict())
 
+    def add_series(
+        self,
+        tvdb_ids: Iterable[int],
+        quality: Union[int, str],
+        monitored_seasons: List[int] = [],
+        monitored: bool = True,
+        search: bool = True,
+        season_folder: bool = True,
+        root_id: int = 0,
+        workers: int = DEFAULT_BULK_WORKERS,
+    ) -> BulkReport:
+        """Add many series to collection, see add_serie().
+
+        Series already in the library are skipped, the others are looked up and added concurrently.
+
+        Args:
+            tvdb_ids (Iterable[int]): TVDB ids of the series to add
+            quality: Quality profile to use, by id or name
+            monitored_seasons: Optional list of seasons numbers to monitor. Latest season only by default.
+            monitored (bool): Whether to monitor the series. Default is True
+            search (bool): Whether to search for the series once added. Default is True
+            season_folder (bool): If True (default), create a folder for each season.
+            root_id (Optional[int]): Specify the root folder to use. Default is root[0].
+            workers (int): Number of series looked up and added concurrently
+        Returns:
+            Result of each serie, in the order given
+        """
+        quality_id = self.resolve_quality_profile(quality)
+
+        def add(tvdb_id: int) -> json_data:
+            serie_info = self.lookup_serie(tvdb_id=tvdb_id)
+            if isinstance(serie_info, list):
+                serie_info = serie_info[0]
+            if not serie_info:
+                raise SonarrCliError(f"Serie {tvdb_id} not found")
+            return self.add_serie(
+                quality_id,
+                serie_info=serie_info,
+                monitored_seasons=monitored_seasons,
+                monitored=monitored,
+                search=search,
+                season_folder=season_folder,
+                root_id=root_id,
+            )
+
+        return self.add_items(tvdb_ids, add, lambda serie: (serie.get("tvdbId"),), workers=workers)
+
     def build_serie_path(self, serie_info: SonarrSerieItem, root_folder_id: int = 0) -> Path:
         """Build a serie folder path using the root folder specified.
         Args:
@@ -212,18 +289,92 @@ class SonarrCli(BaseCliMediaApi):
         options = {"addImportListExclusion": add_exclusion} if add_exclusion else {}
         return self.delete_item(serie_id, delete_files, options)
 
-    def edit_serie(self, serie_info: SonarrSerieItem) -> json_data:
+    def delete_series(
+        self,
+        serie_ids: Iterable[int],
+        delete_files: bool = True,
+        add_exclusion: bool = False,
+        chunk_size: int = EDITOR_CHUNK_SIZE,
+        workers: int = DEFAULT_BULK_WORKERS,
+    ) -> BulkReport:
+        """Delete many series with the series editor, see delete_items()
+
+        Args:
+            serie_ids (Iterable[int]):  Series to delete
+            delete_files (bool): Optional. Also delete files. Default is True
+            add_exclusion: Optionally exclude the series from further tvdb auto add
+            chunk_size (int): Maximum number of series per request
+            workers (int): Number of concurrent requests if series are deleted one by one
+        Returns:
+            Result of each serie, in the order given
+        """
+        options = {"addImportListExclusion": add_exclusion} if add_exclusion else {}
+        return self.delete_items(serie_ids, delete_files, options, chunk_size=chunk_size, workers=workers)
+
+    def edit_serie(self, serie_info: SonarrSerieItem, skip_unchanged: bool = False) -> json_data:
         """Edit a serie from the collection.
 
         The serie description movie_info must be specified, usually by getting the information from get_serie()
 
         Args:
             serie_info (Optional[RadarrMovieItem]): Description of the movie to edit
+            skip_unchanged (bool): If True, nothing is sent if no field of serie_info was modified since it was
+                built, see BaseCliApiItem.changed_fields(). Default is False
         Returns:
-            json response
+            json response, or the unchanged serie as a dict if nothing was sent
         """
+        if serie_info._projection_of is not None:
+            raise SonarrCliError("Error, a projection of a serie only has some of its fields and cannot be edited")
+        if skip_unchanged and not serie_info.is_dirty:
+            log.info("Serie %s not modified, skipping edit", serie_info.id)
+            return serie_info.to_dict()
+
+        res = self.edit_item(json_data=serie_info.to_dict())
+        serie_info.mark_clean()
+        return res
+
+    def edit_series(
+        self,
+        serie_ids: Iterable[int],
+        monitored: Optional[bool] = None,
+        quality: Optional[Union[int, str]] = None,
+        root_folder: Optional[Union[int, str]] = None,
+        tags: Optional[Iterable[Union[int, str]]] = None,
+        apply_tags: str = "add",
+        move_files: bool = False,
+        season_folder: Optional[bool] = None,
+        chunk_size: int = EDITOR_CHUNK_SIZE,
+        workers: int = DEFAULT_BULK_WORKERS,
+    ) -> BulkReport:
+        """Edit many series with the series editor, sending only the fields changed, see edit_items()
 
-        return self.edit_item(json_data=serie_info.to_dict())
+        Args:
+            serie_ids (Iterable[int]): Series to edit
+            monitored (Optional[bool]): Whether to monitor the series
+            quality (Optional[Union[int, str]]): Quality profile id or name
+            root_folder (Optional[Union[int, str]]): Root folder id or path to move the series to
+            tags (Optional[Iterable[Union[int, str]]]): Tag ids or labels
+            apply_tags (str): How tags are applied: "add" (default), "remove" or "replace"
+            move_files (bool): Whether to move files to the new root folder. Default is False
+            season_folder (Optional[bool]): Whether to use a folder for each season
+            chunk_size (int): Maximum number of series per request
+            workers (int): Number of concurrent requests if series are edited one by one
+        Returns:
+            Result of each serie, in the order given
+        """
+        options = {"seasonFolder": season_folder} if season_folder is not None else {}
+        return self.edit_items(
+            serie_ids,
+            monitored=monitored,
+            quality=quality,
+            root_folder=root_folder,
+            tags=tags,
+            apply_tags=apply_tags,
+            move_files=move_files,
+            options=options,
+            chunk_size=chunk_size,
+            workers=workers,
+        )
 
     def refresh_serie(self, serie_id: Optional[int] = None) -> json_data:
         """Refresh serie information  and rescan disk.
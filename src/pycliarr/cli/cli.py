@@ -24,6 +24,9 @@ def _parse_args(cli_mapping: Dict[str, CliApiCommand], config_default: ArgDefaul
     parser.add_argument("--user", "-u", help="Username if using basic authentication", default=None)
     parser.add_argument("--password", "-p", help="Password if using basic authentication", default=None)
     parser.add_argument("--debug", "-d", default=False, action="store_true", help="Enable debug logging")
+    parser.add_argument(
+        "--index", help="Library index file used by offline reads, e.g '/tmp/pycliarr_radarr.idx'", default=None
+    )
     client_subparser = parser.add_subparsers(dest="client")
     client_subparser.required = True
 
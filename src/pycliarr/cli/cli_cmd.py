@@ -6,7 +6,7 @@ from pathlib import Path
 from pprint import pformat
 from typing import Any, Dict, List, Optional, Union, cast, no_type_check
 
-from pycliarr.api import base_api, base_media, exceptions, radarr, sonarr
+from pycliarr.api import base_api, base_media, exceptions, radarr, search, sonarr
 from pycliarr.cli.utils import size_to_str
 
 
@@ -109,16 +109,28 @@ class CliApiArrCommand(CliApiCommand):
     Allows instantiating the relevant communication client, and execute a subcommmand from its name.
     """
 
+    INDEX_DEFAULT = "/tmp/pycliarr_{name}.idx"
+
     def __init__(self, name: str, cli_class: Any, commands: List[CliCommand]) -> None:
         super().__init__(name, commands)
         self.cli_class = cli_class
 
-    def _new_client(self, host: str, api_key: str, username: Optional[str], password: Optional[str]) -> Any:
-        cli = self.cli_class(host, api_key, username=username, password=password)
+    def _new_client(
+        self,
+        host: str,
+        api_key: str,
+        username: Optional[str],
+        password: Optional[str],
+        index_path: Optional[str] = None,
+    ) -> Any:
+        cli = self.cli_class(host, api_key, username=username, password=password, index_path=index_path)
         return cli
 
     def run_command(self, cmd_name: str, args: Namespace) -> None:
-        cli = self._new_client(args.host, args.api_key, username=args.user, password=args.password)
+        index_path = getattr(args, "index", None) or self.INDEX_DEFAULT.format(name=self.name)
+        cli = self._new_client(
+            args.host, args.api_key, username=args.user, password=args.password, index_path=index_path
+        )
         self.cmd_list[cmd_name].run(cli, args)
 
 
@@ -126,7 +138,7 @@ class CliApiArrCommand(CliApiCommand):
 ##########  media specific commands ##########
 ##############################################
 def select_profile(cli: base_media.BaseCliMediaApi) -> int:
-    res = cli.get_quality_profiles()
+    res = cli.quality_profile_registry.entries()
     for profile in res:
         qualities = []
         for qual in profile["items"]:
@@ -191,11 +203,10 @@ def root_folder_id_from_arg(cli: base_media.BaseCliMediaApi, root_arg: str) -> i
             return int(root_arg)
         else:
             # Match the path with registered roots to find id
-            res = cli.get_root_folder()
-            for root_path in res:
-                if root_path["path"] == root_arg:
-                    return int(root_path["id"])
-            raise exceptions.CliArrError(f"No root folder with path '{root_arg}'")
+            root_path = cli.root_folder_registry.get("path", root_arg)
+            if not root_path:
+                raise exceptions.CliArrError(f"No root folder with path '{root_arg}'")
+            return int(root_path["id"])
     return 0
 
 
@@ -205,7 +216,7 @@ class CliGetProfilesCommand(CliCommand):
 
     def run(self, cli: base_media.BaseCliMediaApi, args: Namespace) -> None:
         super().run(cli, args)
-        res = cli.get_quality_profiles()
+        res = cli.quality_profile_registry.entries()
         print("Available quality profiles:\n")
         for profile in res:
             qualities = ",".join([qual["quality"]["name"] for qual in profile["items"] if qual["allowed"]])
@@ -487,10 +498,7 @@ class CliGetTagItemsCommand(CliCommand):
         super().run(cli, args)
         res = None
         if args.label:
-            tags = cli.get_tag_detail()
-            for tag in tags:
-                if tag["label"] == args.label:
-                    res = tag
+            res = cli.tag_registry.get("label", args.label)
         else:
             res = cli.get_tag_detail(args.id)
 
@@ -553,6 +561,52 @@ class CliDeleteExclusionCommand(CliCommand):
         print(f"{pformat(res)}\n")
 
 
+class CliIndexCommand(CliCommand):
+    name = "index"
+    description = "Save the library index used by offline reads"
+
+    def run(self, cli: base_media.BaseCliMediaApi, args: Namespace) -> None:
+        super().run(cli, args)
+        count = cli.save_index()
+        print(f"{count} items indexed in {cli.index_path}")
+
+
+class CliSearchCommand(CliCommand):
+    name = "search"
+    description = "Search the library titles locally, without contacting the metadata provider"
+    SEARCH_INDEX_DEFAULT = "/tmp/pycliarr_{name}_search.json"
+
+    def configure_args(self, cmd_subparser: _SubParsersAction) -> ArgumentParser:
+        cmd_parser = super().configure_args(cmd_subparser)
+        cmd_parser.add_argument("--terms", "-t", help="Words to search in the titles", type=str, required=True)
+        cmd_parser.add_argument("--limit", "-n", help="Maximum number of results", type=int, default=10)
+        cmd_parser.add_argument(
+            "--refresh", "-r", action="store_true", help="Update the search index from the library", default=False
+        )
+        cmd_parser.add_argument(
+            "--offline", action="store_true", help="Read from the library index, see 'index' command", default=False
+        )
+        cmd_parser.add_argument("--json", "-j", action="store_true", help="Print data as json", default=False)
+        return cmd_parser
+
+    def run(self, cli: base_media.BaseCliMediaApi, args: Namespace) -> None:
+        super().run(cli, args)
+        if args.offline:
+            cli.offline = True
+        path = Path(self.SEARCH_INDEX_DEFAULT.format(name=args.cli_name))
+        index = search.TitleSearchIndex.load(path) if path.exists() else search.TitleSearchIndex()
+        if args.refresh or not path.exists():
+            index.refresh(cli)
+            index.save(path)
+
+        res = index.search(args.terms, limit=args.limit)
+        if args.json:
+            print(json.dumps([result.to_dict() for result in res]))
+        else:
+            for result in res:
+                print(f"{result.id}: {result.title}")
+
+
 class CliRootFoldersCommand(CliCommand):
     name = "root-folders"
     description = "Get root folder list"
@@ -580,17 +634,22 @@ class CliGetMovieCommand(CliCommand):
         cmd_parser = super().configure_args(cmd_subparser)
         cmd_parser.add_argument("--mid", "-i", help="ID of the movie to get info on", type=int, default=None)
         cmd_parser.add_argument("--json", "-j", action="store_true", help="Print data as json", default=False)
+        cmd_parser.add_argument(
+            "--offline", action="store_true", help="Read from the library index, see 'index' command", default=False
+        )
         return cmd_parser
 
     def run(self, cli: radarr.RadarrCli, args: Namespace) -> None:
         super().run(cli, args)
+        if args.offline:
+            cli.offline = True
         res = cli.get_movie(args.mid)
         if args.json:
-            if isinstance(res, list):
-                json_objs = [item.to_json() for item in res]
-                print(f"[{','.join(json_objs)}]")
-            else:
+            if isinstance(res, base_api.BaseCliApiItem):
                 print(f"{res.to_json()}")
+            else:
+                base_api.write_json_array(res, sys.stdout)
+                print()
         else:
             print(res)
 
@@ -660,7 +719,7 @@ class CliAddMovieCommand(CliCommand):
         search_group.add_argument(
             "--terms", "-t", help="Keyword to search for the movie to add", type=str, default=None
         )
-        self.add_arg_with_default(cmd_parser, "--quality", None, "-q", help="Quality profile to use", type=int)
+        self.add_arg_with_default(cmd_parser, "--quality", None, "-q", help="Quality profile id or name to use")
         cmd_parser.add_argument("--path", help="Full path where the serie should be stored", type=str, default=None)
         self.add_arg_with_default(
             cmd_parser,
@@ -683,10 +742,11 @@ class CliAddMovieCommand(CliCommand):
         # If no quality profile specified, list them qnd prompt for choice
         if not args.quality:
             args.quality = select_profile(cli)
+        quality = cli.resolve_quality_profile(args.quality)
         root_id = root_folder_id_from_arg(cli, args.root_folder)
 
         res = cli.add_movie(
-            quality=args.quality,
+            quality=quality,
             tmdb_id=args.tmdb,
             imdb_id=args.imdb,
             movie_info=movie_info,  # type: ignore
@@ -698,7 +758,7 @@ class CliAddMovieCommand(CliCommand):
 
 class CliEditMovieCommand(CliCommand):
     name = "edit"
-    description = "Push an updated item to the movie library"
+    description = "Push an updated item, or a json array of items, to the movie library"
 
     def configure_args(self, cmd_subparser: _SubParsersAction) -> ArgumentParser:
         cmd_parser = super().configure_args(cmd_subparser)
@@ -714,9 +774,14 @@ class CliEditMovieCommand(CliCommand):
         if not json_data and args.file:
             with open(args.file, "r") as f:
                 json_data = f.read()
-        info = radarr.RadarrMovieItem.from_json(json_data)
-        res = cli.edit_movie(info)
-        print(f"{json.dumps(res)}")
+        data = json.loads(json_data)
+        if isinstance(data, list):
+            for info in radarr.RadarrMovieItem.from_dicts(data):
+                print(f"{json.dumps(cli.edit_movie(info))}")
+        else:
+            info = radarr.RadarrMovieItem.from_dict(data)
+            res = cli.edit_movie(info)
+            print(f"{json.dumps(res)}")
 
 
 class CliCreateRadarrExclusionCommand(CliCommand):
@@ -774,17 +839,22 @@ class CliGetSerieCommand(CliCommand):
         cmd_parser = super().configure_args(cmd_subparser)
         cmd_parser.add_argument("--sid", "-i", help="ID of the serie to get info on", type=int, default=None)
         cmd_parser.add_argument("--json", "-j", action="store_true", help="Print data as json", default=False)
+        cmd_parser.add_argument(
+            "--offline", action="store_true", help="Read from the library index, see 'index' command", default=False
+        )
         return cmd_parser
 
     def run(self, cli: sonarr.SonarrCli, args: Namespace) -> None:
         super().run(cli, args)
+        if args.offline:
+            cli.offline = True
         res = cli.get_serie(args.sid)
         if args.json:
-            if isinstance(res, list):
-                json_objs = [item.to_json() for item in res]
-                print(f"[{','.join(json_objs)}]")
-            else:
+            if isinstance(res, base_api.BaseCliApiItem):
                 print(f"{res.to_json()}")
+            else:
+                base_api.write_json_array(res, sys.stdout)
+                print()
         else:
             print(res)
 
@@ -848,7 +918,7 @@ class CliAddSerieCommand(CliCommand):
         search_group.add_argument(
             "--terms", "-t", help="Keyword to search for the serie to add", type=str, default=None
         )
-        self.add_arg_with_default(cmd_parser, "--quality", None, "-q", help="Quality profile to use", type=int)
+        self.add_arg_with_default(cmd_parser, "--quality", None, "-q", help="Quality profile id or name to use")
         self.add_arg_with_default(
             cmd_parser, "--seasons", None, "-s", help="Comma separated list of seasons nums", type=str
         )
@@ -882,6 +952,7 @@ class CliAddSerieCommand(CliCommand):
         # If no quality profile specified, list them qnd prompt for choice
         if not args.quality:
             args.quality = select_profile(cli)
+        quality = cli.resolve_quality_profile(args.quality)
         root_id = root_folder_id_from_arg(cli, args.root_folder)
 
         # Get the optional season list
@@ -892,7 +963,7 @@ class CliAddSerieCommand(CliCommand):
             raise Exception(f"Error, invalid season list: {args.seasons} ({e})")
 
         res = cli.add_serie(
-            quality=args.quality,
+            quality=quality,
             tvdb_id=args.tvdb,
             serie_info=serie_info,  # type: ignore
             monitored_seasons=seasons,
@@ -1070,6 +1141,8 @@ CLI_LIST: List[CliApiCommand] = [
             CliCreateSonarrExclusionCommand(),
             CliSearchMissingEpisodes(),
             CliRootFoldersCommand(),
+            CliIndexCommand(),
+            CliSearchCommand(),
             CliRenameEpisodes(),
         ],
     ),
@@ -1107,6 +1180,8 @@ CLI_LIST: List[CliApiCommand] = [
             CliCreateRadarrExclusionCommand(),
             CliSearchMissingMovies(),
             CliRootFoldersCommand(),
+            CliIndexCommand(),
+            CliSearchCommand(),
             CliRenameMovie(),
         ],
     ),
@@ -1,7 +1,11 @@
-from pycliarr.api.base_api import BaseCliApi, BaseCliApiItem
+from pycliarr.api.base_api import BaseCliApi, BaseCliApiItem, iter_json_array, write_json_array, write_ndjson
 from pycliarr.api.base_media import BaseCliMediaApi
-from pycliarr.api.exceptions import CliArrError, CliServerError
+from pycliarr.api.exceptions import CliArrError, CliDecodeError, CliServerError
 from unittest.mock import Mock, patch
+import io
+import json
+import logging
+import pickle
 import pytest
 from pathlib import Path
 
@@ -124,6 +128,19 @@ def test_delete(patch_session):
     assert rep == TEST_JSON
 
 
+@patch("pycliarr.api.base_api.requests.Session")
+def test_delete_json(patch_session):
+    cli = BaseCliApi(TEST_HOST, TEST_APIKEY, username=TEST_USER, password=TEST_PASS)
+    patch_session().request.return_value = mock_response(200, [TEST_JSON])
+    rep = cli.request_delete(TEST_PATH, json_data={'ids': [1, 2]})
+
+    assert patch_session().headers == {"X-Api-Key": TEST_APIKEY}
+    patch_session().request.assert_called_with(
+        "DELETE", f"{TEST_HOST}{TEST_PATH}", params=None, json={'ids': [1, 2]}
+    )
+    assert rep == TEST_JSON
+
+
 @patch("pycliarr.api.base_api.platform.system", return_value="Linux")
 @patch("pycliarr.api.base_api.requests.Session")
 def test_to_path_linux(patch_platform, patch_session):
@@ -167,3 +184,249 @@ def test_base_item():
 
     item = BaseCliApiItem.from_json('{"test": "a"}')
     assert item.to_json() == '{"test": "a"}'
+
+
+class ItemWithList(BaseCliApiItem):
+    __slots__ = ()
+
+    def _model(self):
+        return {"name": "", "values": []}
+
+
+def test_base_item_compact():
+    item = ItemWithList.from_dict({"name": "a"})
+    other = ItemWithList()
+    item.values.append(1)
+
+    assert not hasattr(item, "__dict__")
+    assert other.values == []
+    assert item.to_dict() == {"name": "a", "values": [1]}
+    assert ItemWithList._fields == {"name": 0, "values": 1}
+
+    # Attributes not in the model can still be set
+    item.foo = 1
+    assert item.foo == 1
+    assert item.to_dict() == {"name": "a", "values": [1], "foo": 1}
+    assert not hasattr(item, "__dict__")
+
+
+def test_base_item_pickle():
+    item = ItemWithList(name="a")
+    item.add_attribute("extra", 1)
+    copied = pickle.loads(pickle.dumps(item))
+
+    assert copied.to_dict() == {"name": "a", "values": [], "extra": 1}
+    assert copied.extra == 1
+
+
+def test_base_item_from_dicts():
+    items = ItemWithList.from_dicts([{"name": "a"}, {"name": "b", "values": [1]}])
+
+    assert [item.to_dict() for item in items] == [{"name": "a", "values": []}, {"name": "b", "values": [1]}]
+
+
+def test_base_item_mismatch_report(caplog):
+    with caplog.at_level(logging.INFO):
+        ItemWithList.from_dict({"name": "a", "other": "b"})
+    assert not caplog.records
+
+    with caplog.at_level(logging.DEBUG):
+        ItemWithList.from_dicts([{"name": "a", "other": "b"}])
+    assert "fields not in model: ['other']" in caplog.text
+    assert "model fields not in data: ['values']" in caplog.text
+
+    caplog.clear()
+    ItemWithList.validate_model = True
+    try:
+        with caplog.at_level(logging.WARNING):
+            ItemWithList.from_dict({"name": "a", "other": "b"})
+    finally:
+        ItemWithList.validate_model = False
+    assert caplog.records[0].levelno == logging.WARNING
+
+
+def test_base_item_lazy():
+    data = {"name": "a", "other": "b"}
+    item = ItemWithList.from_dict(data, lazy=True)
+
+    assert item._raw is data
+    assert item.name == "a"
+    assert item._values is None
+
+    # Missing fields resolve to their own copy of the default
+    item.values.append(1)
+    assert item.values == [1]
+    assert ItemWithList().values == []
+    assert item.to_dict() == {"name": "a", "values": [1]}
+
+
+def test_base_item_lazy_update():
+    items = ItemWithList.from_dicts([{"name": "a"}, {"name": "b"}], lazy=True)
+    items[0].name = "c"
+    items[1].add_attribute("extra", 1)
+
+    assert items[0].to_dict() == {"name": "c", "values": []}
+    assert pickle.loads(pickle.dumps(items[1])).to_dict() == {"name": "b", "values": [], "extra": 1}
+
+
+def test_base_item_changed_fields():
+    item = ItemWithList.from_dict({"name": "a", "values": [1]})
+    assert item.changed_fields() == []
+    assert not item.is_dirty
+
+    # Setting the same value is not a change
+    item.name = "a"
+    assert not item.is_dirty
+
+    item.name = "b"
+    item.values.append(2)
+    item.add_attribute("extra", 1)
+    assert item.changed_fields() == ["name", "values", "extra"]
+    assert item.is_dirty
+
+    item.mark_clean()
+    assert not item.is_dirty
+    item.values.remove(2)
+    assert item.changed_fields() == ["values"]
+    assert pickle.loads(pickle.dumps(item)).changed_fields() == ["values"]
+
+
+def test_base_item_changed_fields_lazy():
+    data = {"name": "a", "values": [1]}
+    item = ItemWithList.from_dict(data, lazy=True)
+    item.values.append(2)
+
+    assert item._raw is data
+    assert item.changed_fields() == ["values"]
+    assert ItemWithList(name="b").changed_fields() == ["name"]
+
+
+def test_base_item_read_no_copy():
+    item = ItemWithList.from_dict({"name": "a", "values": [1]}, lazy=True)
+    with patch("pycliarr.api.base_api.deepcopy") as mock_copy:
+        for _ in range(3):
+            assert item.values == [1]
+    mock_copy.assert_not_called()
+    # Reading values without modifying them is not a change
+    assert item.changed_fields() == []
+    assert not item.is_dirty
+    item.values.append(2)
+    assert item.changed_fields() == ["values"]
+    assert pickle.loads(pickle.dumps(item)).changed_fields() == ["values"]
+
+    item = ItemWithList.from_dict({"name": "a", "values": [1]})
+    item.values = [1]
+    item.values.append(2)
+    assert item.changed_fields() == ["values"]
+    item.values.remove(2)
+    assert item.changed_fields() == []
+
+
+def test_iter_json_array():
+    data = '[ {"name": "a", "values": [1, 2]}, 12 , "x]", [], {"name": "b"} ]'
+    expected = [{"name": "a", "values": [1, 2]}, 12, "x]", [], {"name": "b"}]
+
+    assert list(iter_json_array(data)) == expected
+    assert list(iter_json_array(data.encode())) == expected
+    # Small chunks split values, including numbers
+    assert list(iter_json_array(io.StringIO(data), chunk_size=3)) == expected
+    assert list(iter_json_array(io.BytesIO('["é", 1]'.encode()), chunk_size=1)) == ["é", 1]
+    assert list(iter_json_array(" [ ] \n")) == []
+
+    invalid_arrays = ['{"name": "a"}', '[{"name": "a"} {"name": "b"}]', '[{"name": "a"}', "[1,]", "", "[1] 2", "[] ]"]
+    for invalid in invalid_arrays:
+        with pytest.raises(CliDecodeError):
+            list(iter_json_array(io.StringIO(invalid), chunk_size=4))
+
+
+def test_base_item_from_json_list():
+    data = '[{"name": "a"}, {"name": "b", "values": [1]}]'
+    expected = [{"name": "a", "values": []}, {"name": "b", "values": [1]}]
+
+    items = ItemWithList.from_json_list(data)
+    assert isinstance(items, list)
+    assert [item.to_dict() for item in items] == expected
+    assert [item.to_dict() for item in ItemWithList.from_json_list(data.encode(), lazy=True)] == expected
+
+    items = ItemWithList.from_json_list(io.BytesIO(data.encode()), stream=True)
+    assert not isinstance(items, list)
+    assert [item.to_dict() for item in items] == expected
+
+    with pytest.raises(CliDecodeError):
+        ItemWithList.from_json_list('{"name": "a"}')
+    with pytest.raises(CliDecodeError):
+        ItemWithList.from_json_list("[{")
+    with pytest.raises(CliDecodeError):
+        list(ItemWithList.from_json_list('[{"name": "a"}] garbage', stream=True))
+
+
+def test_write_json():
+    items = [ItemWithList(name="a"), ItemWithList(name="b", values=[1])]
+    out = io.StringIO()
+    assert write_json_array(items, out) == 2
+    assert out.getvalue() == f"[{items[0].to_json()},{items[1].to_json()}]"
+
+    out = io.StringIO()
+    assert write_json_array(iter([]), out) == 0
+    assert out.getvalue() == "[]"
+
+    out = io.StringIO()
+    assert write_ndjson(iter(items), out) == 2
+    assert out.getvalue() == '{"name": "a", "values": []}\n{"name": "b", "values": [1]}\n'
+
+
+class InternedItem(BaseCliApiItem):
+    __slots__ = ()
+
+    intern_fields = ("name", "values", "images.type")
+
+    def _model(self):
+        return {"name": "", "values": [], "images": [], "other": ""}
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_base_item_intern(monkeypatch, lazy):
+    data = json.loads(
+        '[{"name": "some name", "values": ["a b"], "images": [{"type": "a b", "url": "u"}], "other": "a b"},'
+        ' {"name": "some name", "values": ["a b", 1], "images": [{"url": "u"}], "other": "a b"}]'
+    )
+    items = InternedItem.from_dicts(data, lazy=lazy)
+    assert items[0].to_dict()["name"] is not items[1].to_dict()["name"]
+
+    monkeypatch.setattr(InternedItem, "intern_strings", True)
+    items = InternedItem.from_dicts(json.loads(json.dumps(data)), lazy=lazy)
+    first, second = items[0].to_dict(), items[1].to_dict()
+    assert first["name"] is second["name"]
+    assert first["values"][0] is second["values"][0]
+    assert first["images"][0]["type"] is second["values"][0]
+    assert first["other"] is not second["other"]
+    assert second["values"] == ["a b", 1]
+    assert InternedItem.from_dict(data[0]).name is second["name"]
+
+
+def test_base_item_intern_invalid():
+    with pytest.raises(AttributeError):
+
+        class InvalidItem(BaseCliApiItem):
+            intern_fields = ("unknown",)
+
+
+def test_base_item_projection():
+    projection = InternedItem.projection(["values", "name"])
+    assert projection is InternedItem.projection(("name", "values"))
+    assert projection.projection(["name"]) is InternedItem.projection(["name"])
+    assert projection._fields == {"name": 0, "values": 1}
+    assert projection.intern_fields == ("name", "values")
+
+    item = projection.from_dict({"name": "a", "values": [1], "other": "b"})
+    assert isinstance(item, InternedItem)
+    assert item.to_dict() == {"name": "a", "values": [1]}
+    with pytest.raises(AttributeError):
+        item.other
+
+    copied = pickle.loads(pickle.dumps(item))
+    assert type(copied) is projection
+    assert copied.to_dict() == item.to_dict()
+
+    with pytest.raises(CliArrError):
+        InternedItem.projection(["name", "unknown"])
@@ -1,7 +1,9 @@
 import pytest
 from unittest.mock import patch
-from pycliarr.api.base_media import BaseCliMediaApi
-from pycliarr.api.exceptions import CliArrError
+from pycliarr.api.base_media import BaseCliMediaApi, _page_plan
+from pycliarr.api.exceptions import CliArrError, CliConnectionError, CliServerError
+from pycliarr.api.snapshot import LibrarySnapshot, SNAPSHOT_ITEMS
+from pycliarr.api.history import HistoryCheckpoint
 from datetime import datetime
 from pathlib import Path
 
@@ -10,6 +12,8 @@ TEST_JSON2 = {'someotherfield': "some other value"}
 TEST_HOST = "http://example.com"
 TEST_APIKEY = "abcd1234"
 TEST_ROOT_PATH = [{"path": "some/path/", "id": 1}, {"path": "yet/otherpath", "id": 3}]
+TEST_TAGS = [{"id": 2, "label": "kids", "movieIds": [1, 2, 3]}, {"id": 5, "label": "anime", "movieIds": []}]
+TEST_PROFILES = [{"id": 1, "name": "Any"}, {"id": 4, "name": "HD-1080p"}]
 
 
 @pytest.fixture
@@ -110,6 +114,110 @@ def test_delete_item_with_options(mock_base, cli):
     assert res == TEST_JSON
 
 
+def editor_error(status_code):
+    return CliServerError("editor error", status_code=status_code, response="")
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_delete", return_value={})
+def test_delete_items(mock_base, cli):
+    report = cli.delete_items([1, 2, 3, 2, 4, 5], delete_files=False, options={"a": "b"}, chunk_size=2)
+    assert [(res.key, res.status) for res in report] == [(idx, "done") for idx in range(1, 6)]
+    assert [call[1]["json_data"] for call in mock_base.call_args_list] == [
+        {"itemIds": [1, 2], "deleteFiles": False, "a": "b"},
+        {"itemIds": [3, 4], "deleteFiles": False, "a": "b"},
+        {"itemIds": [5], "deleteFiles": False, "a": "b"},
+    ]
+    mock_base.assert_called_with(cli.api_url_editor, json_data={"itemIds": [5], "deleteFiles": False, "a": "b"})
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_delete", side_effect=[{}, editor_error(500), {}])
+def test_delete_items_chunk_error(mock_base, cli):
+    report = cli.delete_items(range(5), chunk_size=2)
+    assert [res.status for res in report] == ["done", "done", "failed", "failed", "done"]
+    assert report.failed[0].message == "editor error"
+
+
+@patch("pycliarr.api.base_media.BaseCliMediaApi.delete_item", return_value={})
+@patch("pycliarr.api.base_media.BaseCliApi.request_delete", side_effect=editor_error(405))
+def test_delete_items_fallback(mock_base, mock_delete, cli):
+    report = cli.delete_items([3, 1, 2], delete_files=False, options={"a": "b"}, chunk_size=2, workers=2)
+    assert [(res.key, res.status) for res in report] == [(3, "done"), (1, "done"), (2, "done")]
+    mock_base.assert_called_once()
+    assert sorted(call[0] for call in mock_delete.call_args_list) == [
+        (1, False, {"a": "b"}),
+        (2, False, {"a": "b"}),
+        (3, False, {"a": "b"}),
+    ]
+
+
+@patch("pycliarr.api.base_media.BaseCliMediaApi.get_root_folder", return_value=TEST_ROOT_PATH)
+@patch("pycliarr.api.base_media.BaseCliMediaApi.get_quality_profiles", return_value=TEST_PROFILES)
+@patch("pycliarr.api.base_media.BaseCliMediaApi.get_tag_detail", return_value=TEST_TAGS)
+@patch("pycliarr.api.base_media.BaseCliApi.request_put", return_value={})
+def test_edit_items(mock_put, mock_tags, mock_profiles, mock_root, cli):
+    report = cli.edit_items(
+        [1, 2, 3], monitored=False, quality="hd-1080p", root_folder=3, tags=["Kids", 8], move_files=True, chunk_size=2
+    )
+    assert [res.status for res in report] == ["done"] * 3
+    changes = {
+        "monitored": False,
+        "qualityProfileId": 4,
+        "rootFolderPath": "yet/otherpath",
+        "moveFiles": True,
+        "tags": [2, 8],
+        "applyTags": "add",
+    }
+    assert [call[1]["json_data"] for call in mock_put.call_args_list] == [
+        dict(changes, itemIds=[1, 2]),
+        dict(changes, itemIds=[3]),
+    ]
+    mock_put.assert_called_with(cli.api_url_editor, json_data=dict(changes, itemIds=[3]))
+
+    cli.edit_items([4], tags=["anime"], apply_tags="replace", options={"seasonFolder": True})
+    mock_put.assert_called_with(
+        cli.api_url_editor, json_data={"tags": [5], "applyTags": "replace", "seasonFolder": True, "itemIds": [4]}
+    )
+    cli.edit_items([4], root_folder="/media/new")
+    mock_put.assert_called_with(
+        cli.api_url_editor, json_data={"rootFolderPath": "/media/new", "moveFiles": False, "itemIds": [4]}
+    )
+
+
+@patch("pycliarr.api.base_media.BaseCliMediaApi.get_tag_detail", return_value=TEST_TAGS)
+def test_edit_items_invalid(mock_tags, cli):
+    with pytest.raises(CliArrError):
+        cli.edit_items([1])
+    with pytest.raises(CliArrError):
+        cli.edit_items([1], tags=[2], apply_tags="set")
+    with pytest.raises(CliArrError):
+        cli.edit_items([1], tags=["unknown"], apply_tags="remove")
+
+
+@patch("pycliarr.api.base_media.BaseCliMediaApi.edit_item", side_effect=lambda item, url_params: item)
+@patch("pycliarr.api.base_media.BaseCliApi.request_get")
+@patch("pycliarr.api.base_media.BaseCliApi.request_put", side_effect=editor_error(404))
+def test_edit_items_fallback(mock_put, mock_get, mock_edit, cli):
+    mock_get.side_effect = lambda path: {"id": int(path.split("/")[-1]), "path": "/old/item", "tags": [1, 2]}
+    report = cli.edit_items([1, 2], monitored=True, root_folder="/new", tags=[2, 3], workers=2)
+    assert [res.response for res in report] == [
+        {"id": item_id, "path": "/new/item", "rootFolderPath": "/new", "tags": [1, 2, 3], "monitored": True}
+        for item_id in (1, 2)
+    ]
+    mock_put.assert_called_once()
+    mock_edit.assert_called_with(report.results[1].response, url_params={"moveFiles": False})
+
+    report = cli.edit_items([1], tags=[2, 3], apply_tags="remove")
+    assert report.results[0].response["tags"] == [1]
+    report = cli.edit_items([1], tags=[3], apply_tags="replace")
+    assert report.results[0].response["tags"] == [3]
+    mock_edit.assert_called_with(report.results[0].response, url_params=None)
+
+    # Tags given in options without applyTags are added, like edit_items() and the editor endpoint do
+    report = cli.edit_items([1], options={"tags": [3]})
+    assert report.ok
+    assert report.results[0].response["tags"] == [1, 2, 3]
+
+
 @patch("pycliarr.api.base_media.BaseCliApi.request_get", return_value=TEST_JSON)
 def test_system_status(mock_base, cli):
     res = cli.get_system_status()
@@ -124,6 +232,21 @@ def test_get_quality_profiles(mock_base, cli):
     assert res == TEST_JSON
 
 
+@patch("pycliarr.api.base_media.BaseCliMediaApi.get_quality_profiles", return_value=TEST_PROFILES)
+def test_resolve_quality_profile(mock_profiles, cli):
+    assert cli.resolve_quality_profile(4) == 4
+    assert cli.resolve_quality_profile("4") == 4
+    mock_profiles.assert_not_called()
+
+    assert cli.resolve_quality_profile("hd-1080p") == 4
+    assert cli.resolve_quality_profiles(["Any", 6, "HD-1080p"]) == [1, 6, 4]
+    mock_profiles.assert_called_once()
+    with pytest.raises(CliArrError):
+        cli.resolve_quality_profile("Ultra-HD")
+    # Unknown names fetch the profiles again, in case the profile was just created
+    assert mock_profiles.call_count == 2
+
+
 @patch("pycliarr.api.base_media.BaseCliApi.request_get", return_value=TEST_JSON)
 def test_get_queue(mock_base, cli):
     res = cli.get_queue()
@@ -229,6 +352,35 @@ def test_build_item_path_bad_idx(mock_rootcli, cli):
         cli.build_item_path("some serie", root_folder_id=33)
 
 
+@patch("pycliarr.api.base_media.BaseCliMediaApi.get_root_folder", return_value=TEST_ROOT_PATH)
+def test_build_item_path_cached(mock_rootcli, cli):
+    for _ in range(3):
+        assert cli.build_item_path("some serie", root_folder_id=3) == Path("yet/otherpath/some serie")
+    assert cli.build_item_path("some serie") == Path("some/path/some serie")
+    mock_rootcli.assert_called_once()
+
+    cli.root_folder_registry.invalidate()
+    cli.build_item_path("some serie", root_folder_id=1)
+    assert mock_rootcli.call_count == 2
+
+
+@patch("pycliarr.api.base_media.BaseCliMediaApi.get_root_folder")
+def test_build_item_path_new_root_folder(mock_rootcli, cli):
+    mock_rootcli.return_value = TEST_ROOT_PATH
+    assert cli.build_item_path("some serie") == Path("some/path/some serie")
+
+    # A root folder created since the cache was filled is found
+    mock_rootcli.return_value = TEST_ROOT_PATH + [{"path": "new/path", "id": 7}]
+    assert cli.build_item_path("some serie", root_folder_id=7) == Path("new/path/some serie")
+    assert mock_rootcli.call_count == 2
+
+
+@patch("pycliarr.api.base_media.BaseCliMediaApi.get_root_folder", return_value=[])
+def test_build_item_path_no_root_folder(mock_rootcli, cli):
+    with pytest.raises(CliArrError):
+        cli.build_item_path("some serie")
+
+
 @patch("pycliarr.api.base_media.BaseCliMediaApi.get_root_folder", return_value=TEST_ROOT_PATH)
 def test_build_item_path_default_folder(mock_rootcli):
     cli = BaseCliMediaApi(TEST_HOST, TEST_APIKEY, default_root_folder_id=3)
@@ -351,6 +503,42 @@ def test_create_tag(mock_base, cli):
     assert res == TEST_JSON
 
 
+@patch("pycliarr.api.base_media.BaseCliApi.request_post", side_effect=lambda url, json_data: dict(json_data, id=9))
+@patch("pycliarr.api.base_media.BaseCliMediaApi.get_tag_detail", return_value=TEST_TAGS)
+def test_resolve_tags(mock_detail, mock_post, cli):
+    assert cli.resolve_tags(["Kids", 4, "anime", "new", "NEW"]) == [2, 4, 5, 9, 9]
+    mock_post.assert_called_once_with(cli.api_url_tag, json_data={"id": 0, "label": "new"})
+    # Tags just fetched: the missing label is created without fetching them again
+    mock_detail.assert_called_once()
+
+    # Created tags are added to the registry
+    assert cli.resolve_tags(["new"], create=False) == [9]
+    mock_detail.assert_called_once()
+    assert len(TEST_TAGS) == 2
+
+    # Tags cached: missing labels are looked up again once
+    with pytest.raises(CliArrError):
+        cli.resolve_tags(["other", "other2"], create=False)
+    assert mock_detail.call_count == 2
+    mock_post.assert_called_once()
+
+
+@patch("pycliarr.api.base_media.BaseCliMediaApi.get_tag_detail", return_value=TEST_TAGS)
+def test_tag_registry(mock_detail, cli):
+    cli.item_ids_field = "movieIds"
+    assert cli.get_tag_labels([5, 2]) == ["anime", "kids"]
+    assert cli.get_tagged_ids("KIDS") == [1, 2, 3]
+    assert cli.get_tagged_ids(5) == []
+    mock_detail.assert_called_once()
+    with pytest.raises(CliArrError):
+        cli.get_tagged_ids(7)
+
+    with patch("pycliarr.api.base_media.BaseCliApi.request_put"):
+        cli.edit_tag(2, "children")
+    cli.get_tagged_ids(2)
+    assert mock_detail.call_count == 3
+
+
 @patch("pycliarr.api.base_media.BaseCliApi.request_get", return_value=TEST_JSON)
 def test_get_tag_detail(mock_base, cli):
     res = cli.get_tag_detail(3)
@@ -381,3 +569,259 @@ def test_get_exclusion_all(mock_post, cli):
 def test_delete_exclusion(mock_post, cli):
     cli.delete_exclusion(12345)
     mock_post.assert_called_with(f"{cli.api_url_exclusions}/12345")
+
+
+def fake_pages(total):
+    """Serve total records through paged responses, as the server does."""
+    records = [{"id": i} for i in range(total)]
+
+    def request_get(path, url_params=None):
+        start = (url_params["page"] - 1) * url_params["pageSize"]
+        return {
+            "page": url_params["page"],
+            "pageSize": url_params["pageSize"],
+            "totalRecords": total,
+            "records": records[start:start + url_params["pageSize"]],
+        }
+    return request_get
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_get", side_effect=fake_pages(25))
+def test_iter_history(mock_base, cli):
+    res = cli.iter_history(page_size=10, options={"eventType": 1})
+    mock_base.assert_not_called()
+    assert [record["id"] for record in res] == list(range(25))
+    assert mock_base.call_count == 3
+    mock_base.assert_called_with(
+        cli.api_url_history,
+        url_params={"page": 3, "pageSize": 10, "sortKey": "date", "sortDir": "asc", "eventType": 1},
+    )
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_get", side_effect=fake_pages(20))
+def test_iter_paged(mock_base, cli):
+    assert len(list(cli.iter_queue(page_size=10))) == 20
+    assert len(list(cli.iter_logs(page_size=10))) == 20
+    assert len(list(cli.iter_wanted(page_size=10))) == 20
+    assert len(list(cli.iter_blocklist(page_size=10))) == 20
+    assert mock_base.call_count == 8
+    mock_base.assert_called_with(
+        cli.api_url_blocklist,
+        url_params={"page": 2, "pageSize": 10, "sortKey": "date", "sortDirection": "descending"},
+    )
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_get", side_effect=fake_pages(100))
+def test_iter_paged_early_stop(mock_base, cli):
+    assert [record["id"] for record in cli.iter_logs(page_size=10, max_records=15)] == list(range(15))
+    assert mock_base.call_count == 2
+
+    mock_base.reset_mock()
+    assert len(list(cli.iter_logs(page_size=10, max_records=20))) == 20
+    assert mock_base.call_count == 2
+
+    mock_base.reset_mock()
+    for record in cli.iter_logs(page_size=10):
+        if record["id"] == 3:
+            break
+    assert mock_base.call_count == 1
+
+
+@pytest.mark.parametrize("page_size, total, workers", [(10, 25, 4), (10, 200000, 4), (7, 100, 3), (100, 100, 2)])
+def test_page_plan(page_size, total, workers):
+    plan = _page_plan(page_size, total, workers)
+    offset = page_size
+    for page, size in plan:
+        assert (page - 1) * size == offset
+        assert size <= 1000
+        offset += size
+    assert offset >= total
+    assert len(plan) <= max(0, -(-(total - page_size) // page_size))
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_get", side_effect=fake_pages(2500))
+def test_iter_paged_workers(mock_base, cli):
+    assert [record["id"] for record in cli.iter_history(page_size=10, workers=4)] == list(range(2500))
+    assert mock_base.call_count < 250
+
+    mock_base.reset_mock()
+    assert [record["id"] for record in cli.iter_history(page_size=10, workers=4, max_records=35)] == list(range(35))
+    assert mock_base.call_count == 4
+
+    mock_base.reset_mock()
+    for record in cli.iter_logs(page_size=10, workers=2):
+        if record["id"] == 15:
+            break
+    assert mock_base.call_count <= 5
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_get")
+def test_iter_paged_no_paging(mock_base, cli):
+    mock_base.return_value = [TEST_JSON, TEST_JSON2]
+    assert list(cli.iter_queue()) == [TEST_JSON, TEST_JSON2]
+    assert list(cli.iter_queue(max_records=1)) == [TEST_JSON]
+
+    mock_base.return_value = {"totalRecords": 10, "records": []}
+    assert list(cli.iter_queue()) == []
+
+    with pytest.raises(CliArrError):
+        list(cli.iter_queue(page_size=0))
+
+
+def fake_history(history):
+    """Serve history records newest first, as the server does."""
+    def request_get(path, url_params=None):
+        records = sorted(history, key=lambda record: record[url_params["sortKey"]], reverse=True)
+        start = (url_params["page"] - 1) * url_params["pageSize"]
+        return {"totalRecords": len(records), "records": records[start:start + url_params["pageSize"]]}
+    return request_get
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_get")
+def test_sync_history(mock_base, cli, tmp_path):
+    history = [{"id": i, "date": f"2023-01-01T00:00:{i:02}Z"} for i in range(1, 26)]
+    mock_base.side_effect = fake_history(history)
+    path = tmp_path / "history.json"
+
+    assert [record["id"] for record in cli.sync_history(path, page_size=10)] == list(range(25, 0, -1))
+    assert mock_base.call_count == 3
+    url_params = mock_base.call_args[1]["url_params"]
+    assert url_params["sortKey"] == "id"
+    assert url_params["sortDirection"] == "descending"
+
+    mock_base.reset_mock()
+    assert list(cli.sync_history(path, page_size=10)) == []
+    assert mock_base.call_count == 1
+
+    history.extend({"id": i, "date": f"2023-01-01T00:00:{i:02}Z"} for i in range(26, 29))
+    mock_base.reset_mock()
+    assert [record["id"] for record in cli.sync_history(path, page_size=10)] == [28, 27, 26]
+    assert mock_base.call_count == 1
+
+    # Not saved until all new records are consumed
+    history.append({"id": 29, "date": "2023-01-01T00:00:29Z"})
+    sync = cli.sync_history(path, page_size=10)
+    assert next(sync)["id"] == 29
+    sync.close()
+    assert [record["id"] for record in cli.sync_history(path, page_size=10)] == [29]
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_get")
+def test_sync_history_unordered_ids(mock_base, cli, tmp_path):
+    # Record dates are not in the same order as the ids
+    history = [{"id": i, "date": f"2023-01-01T00:00:{(i * 7) % 10:02}Z"} for i in range(1, 10)]
+    mock_base.side_effect = fake_history(history)
+    path = tmp_path / "history.json"
+
+    assert [record["id"] for record in cli.sync_history(path, page_size=4)] == list(range(9, 0, -1))
+    history.append({"id": 10, "date": "2023-01-01T00:00:00Z"})
+    assert [record["id"] for record in cli.sync_history(path, page_size=4)] == [10]
+    assert HistoryCheckpoint.load(path).last_id == 10
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_get")
+def test_sync_history_errors(mock_base, cli, tmp_path):
+    mock_base.return_value = {"totalRecords": 2, "records": [{"id": 1}, {"id": 2}]}
+    with pytest.raises(CliArrError):
+        list(cli.sync_history(tmp_path / "history.json"))
+
+    mock_base.return_value = {"totalRecords": 0, "records": []}
+    assert list(cli.sync_history(tmp_path / "history.json")) == []
+    other = BaseCliMediaApi("http://other.com", TEST_APIKEY)
+    with pytest.raises(CliArrError):
+        list(other.sync_history(tmp_path / "history.json"))
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_get")
+def test_save_snapshot(mock_base, tmp_path):
+    mock_base.side_effect = [[TEST_JSON], [{"id": 1, "label": "tag"}], TEST_ROOT_PATH, [TEST_JSON2]]
+    cli = BaseCliMediaApi(TEST_HOST, TEST_APIKEY, snapshot_path=tmp_path / "snapshot.json")
+    cli.save_snapshot()
+
+    mock_base.assert_any_call(cli.api_url_item)
+    mock_base.assert_any_call(f"{cli.api_url_tag}/")
+    mock_base.assert_any_call(cli.api_url_rootfolder)
+    mock_base.assert_any_call(cli.api_url_profile)
+    assert (tmp_path / "snapshot.json").exists()
+    assert not cli.snapshot_is_stale
+
+
+def test_save_snapshot_no_path(cli):
+    with pytest.raises(CliArrError):
+        cli.save_snapshot()
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_get")
+def test_offline_read(mock_base, tmp_path):
+    items = [{"id": 1, "title": "a"}, {"id": 2, "title": "b"}]
+    mock_base.side_effect = [items, [{"id": 1, "label": "tag"}], TEST_ROOT_PATH, [TEST_JSON2]]
+    BaseCliMediaApi(TEST_HOST, TEST_APIKEY).save_snapshot(tmp_path / "snapshot.json")
+    mock_base.reset_mock()
+
+    cli = BaseCliMediaApi(TEST_HOST, TEST_APIKEY, snapshot_path=tmp_path / "snapshot.json", offline=True)
+    assert cli.get_item() == items
+    assert cli.get_item(2) == {"id": 2, "title": "b"}
+    assert cli.get_tag(1) == {"id": 1, "label": "tag"}
+    assert cli.get_root_folder() == TEST_ROOT_PATH
+    assert cli.get_quality_profiles() == [TEST_JSON2]
+    assert cli.build_item_path("some serie", root_folder_id=3) == Path("yet/otherpath/some serie")
+    mock_base.assert_not_called()
+
+
+def test_offline_read_no_snapshot(tmp_path):
+    cli = BaseCliMediaApi(TEST_HOST, TEST_APIKEY, snapshot_path=tmp_path / "snapshot.json", offline=True)
+    assert cli.snapshot_is_stale
+    with pytest.raises(CliArrError):
+        cli.get_item()
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_get", side_effect=CliConnectionError("unreachable"))
+def test_offline_fallback(mock_base, tmp_path):
+    snapshot = LibrarySnapshot({SNAPSHOT_ITEMS: [TEST_JSON]}, created=0)
+    cli = BaseCliMediaApi(TEST_HOST, TEST_APIKEY)
+
+    with pytest.raises(CliConnectionError):
+        cli.get_item()
+
+    cli._snapshot = snapshot
+    assert cli.snapshot_is_stale
+    assert cli.get_item() == [TEST_JSON]
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_get")
+def test_save_index(mock_base, tmp_path):
+    items = [{"id": 2, "title": "b"}, {"id": 1, "title": "a"}]
+    mock_base.return_value = items
+    cli = BaseCliMediaApi(TEST_HOST, TEST_APIKEY, index_path=tmp_path / "library.idx")
+    assert cli.index is None
+    assert cli.save_index() == 2
+    mock_base.assert_called_with(cli.api_url_item)
+    assert cli.index_path == tmp_path / "library.idx"
+    assert len(cli.index) == 2
+
+
+def test_save_index_no_path(cli):
+    with pytest.raises(CliArrError):
+        cli.save_index()
+
+
+@patch("pycliarr.api.base_media.BaseCliApi.request_get")
+def test_offline_read_index(mock_base, tmp_path):
+    items = [{"id": 1, "title": "a"}, {"id": 2, "title": "b"}]
+    mock_base.return_value = items
+    BaseCliMediaApi(TEST_HOST, TEST_APIKEY).save_index(tmp_path / "library.idx")
+    mock_base.reset_mock()
+
+    cli = BaseCliMediaApi(TEST_HOST, TEST_APIKEY, index_path=tmp_path / "library.idx", offline=True)
+    assert cli.get_item() == items
+    assert cli.get_item(2) == {"id": 2, "title": "b"}
+    with pytest.raises(CliArrError):
+        cli.get_item(3)
+    # Other sections are still read from the snapshot
+    with pytest.raises(CliArrError):
+        cli.get_tag()
+    mock_base.assert_not_called()
+
+    mock_base.side_effect = CliConnectionError("unreachable")
+    cli.offline = False
+    assert cli.get_item(1) == {"id": 1, "title": "a"}
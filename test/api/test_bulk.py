@@ -0,0 +1,47 @@
+import pytest
+import time
+from pycliarr.api.bulk import BulkReport, BulkResult, run_bulk, STATUS_DONE, STATUS_FAILED, STATUS_SKIPPED
+from pycliarr.api.exceptions import CliArrError
+
+
+def process(key):
+    if key < 0:
+        raise CliArrError(f"bad key {key}")
+    time.sleep(0.01 * (5 - key))
+    return BulkResult(key, STATUS_DONE, item_id=key * 10)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_run_bulk(workers):
+    results = run_bulk(process, [1, -2, 3, 4], workers=workers)
+    assert [(res.key, res.status, res.item_id) for res in results] == [
+        (1, STATUS_DONE, 10),
+        (-2, STATUS_FAILED, None),
+        (3, STATUS_DONE, 30),
+        (4, STATUS_DONE, 40),
+    ]
+    assert results[1].message == "bad key -2"
+
+
+def test_run_bulk_unexpected_error():
+    with pytest.raises(ValueError):
+        run_bulk(lambda key: int(key), ["a"])
+
+
+def test_bulk_report():
+    report = BulkReport([BulkResult(1, STATUS_DONE), BulkResult(2, STATUS_SKIPPED, 5, "exists")])
+    assert len(report) == 2
+    assert report.ok
+    assert [res.key for res in report.skipped] == [2]
+    assert report.to_dict() == {
+        "done": 1,
+        "skipped": 1,
+        "failed": 0,
+        "results": [
+            {"key": 1, "status": "done", "itemId": None, "message": ""},
+            {"key": 2, "status": "skipped", "itemId": 5, "message": "exists"},
+        ],
+    }
+    assert repr(report) == "<BulkReport done=1 skipped=1 failed=0>"
+    report.results.append(BulkResult(3, STATUS_FAILED))
+    assert not report.ok
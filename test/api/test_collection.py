@@ -0,0 +1,122 @@
+import copy
+import io
+import json
+import pytest
+from unittest.mock import patch
+from pycliarr.api import collection
+from pycliarr.api.collection import ItemCollection
+from pycliarr.api.exceptions import CliArrError
+from pycliarr.api.radarr import RadarrCli, RadarrMovieItem
+from pycliarr.api.sonarr import SonarrSerieItem
+
+TEST_MOVIES = [
+    {"id": 1, "title": "a", "hasFile": False, "sizeOnDisk": 0, "qualityProfileId": 1},
+    {"id": 2, "title": "b", "hasFile": True, "sizeOnDisk": 300, "qualityProfileId": 2},
+    {"id": 3, "title": "c", "hasFile": True, "sizeOnDisk": 100, "qualityProfileId": 1},
+    {"id": 4, "title": "d", "hasFile": True, "sizeOnDisk": 200, "qualityProfileId": 1},
+]
+
+
+@pytest.fixture(params=["numpy", "fallback"])
+def movies(request, monkeypatch):
+    if request.param == "fallback":
+        monkeypatch.setattr(collection, "np", None)
+    elif collection.np is None:
+        pytest.skip("numpy not available")
+    return ItemCollection(RadarrMovieItem, TEST_MOVIES)
+
+
+def ids(items):
+    return [item.id for item in items]
+
+
+def test_collection_items(movies):
+    assert len(movies) == 4
+    assert movies[1].title == "b"
+    assert ids(movies) == [1, 2, 3, 4]
+    assert movies.to_list()[0].to_dict()["monitored"] is True
+    assert "sizeOnDisk" in movies.columns
+    assert list(movies.column("title")) == ["a", "b", "c", "d"]
+
+
+def test_collection_shared_rows():
+    rows = [{"id": 1, "title": "a", "tags": [1]}]
+    movies = ItemCollection(RadarrMovieItem, rows)
+
+    movies[0].title = "b"
+    assert movies[0].title == "a"
+    movies[0].tags.append(9)
+    assert rows[0]["tags"] == [1, 9]
+    assert movies[0].tags == [1, 9]
+    copy.deepcopy(movies[0]).tags.append(10)
+    assert rows[0]["tags"] == [1, 9]
+
+
+def test_collection_filter(movies):
+    assert ids(movies.where("hasFile", "==", True).where("sizeOnDisk", ">", 150)) == [2, 4]
+    assert ids(movies.where("qualityProfileId", "in", [2, 3])) == [2]
+    assert ids(movies.where("title", "not in", ["a", "b"])) == [3, 4]
+    assert ids(movies.filter([True, False, False, True])) == [1, 4]
+
+    with pytest.raises(CliArrError):
+        movies.mask("id", "~", 1)
+    with pytest.raises(CliArrError):
+        movies.filter([True])
+
+
+def test_collection_sort(movies):
+    assert ids(movies.sort("sizeOnDisk")) == [1, 3, 4, 2]
+    assert ids(movies.sort("sizeOnDisk", reverse=True)) == [2, 4, 3, 1]
+    assert ids(movies.sort("title", reverse=True)) == [4, 3, 2, 1]
+
+    # Equal values keep their order
+    rows = [{"id": idx, "sizeOnDisk": size} for idx, size in enumerate([5, 5, 7, 5], 1)]
+    ties = ItemCollection(RadarrMovieItem, rows)
+    assert ids(ties.sort("sizeOnDisk")) == [1, 2, 4, 3]
+    assert ids(ties.sort("sizeOnDisk", reverse=True)) == [3, 1, 2, 4]
+
+
+def test_collection_group_sum(movies):
+    groups = movies.where("hasFile", "==", True).group_by("qualityProfileId")
+
+    assert {profile: group.sum("sizeOnDisk") for profile, group in groups.items()} == {1: 300, 2: 300}
+    assert movies.sum("hasFile") == 3
+
+
+def test_collection_write(movies):
+    out = io.StringIO()
+    assert movies.where("hasFile", "==", True).write_json_array(out) == 3
+    assert [movie["id"] for movie in json.loads(out.getvalue())] == [2, 3, 4]
+
+    out = io.StringIO()
+    assert movies.write_ndjson(out) == 4
+    lines = out.getvalue().splitlines()
+    assert json.loads(lines[0]) == RadarrMovieItem.from_dict(TEST_MOVIES[0]).to_dict()
+
+
+def test_collection_nested_column():
+    series = ItemCollection(
+        SonarrSerieItem,
+        [{"id": 1, "statistics": {"sizeOnDisk": 10}}, {"id": 2, "statistics": {}}, {"id": 3}],
+        columns=["statistics.sizeOnDisk"],
+    )
+    assert list(series.column("statistics.sizeOnDisk")) == [10, None, None]
+    assert ids(series.where("id", ">=", 2)) == [2, 3]
+
+
+def test_collection_missing_values(movies):
+    rows = [{"id": 1, "ratings": {"imdb": {"value": 7}}}, {"id": 2}, {"id": 3, "ratings": {"imdb": {"value": 4}}}]
+    movies = ItemCollection(RadarrMovieItem, rows)
+
+    assert movies.sum("ratings.imdb.value") == 11
+    assert ids(movies.where("ratings.imdb.value", ">", 5)) == [1]
+    assert ids(movies.where("ratings.imdb.value", "<=", 5)) == [3]
+    assert ids(movies.sort("ratings.imdb.value")) == [3, 1, 2]
+    assert ids(movies.sort("ratings.imdb.value", reverse=True)) == [1, 3, 2]
+
+
+@patch("pycliarr.api.radarr.BaseCliMediaApi.get_item", return_value=TEST_MOVIES)
+def test_get_movie_collection(mock_base):
+    res = RadarrCli("http://example.com", "abcd1234").get_movie(as_collection=True)
+    assert isinstance(res, ItemCollection)
+    assert ids(res.sort("sizeOnDisk")) == [1, 3, 4, 2]
@@ -0,0 +1,77 @@
+from pycliarr.api.diff import diff_items, hash_items, item_hash
+from pycliarr.api.radarr import RadarrMovieItem
+
+OLD_MOVIES = [
+    {"id": 1, "title": "a", "tags": [1]},
+    {"id": 2, "title": "b", "tags": [1], "sizeOnDisk": 10},
+    {"id": 3, "title": "c"},
+]
+NEW_MOVIES = [
+    {"id": 1, "title": "a", "tags": [1]},
+    {"id": 2, "title": "b", "tags": [1, 2], "sizeOnDisk": 20},
+    {"id": 4, "title": "d"},
+]
+
+
+def test_item_hash():
+    movie = RadarrMovieItem.from_dict(OLD_MOVIES[0])
+    assert item_hash(movie) == item_hash(RadarrMovieItem.from_dict({"id": 1, "title": "a", "tags": [1]}))
+    assert len(item_hash(movie)) == 32
+
+    other = RadarrMovieItem.from_dict(OLD_MOVIES[0])
+    other.title = "b"
+    assert item_hash(other) != item_hash(movie)
+    assert item_hash(other, ignore=["title"]) == item_hash(movie, ignore=["title"])
+
+    other = RadarrMovieItem.from_dict(OLD_MOVIES[0])
+    other.add_attribute("extra", 1)
+    assert item_hash(other) != item_hash(movie)
+
+
+def test_diff_items():
+    old = RadarrMovieItem.from_dicts(OLD_MOVIES)
+    new = RadarrMovieItem.from_dicts(NEW_MOVIES, lazy=True)
+    diff = diff_items(old, new)
+
+    assert diff
+    assert [movie.id for movie in diff.added] == [4]
+    assert [movie.id for movie in diff.removed] == [3]
+    assert diff.unchanged == 1
+    assert len(diff.modified) == 1
+    change = diff.modified[0]
+    assert change.key == 2
+    assert change.old is old[1]
+    assert change.new is new[1]
+    assert change.fields == {"sizeOnDisk": (10, 20), "tags": ([1], [1, 2])}
+
+    diff = diff_items(old, new, ignore=["tags", "sizeOnDisk"])
+    assert diff.unchanged == 2
+    assert not diff.modified
+
+    assert not diff_items(old, RadarrMovieItem.from_dicts(OLD_MOVIES))
+
+
+def test_diff_items_extra():
+    old = RadarrMovieItem.from_dicts(OLD_MOVIES[:1])
+    new = RadarrMovieItem.from_dicts(OLD_MOVIES[:1])
+    new[0].add_attribute("extra", 1)
+
+    diff = diff_items(old, new)
+    assert diff.modified[0].fields == {"extra": (None, 1)}
+    assert not diff_items(old, new, ignore=["extra"])
+
+
+def test_diff_hashes():
+    hashes = hash_items(RadarrMovieItem.from_dicts(OLD_MOVIES))
+    assert list(hashes) == [1, 2, 3]
+
+    diff = diff_items(hashes, iter(RadarrMovieItem.from_dicts(NEW_MOVIES)))
+    assert [movie.id for movie in diff.added] == [4]
+    assert diff.removed == [3]
+    assert diff.unchanged == 1
+    assert diff.modified[0].key == 2
+    assert diff.modified[0].old is None
+    assert diff.modified[0].fields == {}
+
+    hashes = hash_items(RadarrMovieItem.from_dicts(OLD_MOVIES), ignore=["tags", "sizeOnDisk"])
+    assert diff_items(hashes, RadarrMovieItem.from_dicts(NEW_MOVIES), ignore=["tags", "sizeOnDisk"]).unchanged == 2
@@ -0,0 +1,37 @@
+import pytest
+from pycliarr.api.history import HistoryCheckpoint
+from pycliarr.api.exceptions import CliArrError
+
+
+def test_checkpoint_advance():
+    checkpoint = HistoryCheckpoint(last_id=10)
+    assert checkpoint.is_new({"id": 11})
+    assert not checkpoint.is_new({"id": 10})
+
+    checkpoint.advance({"id": 12, "date": "2023-01-02T00:00:00Z"})
+    assert checkpoint.last_id == 12
+    assert checkpoint.last_date == "2023-01-02T00:00:00Z"
+    checkpoint.advance({"id": 5, "date": "2023-01-01T00:00:00Z"})
+    assert checkpoint.last_id == 12
+
+
+def test_checkpoint_save_load(tmp_path):
+    path = tmp_path / "history.json"
+    HistoryCheckpoint(12, last_date="2023-01-02T00:00:00Z", source="http://example.com", updated=1).save(path)
+
+    loaded = HistoryCheckpoint.load(path)
+    assert loaded.last_id == 12
+    assert loaded.last_date == "2023-01-02T00:00:00Z"
+    assert loaded.source == "http://example.com"
+    assert loaded.updated == 1
+    assert not (tmp_path / "history.json.tmp").exists()
+
+
+def test_checkpoint_load_invalid(tmp_path):
+    with pytest.raises(CliArrError):
+        HistoryCheckpoint.load(tmp_path / "missing.json")
+
+    path = tmp_path / "history.json"
+    path.write_text('{"version": 2, "lastId": 1}')
+    with pytest.raises(CliArrError):
+        HistoryCheckpoint.load(path)
@@ -0,0 +1,70 @@
+import pytest
+import time
+from pycliarr.api.index import LibraryIndex
+from pycliarr.api.radarr import RadarrMovieItem
+from pycliarr.api.exceptions import CliArrError, CliDecodeError
+
+TEST_ITEMS = [
+    {"id": 12, "title": "The Matrix"},
+    {"id": 3, "title": "the matrix reloaded"},
+    {"id": 7, "title": "Alien"},
+    {"id": 40, "title": "Été"},
+]
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    path = tmp_path / "library.idx"
+    assert LibraryIndex.build(path, TEST_ITEMS) == 4
+    return path
+
+
+def test_index_get(index_path):
+    with LibraryIndex(index_path) as index:
+        assert len(index) == 4
+        assert index.get(12) == {"id": 12, "title": "The Matrix"}
+        assert index.get(3) == {"id": 3, "title": "the matrix reloaded"}
+        assert index.get(40) == {"id": 40, "title": "Été"}
+        assert index.get(5) is None
+        assert index.get(100) is None
+
+
+def test_index_search_title(index_path):
+    with LibraryIndex(index_path) as index:
+        assert [item["id"] for item in index.search_title("THE MATRIX")] == [12, 3]
+        assert [item["id"] for item in index.search_title("the matrix", limit=1)] == [12]
+        assert [item["id"] for item in index.search_title("été")] == [40]
+        assert [item["id"] for item in index.search_title("")] == [7, 12, 3, 40]
+        assert index.search_title("zorro") == []
+
+
+def test_index_iter(index_path):
+    with LibraryIndex(index_path) as index:
+        assert [item["id"] for item in index] == [3, 7, 12, 40]
+
+
+def test_index_items(tmp_path):
+    path = tmp_path / "library.idx"
+    LibraryIndex.build(path, [RadarrMovieItem(id=1, title="some movie")], created=0)
+    with LibraryIndex(path) as index:
+        assert index.get(1)["title"] == "some movie"
+        assert index.is_stale(60)
+        assert not LibraryIndex.build(path, [])
+    with LibraryIndex(path) as index:
+        assert len(index) == 0
+        assert index.get(1) is None
+        assert not index.is_stale(60)
+        assert index.age < 60
+
+
+def test_index_invalid(tmp_path):
+    with pytest.raises(CliArrError):
+        LibraryIndex(tmp_path / "missing.idx")
+
+    path = tmp_path / "invalid.idx"
+    path.write_bytes(b"PYCLI")
+    with pytest.raises(CliDecodeError):
+        LibraryIndex(path)
+    path.write_bytes(b"NOTINDEX" + bytes(64))
+    with pytest.raises(CliDecodeError):
+        LibraryIndex(path)
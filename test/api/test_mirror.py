@@ -0,0 +1,110 @@
+import pytest
+from unittest.mock import patch
+from pycliarr.api.mirror import LibraryMirror
+from pycliarr.api.radarr import RadarrCli, RadarrMovieItem
+from pycliarr.api.sonarr import SonarrCli
+from pycliarr.api.exceptions import CliArrError
+
+TEST_HOST = "http://example.com"
+TEST_APIKEY = "abcd1234"
+TEST_TAGS = [{"id": 1, "label": "kids"}, {"id": 2, "label": "4k"}]
+TEST_PROFILES = [{"id": 4, "name": "HD"}]
+TEST_ROOT_FOLDERS = [{"id": 1, "path": "/media"}]
+
+
+def fake_server(cli, items, episodes=None):
+    def request_get(path, url_params=None):
+        if path == cli.api_url_item:
+            return items
+        if path == f"{cli.api_url_tag}/":
+            return TEST_TAGS
+        if path == cli.api_url_profile:
+            return TEST_PROFILES
+        if path == cli.api_url_rootfolder:
+            return TEST_ROOT_FOLDERS
+        if path == getattr(cli, "api_url_episode", None):
+            return episodes[url_params["seriesId"]]
+        raise AssertionError(f"Unexpected request {path}")
+    return request_get
+
+
+def test_mirror_movies(tmp_path):
+    cli = RadarrCli(TEST_HOST, TEST_APIKEY)
+    movies = [
+        {"id": 1, "title": "B movie", "sortTitle": "b movie", "monitored": True, "tags": [1], "qualityProfileId": 4},
+        {"id": 2, "title": "A movie", "sortTitle": "a movie", "monitored": False, "tags": [1, 2]},
+        {"id": 3, "title": "C movie", "sortTitle": "c movie", "monitored": True, "sizeOnDisk": 10},
+    ]
+    with patch("pycliarr.api.radarr.RadarrCli.request_get", side_effect=fake_server(cli, movies)):
+        with LibraryMirror(cli, tmp_path / "mirror.db") as mirror:
+            assert mirror.refreshed is None
+            assert mirror.is_stale(60)
+            report = mirror.refresh()
+            assert (report.added, report.updated, report.removed, report.unchanged) == (3, 0, 0, 0)
+            assert not mirror.is_stale(60)
+
+            assert mirror.get(3) == movies[2]
+            assert mirror.get(5) is None
+            assert isinstance(mirror.get_item(1), RadarrMovieItem)
+            assert mirror.get_item(1).title == "B movie"
+            assert [movie["id"] for movie in mirror.items()] == [2, 1, 3]
+            assert [movie["id"] for movie in mirror.items(tag=1)] == [2, 1]
+            assert [movie["id"] for movie in mirror.items(tag=1, monitored=True)] == [1]
+            assert [movie["id"] for movie in mirror.items(quality_profile_id=4)] == [1]
+            assert mirror.tags() == TEST_TAGS
+            assert mirror.quality_profiles() == TEST_PROFILES
+            assert mirror.root_folders() == TEST_ROOT_FOLDERS
+            assert mirror.query("SELECT SUM(size_on_disk) FROM items")[0][0] == 10
+
+        movies[0] = dict(movies[0], monitored=False, tags=[])
+        del movies[2]
+        movies.append({"id": 4, "title": "D movie", "sortTitle": "d movie"})
+        with LibraryMirror(cli, tmp_path / "mirror.db") as mirror:
+            report = mirror.refresh()
+            assert (report.added, report.updated, report.removed, report.unchanged) == (1, 1, 1, 1)
+            assert [movie["id"] for movie in mirror.items()] == [2, 1, 4]
+            assert [movie["id"] for movie in mirror.items(tag=1)] == [2]
+
+
+def test_mirror_series_episodes(tmp_path):
+    cli = SonarrCli(TEST_HOST, TEST_APIKEY)
+    series = [
+        {"id": 1, "title": "Serie", "sortTitle": "serie", "statistics": {"episodeFileCount": 1},
+         "seasons": [{"seasonNumber": 1, "statistics": {"episodeFileCount": 1}}]},
+        {"id": 2, "title": "Other", "sortTitle": "other", "statistics": {"episodeFileCount": 0}},
+    ]
+    episodes = {
+        1: [{"id": 11, "seasonNumber": 1, "episodeNumber": 2, "hasFile": False},
+            {"id": 10, "seasonNumber": 1, "episodeNumber": 1, "hasFile": True}],
+        2: [{"id": 20, "seasonNumber": 2, "episodeNumber": 1, "hasFile": False}],
+    }
+    with patch("pycliarr.api.sonarr.SonarrCli.request_get", side_effect=fake_server(cli, series, episodes)) as get:
+        with LibraryMirror(cli, tmp_path / "mirror.db") as mirror:
+            assert mirror.refresh().episodes_refreshed == 2
+            assert [episode["id"] for episode in mirror.episodes(1)] == [10, 11]
+            assert [episode["id"] for episode in mirror.episodes(1, has_file=False)] == [11]
+            assert [episode["id"] for episode in mirror.episodes(2, season=1)] == []
+
+            # Only the series whose statistics changed get their episodes fetched again
+            series[0] = dict(series[0], monitored=True)
+            series[1] = dict(series[1], statistics={"episodeFileCount": 1})
+            episodes[2][0] = dict(episodes[2][0], hasFile=True)
+            get.reset_mock()
+            report = mirror.refresh()
+            assert (report.updated, report.episodes_refreshed) == (2, 1)
+            assert get.call_count == 5
+            assert [episode["id"] for episode in mirror.episodes(2, has_file=True)] == [20]
+
+            del series[1]
+            assert mirror.refresh().removed == 1
+            assert mirror.episodes(2) == []
+            assert mirror.query("SELECT COUNT(*) FROM episodes")[0][0] == 2
+
+
+def test_mirror_other_host(tmp_path):
+    cli = RadarrCli(TEST_HOST, TEST_APIKEY)
+    with patch("pycliarr.api.radarr.RadarrCli.request_get", side_effect=fake_server(cli, [])):
+        with LibraryMirror(cli, tmp_path / "mirror.db") as mirror:
+            mirror.refresh()
+    with pytest.raises(CliArrError):
+        LibraryMirror(RadarrCli("http://other.com", TEST_APIKEY), tmp_path / "mirror.db")
@@ -0,0 +1,153 @@
+import pickle
+from typing import List
+
+import pytest
+
+from pycliarr.api import RadarrMovieItem, RadarrMovieModel, SonarrSerieItem, SonarrSerieModel
+from pycliarr.api.exceptions import CliArrError
+from pycliarr.api.models import Image, RadarrRating, Season, SeasonStatistics, TypedModel, typed_model
+
+TEST_SERIE = {
+    "title": "some serie",
+    "statistics": {"seasonCount": 2, "sizeOnDisk": 1234, "releaseGroups": ["grp"]},
+    "images": [{"coverType": "poster", "url": "/poster.jpg", "remoteUrl": "http://poster.jpg"}],
+    "seasons": [
+        {"seasonNumber": 1, "monitored": False, "statistics": {"episodeCount": 10, "sizeOnDisk": 1234}},
+        {"seasonNumber": 2, "monitored": True},
+    ],
+    "ratings": {"votes": 12, "value": 7.5},
+    "tags": [1, 2],
+    "id": 3,
+}
+
+
+def test_model_defaults():
+    movie = RadarrMovieModel()
+    assert movie.to_dict() == RadarrMovieItem().to_dict()
+    assert movie.tags == []
+    assert movie.tags is not RadarrMovieModel().tags
+    assert movie.monitored is True
+
+    movie = RadarrMovieModel(title="some movie", tags=[1])
+    assert movie.title == "some movie"
+    assert movie.tags == [1]
+
+
+def test_model_slots():
+    movie = RadarrMovieModel()
+    assert not hasattr(movie, "__dict__")
+    with pytest.raises(AttributeError):
+        movie.unknown = 1
+
+
+def test_model_nested():
+    serie = SonarrSerieModel.from_dict(TEST_SERIE)
+    assert serie.title == "some serie"
+    assert serie.statistics.sizeOnDisk == 1234
+    assert serie.statistics.releaseGroups == ["grp"]
+    assert serie.images == [Image(coverType="poster", url="/poster.jpg", remoteUrl="http://poster.jpg")]
+    assert serie.seasons[0].statistics == SeasonStatistics(episodeCount=10, sizeOnDisk=1234)
+    assert serie.seasons[1] == Season(seasonNumber=2, monitored=True)
+    assert serie.ratings.value == 7.5
+    assert serie.year == 0
+
+    movie = RadarrMovieModel.from_dict({"ratings": {"imdb": {"votes": 1, "value": 6.5, "type": "user"}}})
+    assert movie.ratings == {"imdb": RadarrRating(votes=1, value=6.5, type="user")}
+
+
+def test_model_to_dict():
+    serie = SonarrSerieModel.from_dict(TEST_SERIE)
+    res = serie.to_dict()
+    # Fields missing from the dict are not written
+    assert res == TEST_SERIE
+    assert res["seasons"][0]["statistics"]["episodeCount"] == 10
+    assert res["ratings"] == {"votes": 12, "value": 7.5}
+    assert SonarrSerieModel.from_dict(res) == serie
+    assert SonarrSerieModel.from_json(serie.to_json()) == serie
+
+    # Fields set after the model is built are written
+    serie.seasons[1].statistics = SeasonStatistics(episodeCount=3)
+    assert serie.to_dict()["seasons"][1]["statistics"]["episodeCount"] == 3
+
+    # Unset nested models are serialized as in the item model
+    res = SonarrSerieModel().to_dict()
+    assert set(res) == set(SonarrSerieItem._fields)
+    assert res["statistics"] == {}
+    assert res["ratings"] == {}
+
+
+def test_model_items():
+    item = SonarrSerieItem.from_dict(TEST_SERIE)
+    serie = SonarrSerieModel.from_item(item)
+    assert serie.seasons[0].seasonNumber == 1
+
+    res = serie.to_item()
+    assert isinstance(res, SonarrSerieItem)
+    assert res.title == "some serie"
+    assert res.seasons[0]["statistics"]["sizeOnDisk"] == 1234
+
+    with pytest.raises(CliArrError):
+        Image().to_item()
+
+
+def test_model_items_lossless():
+    data = dict(
+        TEST_SERIE,
+        images=[{"coverType": "poster", "url": "/poster.jpg"}],
+        seasons=[
+            {
+                "seasonNumber": 1,
+                "monitored": True,
+                "images": [{"coverType": "banner"}],
+                "statistics": {"episodeCount": 10, "lastAired": "2023-01-01"},
+            }
+        ],
+        statistics={"seasonCount": 1, "lastAired": "2023-01-01"},
+        languageProfileId=2,
+    )
+    item = SonarrSerieItem.from_dict(data)
+    assert SonarrSerieModel.from_item(item).to_item().to_dict() == item.to_dict()
+    assert SonarrSerieModel.from_dict(data).to_dict() == data
+
+
+def test_model_from_dicts():
+    res = RadarrMovieModel.from_dicts([{"id": 1}, {"id": 2}])
+    assert [movie.id for movie in res] == [1, 2]
+
+
+def test_model_pickle():
+    serie = SonarrSerieModel.from_dict(TEST_SERIE)
+    assert pickle.loads(pickle.dumps(serie)) == serie
+
+
+def test_model_repr():
+    assert repr(Image(url="u")) == "Image(coverType='', url='u', remoteUrl='')"
+
+
+def test_typed_model_errors():
+    with pytest.raises(TypeError):
+
+        @typed_model(RadarrMovieItem)
+        class PartialMovie(TypedModel):
+            title: str
+
+    with pytest.raises(TypeError):
+
+        @typed_model()
+        class NoDefault(TypedModel):
+            names: List[str]
+
+    class NotDecorated(TypedModel):
+        title: str = ""
+
+    with pytest.raises(TypeError):
+        NotDecorated()
+    with pytest.raises(TypeError):
+        TypedModel()
+
+
+def test_model_to_dict_empty_copy():
+    movie = RadarrMovieModel()
+    movie.images = None  # type: ignore
+    movie.to_dict()["images"].append({"url": "u"})
+    assert movie.to_dict()["images"] == []
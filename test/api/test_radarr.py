@@ -2,7 +2,8 @@ import pytest
 from copy import deepcopy
 from unittest.mock import patch
 from pycliarr.api.radarr import RadarrCli, RadarrMovieItem
-from pycliarr.api.exceptions import RadarrCliError
+from pycliarr.api.exceptions import CliArrError, RadarrCliError
+from pycliarr.api.snapshot import LibrarySnapshot, SNAPSHOT_ITEMS
 
 TEST_ROOT_PATH = [{"path": "some/path/", "id": 1}, {"path": "yet/otherpath/", "id": 3}]
 TEST_JSON = {'somefield': "some value"}
@@ -70,6 +71,35 @@ def test_get_movie_with_id(mock_base, cli):
     assert res[0].year == 2020
 
 
+@patch("pycliarr.api.radarr.BaseCliMediaApi.get_item", return_value=[TEST_MOVIE])
+def test_get_movie_lazy(mock_base, cli):
+    res = cli.get_movie(lazy=True)
+    assert res[0].title == "some movie"
+    assert res[0].to_dict() == {**TEST_MOVIEINFO, "year": 2020}
+
+
+@patch("pycliarr.api.radarr.BaseCliMediaApi.get_item", return_value=[TEST_MOVIE])
+def test_get_movie_fields(mock_base, cli):
+    res = cli.get_movie(fields=["title", "id"], lazy=True)
+    assert isinstance(res[0], RadarrMovieItem)
+    assert res[0].to_dict() == {"title": "some movie", "id": 0}
+    with pytest.raises(AttributeError):
+        res[0].year
+    with pytest.raises(RadarrCliError):
+        cli.edit_movie(res[0])
+
+    res = cli.get_movie(fields=["year"], as_collection=True)
+    assert res.item_class is type(cli.get_movie(fields=["year"])[0])
+    assert list(res.column("year")) == [2020]
+    assert res._rows == [{"year": 2020}]
+
+
+@patch("pycliarr.api.radarr.BaseCliMediaApi.lookup_item", return_value=[TEST_MOVIE, TEST_MOVIE])
+def test_lookup_movie_fields(mock_base, cli):
+    res = cli.lookup_movie(term="some title", fields=["title"])
+    assert [movie.to_dict() for movie in res] == [{"title": "some movie"}] * 2
+
+
 @patch("pycliarr.api.radarr.BaseCliMediaApi.lookup_item", return_value=[TEST_MOVIE, TEST_MOVIE])
 def test_lookup_movie_with_term(mock_base, cli):
     res = cli.lookup_movie(term="some title")
@@ -163,6 +193,48 @@ def test_add_movie_withimdb(mock_add, mock_root, mock_get, cli):
     mock_add.assert_called_with(json_data=exp)
 
 
+def test_get_movie_offline_copy():
+    cli = RadarrCli(TEST_HOST, TEST_APIKEY, offline=True)
+    cli._snapshot = LibrarySnapshot({SNAPSHOT_ITEMS: [{"id": 1, "title": "some movie", "tags": [1]}]})
+    movie = cli.get_movie(1)
+    movie.tags.append(99)
+    cli.get_movie()[0].tags.append(98)
+
+    assert cli.get_movie(1).tags == [1]
+    assert cli.get_movie()[0].tags == [1]
+
+
+@patch("pycliarr.api.radarr.BaseCliMediaApi.get_root_folder", return_value=TEST_ROOT_PATH)
+@patch("pycliarr.api.radarr.BaseCliMediaApi.request_get", return_value=[{"id": 7, "tmdbId": 11, "imdbId": "tt22"}])
+@patch("pycliarr.api.radarr.BaseCliMediaApi.add_item", side_effect=lambda json_data: {"id": 100 + json_data["tmdbId"]})
+@patch("pycliarr.api.radarr.RadarrCli.lookup_movie")
+def test_add_movies(mock_lookup, mock_add, mock_get, mock_root, cli):
+    def lookup(tmdb_id=None, imdb_id=None):
+        if tmdb_id == 404:
+            return None
+        return RadarrMovieItem(title=f"movie {tmdb_id}", tmdbId=tmdb_id or int(imdb_id[2:]))
+
+    mock_lookup.side_effect = lookup
+    report = cli.add_movies([1, 11, "tt22", 1, 404, "tt3"], quality=2, search=False, workers=2)
+    assert [(res.key, res.status, res.item_id) for res in report] == [
+        (1, "done", 101),
+        (11, "skipped", 7),
+        ("tt22", "skipped", 7),
+        (404, "failed", None),
+        ("tt3", "done", 103),
+    ]
+    assert not report.ok
+    assert report.to_dict()["done"] == 2
+    assert mock_lookup.call_count == 3
+    assert mock_add.call_count == 2
+    mock_get.assert_called_once_with(cli.api_url_item)
+    mock_root.assert_called_once()
+    added = mock_add.call_args_list[0][1]["json_data"]
+    assert added["qualityProfileId"] == 2
+    assert added["path"] == "some/path/movie 1"
+    assert added["addOptions"] == {"searchForMovie": False}
+
+
 @patch("pycliarr.api.radarr.BaseCliMediaApi.get_root_folder", return_value=TEST_ROOT_PATH)
 @patch("pycliarr.api.radarr.BaseCliMediaApi.add_item", return_value=TEST_JSON)
 def test_add_movie_withinfo(mock_add, mock_root, cli):
@@ -190,6 +262,14 @@ def test_add_movie_noparam(cli):
         cli.add_movie(quality=2)
 
 
+@patch("pycliarr.api.radarr.BaseCliMediaApi.add_item", return_value=TEST_JSON)
+def test_add_movie_projection(mock_add, cli):
+    info = RadarrMovieItem.projection(["id", "title"])(title="some movie")
+    with pytest.raises(RadarrCliError):
+        cli.add_movie(quality=2, movie_info=info)
+    mock_add.assert_not_called()
+
+
 @patch("pycliarr.api.radarr.BaseCliMediaApi.delete_item", return_value=TEST_JSON)
 def test_delete_movie(mock_base, cli):
     res = cli.delete_movie(1234)
@@ -204,6 +284,25 @@ def test_delete_movie_withoptions(mock_base, cli):
     assert res == TEST_JSON
 
 
+@patch("pycliarr.api.radarr.BaseCliMediaApi.request_delete", return_value={})
+def test_delete_movies(mock_base, cli):
+    report = cli.delete_movies([12, 13], delete_files=False, add_exclusion=True)
+    mock_base.assert_called_once_with(
+        cli.api_url_editor, json_data={"movieIds": [12, 13], "deleteFiles": False, "addImportExclusion": True}
+    )
+    assert len(report.done) == 2
+
+
+@patch("pycliarr.api.radarr.BaseCliMediaApi.request_put", return_value={})
+def test_edit_movies(mock_base, cli):
+    report = cli.edit_movies([12, 13], monitored=True, tags=[1], apply_tags="remove", minimum_availability="released")
+    mock_base.assert_called_once_with(
+        cli.api_url_editor,
+        json_data={"monitored": True, "tags": [1], "applyTags": "remove", "minimumAvailability": "released", "movieIds": [12, 13]},
+    )
+    assert len(report.done) == 2
+
+
 @patch("pycliarr.api.radarr.BaseCliMediaApi._sendCommand", return_value=TEST_JSON)
 def test_refresh_movies(mock_base, cli):
     res = cli.refresh_movie()
@@ -299,6 +398,22 @@ def test_get_queue_with_args(mock_get, cli):
     assert res == TEST_JSON
 
 
+@patch("pycliarr.api.radarr.BaseCliMediaApi.request_get")
+def test_iter_queue(mock_get, cli):
+    mock_get.return_value = {"totalRecords": 3, "records": [TEST_JSON] * 3}
+    res = list(cli.iter_queue(include_unknown=False))
+
+    data = {
+        "page": 1,
+        "pageSize": 100,
+        "sortKey": "progress",
+        "sortDirection": "ascending",
+        "includeUnknownMovieItems": False,
+    }
+    mock_get.assert_called_once_with(cli.api_url_queue, url_params=data)
+    assert res == [TEST_JSON] * 3
+
+
 @patch("pycliarr.api.radarr.BaseCliMediaApi.request_get", return_value=TEST_JSON)
 def test_get_language_profiles(mock_base, cli):
     res = cli.get_language_profiles()
@@ -306,6 +421,17 @@ def test_get_language_profiles(mock_base, cli):
     assert res == TEST_JSON
 
 
+@patch("pycliarr.api.radarr.RadarrCli.get_language_profiles", return_value=[{"id": 1, "name": "English"}])
+def test_resolve_language_profile(mock_profiles, cli):
+    assert cli.resolve_language_profile(2) == 2
+    mock_profiles.assert_not_called()
+    assert cli.resolve_language_profile("english") == 1
+    assert cli.resolve_language_profile("English") == 1
+    mock_profiles.assert_called_once()
+    with pytest.raises(CliArrError):
+        cli.resolve_language_profile("French")
+
+
 @patch("pycliarr.api.base_media.BaseCliApi.request_post", return_value=TEST_JSON)
 def test_renamefiles(mock_base, cli):
     res = cli.rename_files([1, 2, 3])
@@ -317,3 +443,29 @@ def test_renamefiles(mock_base, cli):
 def test_get_rename_movie(mock_base, cli):
     res = cli.get_rename(1234)
     mock_base.assert_called_with(cli.api_url_rename, url_params={"movieId": 1234})
+
+
+@patch("pycliarr.api.radarr.BaseCliMediaApi.request_put", return_value=TEST_JSON)
+def test_edit_movie_from_dict(mock_put, cli):
+    movie = RadarrMovieItem.from_dict({"title": "some movie", "id": 5, "monitored": False})
+    res = cli.edit_movie(movie)
+    mock_put.assert_called_once_with(cli.api_url_item, json_data=movie.to_dict(), url_params=None)
+    assert res == TEST_JSON
+
+
+@patch("pycliarr.api.radarr.BaseCliMediaApi.request_put", return_value=TEST_JSON)
+def test_edit_movie_unchanged(mock_put, cli):
+    movie = RadarrMovieItem.from_dict({"title": "some movie", "id": 1, "tags": [1], "genres": ["Drama"]})
+    assert movie.tags == [1] and movie.genres == ["Drama"]
+    res = cli.edit_movie(movie, skip_unchanged=True)
+    mock_put.assert_not_called()
+    assert res == movie.to_dict()
+
+    movie.monitored = False
+    cli.edit_movie(movie, skip_unchanged=True)
+    mock_put.assert_called_with(cli.api_url_item, json_data=movie.to_dict(), url_params=None)
+    assert not movie.is_dirty
+
+    mock_put.reset_mock()
+    cli.edit_movie(movie)
+    mock_put.assert_called_once()
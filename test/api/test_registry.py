@@ -0,0 +1,107 @@
+import pytest
+from unittest.mock import Mock, patch
+from pycliarr.api.registry import CachedRegistry, normalize_name, normalize_path
+from pycliarr.api.exceptions import CliArrError
+
+TEST_ENTRIES = [{"id": 1, "path": "/media/movies/", "name": "Movies"}, {"id": 3, "path": "/media/kids", "name": "Kids"}]
+
+
+def test_registry_lookup():
+    fetch = Mock(return_value=TEST_ENTRIES)
+    registry = CachedRegistry(fetch, {"id": None, "path": normalize_path, "name": normalize_name})
+    fetch.assert_not_called()
+
+    assert registry.get("id", 3) == TEST_ENTRIES[1]
+    assert registry.get("path", "/media/movies") == TEST_ENTRIES[0]
+    assert registry.get("path", "/media/kids/") == TEST_ENTRIES[1]
+    assert registry.get("name", "KIDS") == TEST_ENTRIES[1]
+    assert registry.get("id", 2) is None
+    assert registry.get("id", [1]) is None
+    assert registry.entries() == TEST_ENTRIES
+    fetch.assert_called_once()
+
+    assert registry.require("id", 1) == TEST_ENTRIES[0]
+    with pytest.raises(CliArrError):
+        registry.require("id", 2)
+    with pytest.raises(CliArrError):
+        registry.get("label", "a")
+
+
+def test_registry_refresh():
+    fetch = Mock(return_value=TEST_ENTRIES)
+    registry = CachedRegistry(fetch, {"id": None}, ttl=60)
+    assert registry.age == float("inf")
+    registry.get("id", 1)
+    registry.get("id", 1)
+    assert fetch.call_count == 1
+
+    registry.invalidate()
+    registry.get("id", 1)
+    assert fetch.call_count == 2
+
+    registry.ttl = 0
+    registry.get("id", 1)
+    assert fetch.call_count == 3
+    registry.ttl = 60
+
+    with patch("pycliarr.api.registry.time.time", return_value=registry._fetched + 61):
+        registry.get("id", 1)
+    assert fetch.call_count == 4
+
+    registry.ttl = -1
+    with patch("pycliarr.api.registry.time.time", return_value=registry._fetched + 10**6):
+        registry.get("id", 1)
+    assert fetch.call_count == 4
+
+
+def test_normalize():
+    assert normalize_path("/media/movies/") == "/media/movies"
+    assert normalize_path("/") == "/"
+    assert normalize_name("HD-1080p") == "hd-1080p"
+
+
+def test_registry_find():
+    fetch = Mock(return_value=TEST_ENTRIES)
+    registry = CachedRegistry(fetch, {"id": None, "name": normalize_name}, name="profile")
+    assert registry.find(3) == TEST_ENTRIES[1]
+    assert registry.find("3") == TEST_ENTRIES[1]
+    assert registry.find("movies") == TEST_ENTRIES[0]
+    assert registry.resolve(["Kids", 1, "MOVIES"]) == [3, 1, 1]
+    assert registry.resolve(["Kids"], key="path") == ["/media/kids"]
+    with pytest.raises(CliArrError, match="No profile matching 'Anime'"):
+        registry.find("Anime")
+    fetch.assert_called_once()
+
+
+def test_registry_refresh_on_miss():
+    entries = list(TEST_ENTRIES)
+    fetch = Mock(side_effect=lambda: list(entries))
+    registry = CachedRegistry(fetch, {"id": None, "name": normalize_name}, refresh_on_miss=True)
+    assert registry.get("id", 1) == TEST_ENTRIES[0]
+    assert fetch.call_count == 1
+
+    # Entry created since the last fetch
+    entries.append({"id": 4, "name": "Anime"})
+    assert registry.find("anime")["id"] == 4
+    assert fetch.call_count == 2
+    assert registry.get("id", 4)["name"] == "Anime"
+    assert fetch.call_count == 2
+
+    # A single refresh per lookup
+    assert registry.get("id", 5) is None
+    assert fetch.call_count == 3
+
+
+def test_registry_get_many_add():
+    fetch = Mock(return_value=TEST_ENTRIES)
+    registry = CachedRegistry(fetch, {"id": None, "name": normalize_name}, refresh_on_miss=True)
+    registry.add({"id": 7, "name": "Ignored"})
+    assert registry.get_many("name", ["kids", "anime", "movies"]) == [TEST_ENTRIES[1], None, TEST_ENTRIES[0]]
+    fetch.assert_called_once()
+
+    registry.add({"id": 4, "name": "Anime"})
+    assert registry.get_many("name", ["anime", "kids"]) == [{"id": 4, "name": "Anime"}, TEST_ENTRIES[1]]
+    fetch.assert_called_once()
+    assert registry.get_many("name", ["other", "another"]) == [None, None]
+    assert fetch.call_count == 2
+    assert len(TEST_ENTRIES) == 2
@@ -0,0 +1,91 @@
+import pytest
+from unittest.mock import patch
+from pycliarr.api.search import TitleSearchIndex, tokenize
+from pycliarr.api.radarr import RadarrCli
+from pycliarr.api.exceptions import CliArrError
+
+TEST_ITEMS = [
+    {"id": 1, "title": "The Matrix", "sortTitle": "matrix", "cleanTitle": "thematrix"},
+    {"id": 2, "title": "The Matrix Reloaded", "alternateTitles": [{"title": "Matrix 2"}]},
+    {"id": 3, "title": "Amélie", "alternateTitles": [{"title": "Le Fabuleux Destin d'Amélie Poulain"}]},
+    {"id": 4, "title": "The Thing"},
+]
+
+
+@pytest.fixture
+def index():
+    index = TitleSearchIndex()
+    assert index.update(TEST_ITEMS) == 4
+    return index
+
+
+def ids(results):
+    return [result.id for result in results]
+
+
+def test_tokenize():
+    assert tokenize("Le Fabuleux Destin d'Amélie") == ["le", "fabuleux", "destin", "d", "amelie"]
+
+
+def test_search(index):
+    assert ids(index.search("the matrix")) == [1, 2, 4]
+    assert ids(index.search("matrix reloaded")) == [2, 1]
+    assert ids(index.search("AMELIE")) == [3]
+    assert ids(index.search("fabuleux")) == [3]
+    assert ids(index.search("thematr")) == [1]
+    assert ids(index.search("matrx relaoded")) == [2, 1]
+    assert ids(index.search("the", limit=2)) == [1, 2]
+    assert index.search("zorro") == []
+    assert index.search("") == []
+
+
+def test_search_ranking(index):
+    results = index.search("matrix")
+    assert ids(results) == [1, 2]
+    assert results[0].score == results[1].score
+    # A title match ranks before an alternate title match
+    index.update([{"id": 5, "title": "Other", "alternateTitles": [{"title": "Thing"}]}])
+    assert ids(index.search("thing")) == [4, 5]
+    # Exact matches rank before prefix matches
+    assert ids(index.search("thing thin")) == [4, 5]
+    assert index.search("things")[0].score < index.search("thing")[0].score
+
+
+def test_update_remove(index):
+    assert index.update(TEST_ITEMS) == 0
+    assert index.update([{"id": 4, "title": "The Thing From Another World"}]) == 1
+    assert ids(index.search("world")) == [4]
+
+    assert index.sync(TEST_ITEMS[:2]) == (0, 2)
+    assert len(index) == 2
+    assert index.search("amelie") == []
+    assert index.search("world") == []
+    assert not index.remove(3)
+
+
+def test_save_load(index, tmp_path):
+    index.source = "http://example.com"
+    index.save(tmp_path / "search.json")
+    loaded = TitleSearchIndex.load(tmp_path / "search.json")
+    assert len(loaded) == 4
+    assert loaded.source == "http://example.com"
+    assert loaded.created == index.created
+    assert ids(loaded.search("matrx")) == ids(index.search("matrx"))
+    assert loaded.update(TEST_ITEMS) == 0
+
+    with pytest.raises(CliArrError):
+        TitleSearchIndex.load(tmp_path / "missing.json")
+
+
+@patch("pycliarr.api.radarr.RadarrCli.request_get", return_value=TEST_ITEMS)
+def test_refresh(mock_get):
+    cli = RadarrCli("http://example.com", "abcd1234")
+    index = TitleSearchIndex(created=0)
+    assert index.is_stale(60)
+    assert index.refresh(cli) == (4, 0)
+    mock_get.assert_called_with(cli.api_url_item)
+    assert not index.is_stale(60)
+    assert index.source == "http://example.com"
+
+    with pytest.raises(CliArrError):
+        index.refresh(RadarrCli("http://other.com", "abcd1234"))
@@ -0,0 +1,112 @@
+import pytest
+import time
+from pycliarr.api import snapshot as snapshot_module
+from pycliarr.api.radarr import RadarrMovieItem
+from pycliarr.api.sonarr import SonarrSerieItem
+from pycliarr.api.snapshot import LibrarySnapshot, SNAPSHOT_ITEMS, SNAPSHOT_TAGS, load_items, save_items
+from pycliarr.api.exceptions import CliArrError, CliDecodeError
+
+TEST_ITEMS = [{"id": 1, "title": "some movie"}, {"id": 2, "title": "other movie"}]
+
+
+def test_snapshot_get():
+    snapshot = LibrarySnapshot({SNAPSHOT_ITEMS: TEST_ITEMS})
+    assert snapshot.get(SNAPSHOT_ITEMS) == TEST_ITEMS
+    assert snapshot.get(SNAPSHOT_ITEMS, 2) == {"id": 2, "title": "other movie"}
+
+    with pytest.raises(CliArrError):
+        snapshot.get(SNAPSHOT_ITEMS, 3)
+    with pytest.raises(CliArrError):
+        snapshot.get(SNAPSHOT_TAGS)
+
+
+def test_snapshot_stale():
+    assert not LibrarySnapshot().is_stale(60)
+    snapshot = LibrarySnapshot(created=time.time() - 120)
+    assert snapshot.age >= 120
+    assert snapshot.is_stale(60)
+
+
+def test_snapshot_save_load(tmp_path):
+    path = tmp_path / "snapshot.json"
+    snapshot = LibrarySnapshot({SNAPSHOT_ITEMS: TEST_ITEMS}, source="http://example.com")
+    snapshot.save(path)
+
+    loaded = LibrarySnapshot.load(path)
+    assert loaded.get(SNAPSHOT_ITEMS) == TEST_ITEMS
+    assert loaded.created == snapshot.created
+    assert loaded.source == "http://example.com"
+
+
+def test_snapshot_load_error(tmp_path):
+    with pytest.raises(CliArrError):
+        LibrarySnapshot.load(tmp_path / "nofile.json")
+
+    path = tmp_path / "snapshot.json"
+    path.write_text('{"version": 0, "created": 0, "sections": {}}')
+    with pytest.raises(CliArrError):
+        LibrarySnapshot.load(path)
+
+
+@pytest.mark.parametrize("use_msgpack", [True, False])
+def test_items_save_load(tmp_path, use_msgpack):
+    if use_msgpack and snapshot_module.msgpack is None:
+        pytest.skip("msgpack not available")
+    movies = RadarrMovieItem.from_dicts(TEST_ITEMS + [{"id": 3, "images": [{"url": "a"}]}], lazy=True)
+    movies[0].add_attribute("extra", {"a": 1})
+    path = tmp_path / "movies.bin"
+    save_items(movies, path, use_msgpack=use_msgpack)
+
+    res = load_items(path)
+    assert [type(movie) for movie in res] == [RadarrMovieItem] * 3
+    assert [movie.to_dict() for movie in res] == [movie.to_dict() for movie in movies]
+    assert not res[0].is_dirty
+    assert res[0].extra == {"a": 1}
+
+    # Model changes are handled by matching field names
+    res = load_items(path, item_class=SonarrSerieItem)
+    assert res[2].id == 3
+    assert res[2].images == [{"url": "a"}]
+    assert res[2].seasons == []
+
+
+def test_items_save_load_projection(tmp_path):
+    movies = RadarrMovieItem.projection(["id", "title"]).from_dicts(TEST_ITEMS)
+    path = tmp_path / "movies.bin"
+    save_items(movies, path)
+
+    res = load_items(path)
+    assert type(res[0]) is type(movies[0])
+    assert [movie.to_dict() for movie in res] == TEST_ITEMS
+
+
+def test_items_save_load_empty(tmp_path):
+    path = tmp_path / "items.bin"
+    save_items([], path)
+    assert load_items(path) == []
+
+
+def test_items_save_errors(tmp_path):
+    with pytest.raises(CliArrError):
+        save_items([RadarrMovieItem(), SonarrSerieItem()], tmp_path / "items.bin")
+
+
+def test_items_load_errors(tmp_path):
+    path = tmp_path / "items.bin"
+    with pytest.raises(CliArrError):
+        load_items(path)
+
+    save_items([RadarrMovieItem()], path, use_msgpack=False)
+    data = path.read_bytes()
+    header = snapshot_module.ITEMS_HEADER
+    invalid = [
+        b"PYCLI",
+        b"NOTITEMS" + data[8:],
+        header.pack(snapshot_module.ITEMS_MAGIC, 99, snapshot_module.CODEC_PICKLE) + data[header.size :],
+        header.pack(snapshot_module.ITEMS_MAGIC, 1, 99) + data[header.size :],
+        data[: header.size] + b"garbage",
+    ]
+    for content in invalid:
+        path.write_bytes(content)
+        with pytest.raises(CliDecodeError):
+            load_items(path)
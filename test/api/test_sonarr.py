@@ -73,6 +73,27 @@ def test_get_serie_with_id(mock_base, cli):
     assert res[0].year == 2020
 
 
+@patch("pycliarr.api.sonarr.BaseCliMediaApi.get_item", return_value=TEST_SERIE)
+def test_get_serie_lazy(mock_base, cli):
+    res = cli.get_serie(1, lazy=True)
+    assert res.title == "some serie"
+    assert res.seasons == []
+
+
+@patch("pycliarr.api.sonarr.BaseCliMediaApi.get_item", return_value=TEST_SERIE)
+def test_get_serie_fields(mock_base, cli):
+    res = cli.get_serie(1, fields=["title", "tags"])
+    assert res.to_dict() == {"title": "some serie", "tags": []}
+    with pytest.raises(SonarrCliError):
+        cli.edit_serie(res)
+
+
+@patch("pycliarr.api.sonarr.BaseCliMediaApi.lookup_item", return_value=TEST_SERIE)
+def test_lookup_serie_fields(mock_base, cli):
+    res = cli.lookup_serie(tvdb_id=1234, fields=["year"])
+    assert res.to_dict() == {"year": 2020}
+
+
 @patch("pycliarr.api.sonarr.BaseCliMediaApi.lookup_item", return_value=[TEST_SERIE, TEST_SERIE])
 def test_lookup_serie_with_term(mock_base, cli):
     res = cli.lookup_serie(term="some title")
@@ -110,6 +131,20 @@ def test_lookup_serie_with_noparam(cli):
         cli.lookup_serie()
 
 
+@patch("pycliarr.api.sonarr.BaseCliMediaApi.get_root_folder", return_value=TEST_ROOT_PATH)
+@patch("pycliarr.api.sonarr.BaseCliMediaApi.request_get", return_value=[{"id": 7, "tvdbId": 11}])
+@patch("pycliarr.api.sonarr.BaseCliMediaApi.add_item", side_effect=lambda json_data: {"id": 100 + json_data["tvdbId"]})
+@patch("pycliarr.api.sonarr.SonarrCli.lookup_serie")
+def test_add_series(mock_lookup, mock_add, mock_get, mock_root, cli):
+    mock_lookup.side_effect = lambda tvdb_id: SonarrSerieItem(title=f"serie {tvdb_id}", tvdbId=tvdb_id, seasons=[])
+    report = cli.add_series([1, 11, 2, 2], quality=3)
+    assert [(res.key, res.status, res.item_id) for res in report] == [(1, "done", 101), (11, "skipped", 7), (2, "done", 102)]
+    assert report.ok
+    assert mock_lookup.call_count == 2
+    assert mock_add.call_args[1]["json_data"]["qualityProfileId"] == 3
+    mock_root.assert_called_once()
+
+
 @patch("pycliarr.api.sonarr.BaseCliMediaApi.get_root_folder", return_value=TEST_ROOT_PATH)
 @patch("pycliarr.api.sonarr.BaseCliMediaApi.request_get", return_value=new_serie_info())
 @patch("pycliarr.api.sonarr.BaseCliMediaApi.add_item", return_value=TEST_JSON)
@@ -213,6 +248,14 @@ def test_add_serie_noparam(cli):
         cli.add_serie(quality=2)
 
 
+@patch("pycliarr.api.sonarr.BaseCliMediaApi.add_item", return_value=TEST_JSON)
+def test_add_serie_projection(mock_add, cli):
+    info = SonarrSerieItem.projection(["id", "title"])(title="some serie")
+    with pytest.raises(SonarrCliError):
+        cli.add_serie(quality=2, serie_info=info)
+    mock_add.assert_not_called()
+
+
 @patch("pycliarr.api.sonarr.BaseCliMediaApi.delete_item", return_value=TEST_JSON)
 def test_delete_serie(mock_base, cli):
     res = cli.delete_serie(1234)
@@ -227,6 +270,25 @@ def test_delete_serie_withoptions(mock_base, cli):
     assert res == TEST_JSON
 
 
+@patch("pycliarr.api.sonarr.BaseCliMediaApi.request_delete", return_value={})
+def test_delete_series(mock_base, cli):
+    report = cli.delete_series([12, 13], delete_files=False, add_exclusion=True)
+    mock_base.assert_called_once_with(
+        cli.api_url_editor, json_data={"seriesIds": [12, 13], "deleteFiles": False, "addImportListExclusion": True}
+    )
+    assert len(report.done) == 2
+
+
+@patch("pycliarr.api.sonarr.BaseCliMediaApi.request_put", return_value={})
+def test_edit_series(mock_base, cli):
+    report = cli.edit_series([12, 13], monitored=True, tags=[1], apply_tags="remove", season_folder=False)
+    mock_base.assert_called_once_with(
+        cli.api_url_editor,
+        json_data={"monitored": True, "tags": [1], "applyTags": "remove", "seasonFolder": False, "seriesIds": [12, 13]},
+    )
+    assert len(report.done) == 2
+
+
 @patch("pycliarr.api.sonarr.BaseCliMediaApi._sendCommand", return_value=TEST_JSON)
 def test_refresh_series(mock_base, cli):
     res = cli.refresh_serie()
@@ -379,3 +441,28 @@ def test_renamefiles(mock_base, cli):
 def test_get_rename_serie(mock_base, cli):
     res = cli.get_rename(1234)
     mock_base.assert_called_with(cli.api_url_rename, url_params={"seriesId": 1234})
+
+
+@patch("pycliarr.api.sonarr.BaseCliMediaApi.request_put", return_value=TEST_JSON)
+def test_edit_serie_from_dict(mock_put, cli):
+    serie = SonarrSerieItem.from_dict({"title": "some serie", "id": 5, "monitored": False})
+    res = cli.edit_serie(serie)
+    mock_put.assert_called_once_with(cli.api_url_item, json_data=serie.to_dict(), url_params=None)
+    assert res == TEST_JSON
+
+
+@patch("pycliarr.api.sonarr.BaseCliMediaApi.request_put", return_value=TEST_JSON)
+def test_edit_serie_unchanged(mock_put, cli):
+    serie = SonarrSerieItem.from_dict({"title": "some serie", "id": 1})
+    res = cli.edit_serie(serie, skip_unchanged=True)
+    mock_put.assert_not_called()
+    assert res == serie.to_dict()
+
+    serie.monitored = False
+    cli.edit_serie(serie, skip_unchanged=True)
+    mock_put.assert_called_with(cli.api_url_item, json_data=serie.to_dict(), url_params=None)
+    assert not serie.is_dirty
+
+    mock_put.reset_mock()
+    cli.edit_serie(serie)
+    mock_put.assert_called_once()
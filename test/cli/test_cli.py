@@ -528,6 +528,62 @@ def test_cli_radarr_root_folders(monkeypatch, mock_exit):
     mock_exit.assert_called_with(0)
 
 
+def test_cli_radarr_index(monkeypatch, mock_exit, tmp_path):
+    test_args = [
+        "pycliarr",
+        "-t", TEST_HOST,
+        "-k", TEST_APIKEY,
+        "--index", str(tmp_path / "radarr.idx"),
+        "radarr",
+        "index",
+    ]
+    monkeypatch.setattr(sys, "argv", test_args)
+    mock_sonarr = Mock(return_value=[{"id": 1234, "title": "some movie"}])
+    monkeypatch.setattr("pycliarr.cli.cli_cmd.radarr.RadarrCli.request_get", mock_sonarr)
+    cli.main()
+    mock_sonarr.assert_called()
+    mock_exit.assert_called_with(0)
+    assert (tmp_path / "radarr.idx").exists()
+
+    test_args[-1:] = ["get", "--mid", "1234", "--offline", "--json"]
+    mock_sonarr.reset_mock()
+    cli.main()
+    mock_sonarr.assert_not_called()
+    mock_exit.assert_called_with(0)
+
+
+def test_cli_radarr_search(monkeypatch, mock_exit, tmp_path, capsys):
+    test_args = [
+        "pycliarr",
+        "-t", TEST_HOST,
+        "-k", TEST_APIKEY,
+        "radarr",
+        "search",
+        "-t", "matrx",
+    ]
+    monkeypatch.setattr(sys, "argv", test_args)
+    monkeypatch.setattr(
+        "pycliarr.cli.cli_cmd.CliSearchCommand.SEARCH_INDEX_DEFAULT", str(tmp_path / "pycliarr_{name}_search.json")
+    )
+    mock_sonarr = Mock(return_value=[{"id": 1234, "title": "The Matrix"}, {"id": 12, "title": "Alien"}])
+    monkeypatch.setattr("pycliarr.cli.cli_cmd.radarr.RadarrCli.request_get", mock_sonarr)
+    cli.main()
+    mock_sonarr.assert_called_once()
+    mock_exit.assert_called_with(0)
+    assert (tmp_path / "pycliarr_radarr_search.json").exists()
+    assert "1234: The Matrix" in capsys.readouterr().out
+
+    test_args.append("--json")
+    cli.main()
+    mock_sonarr.assert_called_once()
+    assert '"id": 1234' in capsys.readouterr().out
+
+    test_args.append("--refresh")
+    cli.main()
+    assert mock_sonarr.call_count == 2
+    mock_exit.assert_called_with(0)
+
+
 def test_cli_sonarr_tagitems_serie(monkeypatch, mock_exit):
     test_args = [
         "pycliarr",
@@ -727,6 +783,23 @@ def test_cli_radarr_get_json(monkeypatch, mock_exit):
     mock_sonarr.assert_called_with(1234)
     mock_exit.assert_called_with(0)
 
+def test_cli_radarr_get_json_list(monkeypatch, mock_exit, capsys):
+    test_args = [
+        "pycliarr",
+        "-t", TEST_HOST,
+        "-k", TEST_APIKEY,
+        "radarr",
+        "get",
+        "-j",
+    ]
+    monkeypatch.setattr(sys, "argv", test_args)
+    movies = [radarr.RadarrMovieItem(id=1), radarr.RadarrMovieItem(id=2)]
+    mock_sonarr = Mock(return_value = movies)
+    monkeypatch.setattr("pycliarr.cli.cli_cmd.radarr.RadarrCli.get_movie", mock_sonarr)
+    cli.main()
+    assert capsys.readouterr().out == f"[{movies[0].to_json()},{movies[1].to_json()}]\n"
+    mock_exit.assert_called_with(0)
+
 def test_cli_radarr_delete(monkeypatch, mock_exit):
     test_args = [
         "pycliarr",
@@ -763,6 +836,24 @@ def test_cli_radarr_edit(monkeypatch, mock_exit):
     mock_exit.assert_called_with(0)
 
 
+def test_cli_radarr_edit_list(monkeypatch, mock_exit):
+    item_json = f"[{radarr.RadarrMovieItem(id=1).to_json()}, {radarr.RadarrMovieItem(id=2).to_json()}]"
+    test_args = [
+        "pycliarr",
+        "-t", TEST_HOST,
+        "-k", TEST_APIKEY,
+        "radarr",
+        "edit",
+        "-j", item_json,
+    ]
+    monkeypatch.setattr(sys, "argv", test_args)
+    mock_sonarr = Mock(return_value = TEST_JSON)
+    monkeypatch.setattr("pycliarr.cli.cli_cmd.radarr.RadarrCli.edit_movie", mock_sonarr)
+    cli.main()
+    assert [call.args[0].id for call in mock_sonarr.call_args_list] == [1, 2]
+    mock_exit.assert_called_with(0)
+
+
 def test_cli_radarr_edit_file(monkeypatch, mock_exit):
     item_json = radarr.RadarrMovieItem().to_json()
     test_args = [
@@ -970,6 +1061,27 @@ def test_cli_radarr_add_root_path(monkeypatch, mock_exit):
     mock_exit.assert_called_with(0)
 
 
+def test_cli_radarr_add_quality_name(monkeypatch, mock_exit):
+    test_args = [
+        "pycliarr",
+        "-t", TEST_HOST,
+        "-k", TEST_APIKEY,
+        "radarr",
+        "add",
+        "--imdb", "tt1234",
+        "-q", "hd-1080p",
+    ]
+    monkeypatch.setattr(sys, "argv", test_args)
+    mock_sonarr = Mock()
+    mock_sonarr.return_value = TEST_JSON
+    monkeypatch.setattr("pycliarr.cli.cli_cmd.radarr.RadarrCli.add_movie", mock_sonarr)
+    mock_profiles = Mock(return_value=[{"id": 1, "name": "Any"}, {"id": 4, "name": "HD-1080p"}])
+    monkeypatch.setattr("pycliarr.cli.cli_cmd.radarr.RadarrCli.get_quality_profiles", mock_profiles)
+    cli.main()
+    mock_sonarr.assert_called_with(quality=4, tmdb_id=None, imdb_id="tt1234", movie_info=None, path=None, root_id=0)
+    mock_exit.assert_called_with(0)
+
+
 @patch('builtins.input', return_value="123")
 def test_cli_radarr_add_root_manual(mock_input, monkeypatch, mock_exit):
     test_args = [
@@ -1017,7 +1129,7 @@ def test_cli_radarr_add_root_manual_nok(mock_input, monkeypatch, mock_exit):
 @patch('builtins.input', return_value="1c")
 def test_select_profile_nok(mock_input):
     mock_cli = Mock()
-    mock_cli.get_quality_profiles.return_value = [{
+    mock_cli.quality_profile_registry.entries.return_value = [{
         'name': 'name',
         'id': '13',
         'items': [
@@ -1567,6 +1679,29 @@ def test_cli_sonarr_root_folders(monkeypatch, mock_exit):
     mock_exit.assert_called_with(0)
 
 
+def test_cli_sonarr_index(monkeypatch, mock_exit, tmp_path):
+    test_args = [
+        "pycliarr",
+        "-t", TEST_HOST,
+        "-k", TEST_APIKEY,
+        "--index", str(tmp_path / "sonarr.idx"),
+        "sonarr",
+        "index",
+    ]
+    monkeypatch.setattr(sys, "argv", test_args)
+    mock_sonarr = Mock(return_value=[{"id": 1234, "title": "some serie"}])
+    monkeypatch.setattr("pycliarr.cli.cli_cmd.sonarr.SonarrCli.request_get", mock_sonarr)
+    cli.main()
+    mock_sonarr.assert_called()
+    mock_exit.assert_called_with(0)
+
+    test_args[-1:] = ["get", "--sid", "1234", "--offline"]
+    mock_sonarr.reset_mock()
+    cli.main()
+    mock_sonarr.assert_not_called()
+    mock_exit.assert_called_with(0)
+
+
 def test_cli_sonarr_root_folders_json(monkeypatch, mock_exit):
     test_args = [
         "pycliarr",